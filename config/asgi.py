@@ -9,8 +9,21 @@ https://docs.djangoproject.com/en/4.2/howto/deployment/asgi/
 
 import os
 
+from django.conf import settings
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+# DynamicContent 생성/수정 시 렌더링 결과를 SSE, websocket으로 보냅니다. (DYNAMIC_CONTENTS_PUSH)
+from dynamic_contents.asgi import PushApplication  # noqa: E402
+from dynamic_contents.models import get_dynamic_content_models  # noqa: E402
+
+
+def authorize(scope, channels):
+    # 개발용 프로젝트이므로 DEBUG일 때만 모델 label 채널 구독을 허용합니다. 실제 서비스에서는 연결한 사용자를 확인해야 합니다.
+    return settings.DEBUG and set(channels) <= {model._meta.label for model in get_dynamic_content_models()}
+
+
+application = PushApplication(django_application, authorize=authorize)
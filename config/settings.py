@@ -50,6 +50,7 @@ INSTALLED_APPS = [
     'django_filters',
     'rosetta',
     'dynamic_contents',
+    'loadtest',
 ]
 
 MIDDLEWARE = [
@@ -156,6 +157,7 @@ MODELTRANSLATION_DEFAULT_LANGUAGE = 'en'
 
 MIGRATION_MODULES = {
     'dynamic_contents': 'migrations.dynamic_contents',
+    'loadtest': 'migrations.loadtest',
 }
 
 # ROSETTA
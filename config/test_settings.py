@@ -0,0 +1,22 @@
+# App
+from .settings import *  # noqa: F401,F403
+
+# 테스트 DB는 migration 없이 모델에서 바로 만들고, router 테스트를 위해 replica DB를 하나 더 둡니다.
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': os.path.join(BASE_DIR, 'db.sqlite3'),  # noqa: F405
+    },
+    'replica': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': os.path.join(BASE_DIR, 'replica.sqlite3'),  # noqa: F405
+    },
+}
+
+# dynamic_contents.tests.models 의 테스트용 모델을 등록합니다.
+INSTALLED_APPS = INSTALLED_APPS + ['dynamic_contents.tests']  # noqa: F405
+
+MIGRATION_MODULES = {
+    'dynamic_contents': None,
+    'loadtest': None,
+}
@@ -0,0 +1,28 @@
+# Python
+import os
+
+# Django
+import django
+import pytest
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.test_settings')
+
+
+def pytest_configure(config):
+    django.setup()
+
+
+@pytest.fixture(scope='session', autouse=True)
+def django_test_databases():
+    # manage.py test 와 같은 방식으로 테스트 DB를 만들고 지웁니다.
+    from django.test.utils import setup_test_environment, teardown_test_environment
+    from django.test.runner import DiscoverRunner
+
+    runner = DiscoverRunner(verbosity=0, interactive=False)
+    setup_test_environment()
+    old_config = runner.setup_databases()
+    try:
+        yield
+    finally:
+        runner.teardown_databases(old_config)
+        teardown_test_environment()
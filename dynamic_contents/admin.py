@@ -7,7 +7,7 @@ from django.utils.safestring import mark_safe
 from modeltranslation.admin import TranslationAdmin
 
 # App
-from .models import Format, Part
+from .models import ArchivedDynamicContent, Format, Part
 
 
 # Main Section
@@ -15,19 +15,21 @@ class FormatAdmin(admin.ModelAdmin):
     # 기본 list_display 설정
     list_display = ('id', 'type', 'subtype', 'content', 'created_at', 'updated_at')
 
-    def __init__(self, model, admin_site):
-        super().__init__(model, admin_site)
+    translated_fields = None
+
+    def get_list_display(self, request):
         # modeltranslation으로 생성된 번역 필드를 가져와서 list_display에 추가
-        translated_fields = self.get_translated_fields()
-        self.list_display = self.list_display + translated_fields
+        return tuple(super().get_list_display(request)) + self.get_translated_fields()
 
     def get_translated_fields(self):
-        # 모델의 모든 필드를 순회하면서 번역 필드 확인
-        translated_fields = []
-        for field in self.model._meta.get_fields():
-            if self.is_translated_field(field.name):
-                translated_fields.append(field.name)
-        return tuple(translated_fields)
+        # 모델의 모든 필드를 순회하면서 번역 필드 확인. 처음 호출될 때 한 번만 계산합니다.
+        if self.translated_fields is None:
+            translated_fields = []
+            for field in self.model._meta.get_fields():
+                if self.is_translated_field(field.name):
+                    translated_fields.append(field.name)
+            self.translated_fields = tuple(translated_fields)
+        return self.translated_fields
 
     def is_translated_field(self, field_name):
         # 원래 필드명으로부터 생성된 번역 필드인지 확인
@@ -39,6 +41,16 @@ class PartAdmin(admin.ModelAdmin):
     search_fields = ('field', 'content', 'instance_id')
 
 
+class ArchivedDynamicContentAdmin(admin.ModelAdmin):
+    list_display = ('id', 'model_label', 'object_id', 'text_content', 'created_at', 'archived_at')
+    list_filter = ('model_label',)
+    search_fields = ('object_id',)
+
+    def text_content(self, obj):
+        return obj.get_text()
+    text_content.short_description = 'Text Content'
+
+
 class PartInline(admin.TabularInline):
     model = Part
     extra = 1  # 기본적으로 보여줄 빈 인라인 폼의 수
@@ -80,3 +92,4 @@ class DynamicContentAdminMixin(admin.ModelAdmin):
 
 admin.site.register(Format, FormatAdmin)
 admin.site.register(Part, PartAdmin)
+admin.site.register(ArchivedDynamicContent, ArchivedDynamicContentAdmin)
@@ -4,3 +4,10 @@ from django.apps import AppConfig
 class DynamicContentAppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'dynamic_contents'
+
+    def ready(self):
+        from .settings import PUSH
+
+        if PUSH:
+            from .push import connect_push_signals
+            connect_push_signals()
@@ -0,0 +1,141 @@
+# Python
+import json
+from collections import defaultdict
+from datetime import timedelta
+
+# Django
+from django.core.exceptions import FieldDoesNotExist
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.utils import timezone, translation
+
+# App
+from .audit import get_parts_through
+from .deletion import delete_dynamic_contents
+from .models import ArchivedDynamicContent
+from .routers import get_queryset_write_database
+from .settings import ARCHIVE_AFTER_DAYS, ARCHIVE_DATE_FIELD, LANGUAGES
+from .utils import generate_html, generate_i18n, generate_text
+
+
+def get_translated_values(instance, field_name, languages):
+    values = {}
+    for language in languages:
+        value = getattr(instance, f"{field_name}_{language.replace('-', '_')}", None)
+        if value:
+            values[language] = value
+    if not values and getattr(instance, field_name, None):
+        values[languages[0] if languages else ''] = getattr(instance, field_name)
+    return values
+
+
+def serialize_format(format, languages):
+    if format is None:
+        return None
+    return {
+        'id': format.id,
+        'type': format.type,
+        'subtype': format.subtype,
+        'content': get_translated_values(format, 'content', languages),
+    }
+
+
+def serialize_part(part, languages):
+    return {
+        'id': part.id,
+        'field': part.field,
+        'content': get_translated_values(part, 'content', languages),
+        'link': part.link,
+        'instance_id': part.instance_id,
+    }
+
+
+def build_archived_content(dynamic_content, parts, languages, date_field):
+    rendered = {}
+    for language in languages:
+        with translation.override(language):
+            rendered[language] = {
+                'text': generate_text(dynamic_content.format, parts),
+                'i18n': generate_i18n(dynamic_content.format, parts),
+                'html': str(generate_html(dynamic_content.format, parts)),
+            }
+
+    return ArchivedDynamicContent(
+        model_label=dynamic_content._meta.label,
+        object_id=str(dynamic_content.pk),
+        format_data=json.dumps(serialize_format(dynamic_content.format, languages), cls=DjangoJSONEncoder),
+        parts_data=json.dumps([serialize_part(part, languages) for part in parts], cls=DjangoJSONEncoder),
+        rendered=json.dumps(rendered, cls=DjangoJSONEncoder, ensure_ascii=False),
+        missing_placeholders=json.dumps(dynamic_content.get_missing_placeholders(parts), cls=DjangoJSONEncoder),
+        created_at=getattr(dynamic_content, date_field, None),
+    )
+
+
+def get_archive_queryset(queryset, days=None, date_field=None):
+    """
+    보관 대상(date_field 값이 days일보다 오래된) 행만 남긴 queryset을 반환합니다.
+    """
+    days = ARCHIVE_AFTER_DAYS if days is None else days
+    date_field = date_field or ARCHIVE_DATE_FIELD
+    try:
+        queryset.model._meta.get_field(date_field)
+    except FieldDoesNotExist:
+        raise ValueError(f'{queryset.model._meta.label} has no "{date_field}" field to archive by.')
+    return queryset.filter(**{f'{date_field}__lt': timezone.now() - timedelta(days=days)})
+
+
+def archive_dynamic_contents(queryset, days=None, date_field=None, batch_size=500, languages=None):
+    """
+    오래된 DynamicContent를 ArchivedDynamicContent로 옮기고 원본 행, 중간 테이블 행,
+    고아가 된 Part를 삭제합니다.
+
+    batch마다 DynamicContent와 Part를 한 번씩 조회하고, 언어별 text/i18n/html을 렌더링하여
+    bulk_create 한 뒤 같은 트랜잭션에서 원본을 삭제합니다.
+
+    :return: 보관된 행 수
+    """
+    date_field = date_field or ARCHIVE_DATE_FIELD
+    languages = languages or [code for code, name in LANGUAGES or []]
+    model = queryset.model
+    through, source, target = get_parts_through(model)
+    # self.parts.all()과 같은 순서로 렌더링되도록 Part의 기본 정렬을 따릅니다.
+    part_ordering = [
+        ('-' if ordering.startswith('-') else '') + f"{target}__{ordering.lstrip('-')}"
+        for ordering in model._meta.get_field('parts').related_model._meta.ordering
+    ]
+
+    # 보관 후 원본을 삭제하므로 조회, 보관, 삭제 모두 쓰기 DB에서 수행합니다.
+    using = get_queryset_write_database(queryset)
+    queryset = get_archive_queryset(queryset.using(using), days, date_field).select_related('format').order_by('pk')
+
+    archived = 0
+    last_pk = None
+    while True:
+        chunk = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+        dynamic_contents = list(chunk[:batch_size])
+        if not dynamic_contents:
+            break
+        last_pk = dynamic_contents[-1].pk
+        pks = [dynamic_content.pk for dynamic_content in dynamic_contents]
+
+        parts = defaultdict(list)
+        links = (
+            through._base_manager.using(using)
+            .filter(**{f'{source}__in': pks})
+            .select_related(target)
+            .order_by(*part_ordering)
+        )
+        for link in links:
+            parts[getattr(link, f'{source}_id')].append(getattr(link, target))
+
+        archived_contents = [
+            build_archived_content(dynamic_content, parts[dynamic_content.pk], languages, date_field)
+            for dynamic_content in dynamic_contents
+        ]
+
+        with transaction.atomic(using=using):
+            ArchivedDynamicContent.objects.using(using).bulk_create(archived_contents, batch_size=batch_size)
+            delete_dynamic_contents(model._base_manager.using(using).filter(pk__in=pks), batch_size=batch_size)
+        archived += len(pks)
+
+    return archived
@@ -0,0 +1,130 @@
+# Python
+import asyncio
+import inspect
+from urllib.parse import parse_qs
+
+# App
+from .push import get_broker, get_language_channel, get_push_languages
+from .settings import PUSH, PUSH_PATH, DEFAULT_LANGUAGE
+
+
+async def wait_for_disconnect(receive, disconnect_type):
+    while True:
+        message = await receive()
+        if message['type'] == disconnect_type:
+            return
+
+
+class PushApplication:
+    """
+    Django ASGI 애플리케이션을 감싸서 DYNAMIC_CONTENTS_PUSH_PATH 경로의 연결로 렌더링된 DynamicContent를 보냅니다.
+
+    HTTP GET은 server-sent events, websocket은 text 메시지로 전달하며, 구독할 채널과 언어는
+    ?channel=<채널>&channel=...&language=<언어> 로 지정합니다. 모든 채널은 authorize(scope, channels) 함수가
+    True를 반환해야 구독할 수 있으며, authorize가 없으면 모든 구독을 거부합니다. authorize는 async 함수여도 됩니다.
+    """
+    keepalive_seconds = 15
+
+    def __init__(self, application, path=PUSH_PATH, authorize=None):
+        self.application = application
+        self.path = path
+        self.authorize = authorize
+
+    async def __call__(self, scope, receive, send):
+        if PUSH and scope['type'] in ('http', 'websocket') and scope['path'] == self.path:
+            if scope['type'] == 'http':
+                return await self.handle_sse(scope, receive, send)
+            return await self.handle_websocket(scope, receive, send)
+        return await self.application(scope, receive, send)
+
+    def get_params(self, scope):
+        query = parse_qs(scope.get('query_string', b'').decode('latin-1'))
+        channels = query.get('channel', [])
+        languages = get_push_languages()
+        language = query.get('language', [DEFAULT_LANGUAGE or languages[0]])[0]
+        if not channels or language not in languages:
+            return None, None
+        return channels, language
+
+    async def is_authorized(self, scope, channels):
+        if self.authorize is None:
+            return False
+        result = self.authorize(scope, channels)
+        if inspect.isawaitable(result):
+            result = await result
+        return bool(result)
+
+    async def stream(self, subscription, receive, disconnect_type, send_message, send_keepalive):
+        disconnect = asyncio.ensure_future(wait_for_disconnect(receive, disconnect_type))
+        try:
+            while True:
+                message = asyncio.ensure_future(subscription.get())
+                done, pending = await asyncio.wait(
+                    {message, disconnect}, timeout=self.keepalive_seconds, return_when=asyncio.FIRST_COMPLETED
+                )
+                if message in done:
+                    await send_message(message.result())
+                    continue
+                message.cancel()
+                if disconnect in done:
+                    return
+                await send_keepalive()
+        finally:
+            disconnect.cancel()
+            subscription.close()
+
+    async def handle_sse(self, scope, receive, send):
+        channels, language = self.get_params(scope)
+        if scope['method'] != 'GET':
+            return await self.send_http_error(send, 405, b'Method not allowed')
+        if channels is None:
+            return await self.send_http_error(send, 400, b'channel and a supported language are required')
+        if not await self.is_authorized(scope, channels):
+            return await self.send_http_error(send, 403, b'Forbidden')
+
+        subscription = get_broker().subscribe([get_language_channel(channel, language) for channel in channels])
+        await send({
+            'type': 'http.response.start',
+            'status': 200,
+            'headers': [
+                (b'content-type', b'text/event-stream; charset=utf-8'),
+                (b'cache-control', b'no-cache'),
+                (b'x-accel-buffering', b'no'),
+            ],
+        })
+
+        async def send_message(message):
+            # 메시지는 줄바꿈 없는 JSON 이므로 data 한 줄로 보냅니다.
+            await send({'type': 'http.response.body', 'body': f'data: {message}\n\n'.encode('utf-8'), 'more_body': True})
+
+        async def send_keepalive():
+            await send({'type': 'http.response.body', 'body': b': keepalive\n\n', 'more_body': True})
+
+        await self.stream(subscription, receive, 'http.disconnect', send_message, send_keepalive)
+
+    async def handle_websocket(self, scope, receive, send):
+        message = await receive()
+        if message['type'] != 'websocket.connect':
+            return
+
+        channels, language = self.get_params(scope)
+        if channels is None:
+            return await send({'type': 'websocket.close', 'code': 4400})
+        if not await self.is_authorized(scope, channels):
+            return await send({'type': 'websocket.close', 'code': 4403})
+
+        subscription = get_broker().subscribe([get_language_channel(channel, language) for channel in channels])
+        await send({'type': 'websocket.accept'})
+
+        async def send_message(message):
+            await send({'type': 'websocket.send', 'text': message})
+
+        async def send_keepalive():
+            pass
+
+        await self.stream(subscription, receive, 'websocket.disconnect', send_message, send_keepalive)
+
+    @staticmethod
+    async def send_http_error(send, status, body):
+        await send({'type': 'http.response.start', 'status': status, 'headers': [(b'content-type', b'text/plain')]})
+        await send({'type': 'http.response.body', 'body': body})
@@ -0,0 +1,157 @@
+# Python
+import json
+from collections import defaultdict
+
+# Django
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Case, Count, F, IntegerField, OuterRef, Q, Subquery, Sum, Value, When
+from django.db.models.functions import Coalesce, Concat, Length, Replace, StrIndex
+
+# App
+from .routers import get_queryset_write_database
+
+
+def get_parts_through(model):
+    """
+    DynamicContentModelMixin 모델의 parts M2M 중간 테이블과 양쪽 FK 이름을 반환합니다.
+    """
+    field = model._meta.get_field('parts')
+    return field.remote_field.through, field.m2m_field_name(), field.m2m_reverse_field_name()
+
+
+def count_csv_items(expression):
+    # 'a,b,c' 처럼 쉼표로 구분된 문자열의 항목 수를 SQL로 계산합니다.
+    return Length(expression) - Length(Replace(expression, Value(','), Value(''))) + 1
+
+
+def annotate_missing_placeholders(queryset):
+    """
+    각 행에 placeholder_count, matched_placeholder_count, missing_placeholder_count,
+    stored_missing_count 를 annotate 합니다. 모든 계산은 DB에서 수행됩니다.
+
+    matched_placeholder_count는 Format의 placeholders 중 연결된 Part의 field로 채워진 개수이고,
+    stored_missing_count는 missing_placeholders 컬럼에 저장된 JSON 목록의 항목 수입니다.
+    항목 수만 계산하므로 ["user"]와 ["post"]처럼 개수가 같은 목록은 구분하지 않습니다.
+    """
+    through, source, target = get_parts_through(queryset.model)
+
+    matched = (
+        through.objects
+        .filter(**{source: OuterRef('pk')})
+        .exclude(**{f'{target}__field__isnull': True})
+        .exclude(**{f'{target}__field': ''})
+        .annotate(
+            dc_needle=Concat(Value(','), F(f'{target}__field'), Value(',')),
+            dc_haystack=Concat(Value(','), OuterRef('format___placeholders'), Value(',')),
+        )
+        .annotate(dc_position=StrIndex('dc_haystack', 'dc_needle'))
+        .filter(dc_position__gt=0)
+        .values(source)
+        .annotate(count=Count(f'{target}__field', distinct=True))
+        .values('count')
+    )
+
+    no_placeholders = Q(format___placeholders__isnull=True) | Q(format___placeholders='')
+    # 저장된 값은 ["a", "b"] 형태이므로 따옴표 수의 절반이 항목 수입니다.
+    stored = F('missing_placeholders')
+    stored_count = (Length(stored) - Length(Replace(stored, Value('"'), Value('')))) / 2
+
+    return queryset.annotate(
+        placeholder_count=Case(
+            When(no_placeholders, then=Value(0)),
+            default=count_csv_items(F('format___placeholders')),
+            output_field=IntegerField(),
+        ),
+        matched_placeholder_count=Coalesce(Subquery(matched, output_field=IntegerField()), Value(0)),
+    ).annotate(
+        missing_placeholder_count=F('placeholder_count') - F('matched_placeholder_count'),
+        stored_missing_count=Case(
+            When(missing_placeholders__isnull=True, then=Value(None)),
+            default=stored_count,
+            output_field=IntegerField(),
+        ),
+    )
+
+
+def missing_placeholder_report(queryset):
+    """
+    Format별 전체 행 수, placeholder가 누락된 행 수, 누락된 placeholder 총합,
+    저장된 missing_placeholders 항목 수가 다시 계산한 누락 수와 다른(count_mismatch) 행 수를 DB에서 집계합니다.
+
+    count_mismatch는 항목 수만 비교하므로 오래된 값의 하한입니다. 항목까지 비교한 정확한 수는
+    repair_missing_placeholders(dry_run=True)의 repaired 값입니다.
+    """
+    incomplete = Case(When(missing_placeholder_count__gt=0, then=Value(1)), default=Value(0))
+    count_mismatch = Case(
+        When(stored_missing_count__isnull=True, then=Value(1)),
+        When(~Q(stored_missing_count=F('missing_placeholder_count')), then=Value(1)),
+        default=Value(0),
+    )
+    return (
+        annotate_missing_placeholders(queryset)
+        .order_by()
+        .values('format', 'format__type', 'format__subtype')
+        .annotate(
+            total=Count('pk'),
+            incomplete=Sum(incomplete, output_field=IntegerField()),
+            missing=Sum('missing_placeholder_count'),
+            count_mismatch=Sum(count_mismatch, output_field=IntegerField()),
+        )
+        .order_by('format')
+    )
+
+
+def is_stale(stored, missing):
+    if stored is None:
+        return True
+    try:
+        return set(json.loads(stored)) != set(missing)
+    except (TypeError, ValueError):
+        return True
+
+
+def repair_missing_placeholders(queryset, chunk_size=1000, dry_run=False):
+    """
+    missing_placeholders 값을 pk 순서대로 chunk 단위로 다시 계산하고, 값이 달라진 행만 갱신합니다.
+
+    chunk마다 행 정보와 M2M 중간 테이블을 한 번씩 조회하며 모델 객체는 만들지 않습니다.
+    갱신은 같은 값을 가지는 행끼리 묶어 UPDATE 한 번으로 처리합니다.
+
+    :return: checked, repaired 개수를 담은 dict
+    """
+    model = queryset.model
+    through, source, target = get_parts_through(model)
+    # replica의 오래된 값으로 덮어쓰지 않도록 조회와 갱신 모두 쓰기 DB에서 수행합니다.
+    using = get_queryset_write_database(queryset)
+    base = queryset.using(using).order_by('pk')
+
+    checked = repaired = 0
+    last_pk = None
+    while True:
+        chunk = base if last_pk is None else base.filter(pk__gt=last_pk)
+        rows = list(chunk.values_list('pk', 'format', 'format___placeholders', 'missing_placeholders')[:chunk_size])
+        if not rows:
+            break
+        last_pk = rows[-1][0]
+        checked += len(rows)
+
+        fields = defaultdict(set)
+        links = through._base_manager.using(using).filter(**{f'{source}__in': [row[0] for row in rows]})
+        for content_id, field in links.values_list(source, f'{target}__field'):
+            fields[content_id].add(field)
+
+        updates = defaultdict(list)
+        for pk, format_id, placeholders, stored in rows:
+            if format_id and placeholders:
+                missing = [placeholder for placeholder in placeholders.split(',') if placeholder not in fields[pk]]
+            else:
+                missing = []
+            if is_stale(stored, missing):
+                updates[json.dumps(missing, cls=DjangoJSONEncoder)].append(pk)
+
+        for value, pks in updates.items():
+            repaired += len(pks)
+            if not dry_run:
+                model._base_manager.using(using).filter(pk__in=pks).update(missing_placeholders=value)
+
+    return {'checked': checked, 'repaired': repaired}
@@ -0,0 +1,153 @@
+# Python
+import hashlib
+import json
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+# Django
+from django.conf import settings
+from django.db.models import Max
+from django.utils import timezone, translation
+
+# App
+from .engine import get_template_engine
+from .models import Format
+from .settings import LANGUAGES, DEFAULT_LANGUAGE
+from .utils import tokenize_content
+
+# Variables
+BUNDLE_SCHEMA = 3
+EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+
+
+def datetime_to_version(value):
+    """
+    updated_at 값을 번들 버전(epoch 기준 마이크로초 정수)으로 변환합니다.
+    """
+    if value is None:
+        return 0
+    if timezone.is_naive(value):
+        value = value.replace(tzinfo=dt_timezone.utc)
+    delta = value - EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds
+
+
+def version_to_datetime(version):
+    """
+    번들 버전을 updated_at 비교에 사용할 datetime으로 되돌립니다.
+    """
+    value = EPOCH + timedelta(microseconds=version)
+    if not settings.USE_TZ:
+        return value.replace(tzinfo=None)
+    return value
+
+
+def format_version(timestamp, fingerprint):
+    """
+    Format 변경 시각과 렌더링 설정 fingerprint를 합쳐 번들 버전 문자열을 만듭니다.
+    """
+    return f'{timestamp}-{fingerprint}'
+
+
+def parse_version(version):
+    """
+    번들 버전을 (변경 시각, fingerprint)로 나눕니다.
+    fingerprint가 없는 이전 형식의 정수 버전은 빈 fingerprint로 취급합니다.
+    """
+    timestamp, _, fingerprint = str(version).partition('-')
+    if not timestamp.isdigit():
+        raise ValueError("since must be a bundle version")
+    return int(timestamp), fingerprint
+
+
+def get_bundle_languages():
+    return [code for code, name in LANGUAGES or []]
+
+
+def hash_content(content):
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()[:16]
+
+
+def build_format_entry(format, languages):
+    """
+    하나의 Format을 언어별 템플릿, 토큰, placeholder 목록, 해시로 직렬화합니다.
+    번역이 비어 있는 언어는 생략되며, 클라이언트는 번들의 fallback 언어를 사용합니다.
+    """
+    engine = get_template_engine()
+    entry_languages = {}
+    for language in languages:
+        content = getattr(format, f"content_{language.replace('-', '_')}", None)
+        if not content:
+            continue
+
+        tokens = tokenize_content(content)
+        entry_languages[language] = {
+            'content': content,
+            'hash': hash_content(content),
+            'tokens': tokens,
+            'placeholders': engine.get_placeholders(content),
+        }
+
+    return {
+        'id': format.id,
+        'type': format.type,
+        'subtype': format.subtype,
+        'languages': entry_languages,
+    }
+
+
+def build_list_joiners(languages):
+    """
+    클라이언트가 여러 part를 이어 붙일 때 사용할 언어별 (구분자, 마지막 구분자)를 반환합니다.
+    """
+    engine = get_template_engine()
+    joiners = {}
+    for language in languages:
+        with translation.override(language):
+            joiners[language] = [str(joiner) for joiner in engine.get_list_joiners(language)]
+    return joiners
+
+
+def build_bundle_fingerprint(joiners):
+    """
+    템플릿 엔진과 목록 구분자가 바뀌면 달라지는 짧은 해시를 반환합니다.
+    """
+    engine = type(get_template_engine())
+    payload = json.dumps({
+        'engine': f'{engine.__module__}.{engine.__qualname__}',
+        'joiners': joiners,
+    }, sort_keys=True)
+    return hash_content(payload)[:8]
+
+
+def build_format_bundle(since=None, languages=None):
+    """
+    모든 Format을 클라이언트 렌더링용 번들로 내보냅니다.
+
+    :param since: 이전에 받은 번들의 version. 지정하면 그 이후 변경된 Format만 포함합니다.
+        엔진이나 목록 구분자가 바뀌어 fingerprint가 다르면 전체 번들을 돌려주고 since는 None이 됩니다.
+    :param languages: 포함할 언어 코드 목록. 기본값은 settings.LANGUAGES 입니다.
+    :return: JSON으로 직렬화 가능한 dict
+    """
+    languages = languages or get_bundle_languages()
+    queryset = Format.objects.order_by('id')
+    joiners = build_list_joiners(languages)
+    fingerprint = build_bundle_fingerprint(joiners)
+
+    timestamp = datetime_to_version(queryset.aggregate(version=Max('updated_at'))['version'])
+    if since is not None:
+        since_timestamp, since_fingerprint = parse_version(since)
+        if since_fingerprint == fingerprint:
+            queryset = queryset.filter(updated_at__gt=version_to_datetime(since_timestamp))
+        else:
+            since = None
+
+    return {
+        'schema': BUNDLE_SCHEMA,
+        'version': format_version(timestamp, fingerprint),
+        'since': since,
+        'fallback': DEFAULT_LANGUAGE or (languages[0] if languages else None),
+        'joiners': joiners,
+        # 델타 다운로드 시 삭제된 Format을 정리할 수 있도록 현재 존재하는 id 목록을 함께 보냅니다.
+        'ids': list(Format.objects.order_by('id').values_list('id', flat=True)) if since is not None else None,
+        'formats': [build_format_entry(format, languages) for format in queryset.iterator()],
+    }
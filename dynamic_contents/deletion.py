@@ -0,0 +1,116 @@
+# Python
+from collections import Counter
+
+# Django
+from django.db import models, transaction
+from django.db.models import Exists, OuterRef, signals
+from django.db.models.deletion import Collector, get_candidate_relations_to_delete
+
+# App
+from .audit import get_parts_through
+from .routers import get_queryset_write_database
+
+
+def get_part_links(part_model):
+    """
+    Part를 가리키는 모든 M2M 관계의 (중간 테이블, Part FK 이름) 목록을 반환합니다.
+    """
+    links = []
+    for relation in part_model._meta.related_objects:
+        if relation.many_to_many:
+            links.append((relation.through, relation.field.m2m_reverse_field_name()))
+    return links
+
+
+def can_raw_delete(queryset, handled_models=()):
+    """
+    Django Collector 없이 DELETE 문 하나로 지워도 되는 queryset인지 확인합니다.
+    Collector.can_fast_delete()와 같이 delete 시그널, 다중 테이블 상속 부모, GenericRelation,
+    DO_NOTHING이 아닌 참조 관계가 없어야 하며, handled_models에서 오는 참조는 호출하는 쪽에서 먼저 삭제하므로 무시합니다.
+    """
+    if Collector(using=queryset.db).can_fast_delete(queryset):
+        return True
+    if not handled_models:
+        return False
+
+    model = queryset.model
+    opts = model._meta
+    if signals.pre_delete.has_listeners(model) or signals.post_delete.has_listeners(model):
+        return False
+    if opts.concrete_model._meta.parents or any(hasattr(field, 'bulk_related_objects') for field in opts.private_fields):
+        return False
+    return all(
+        relation.related_model in handled_models or relation.on_delete is models.DO_NOTHING
+        for relation in get_candidate_relations_to_delete(opts)
+    )
+
+
+def delete_queryset(queryset, handled_models=()):
+    if can_raw_delete(queryset, handled_models):
+        count = queryset._raw_delete(queryset.db)
+        return count, {queryset.model._meta.label: count} if count else {}
+    return queryset.delete()
+
+
+def get_orphan_parts(queryset):
+    """
+    어떤 DynamicContent에도 연결되지 않은 Part만 남긴 queryset을 반환합니다.
+    """
+    for through, target in get_part_links(queryset.model):
+        queryset = queryset.filter(~Exists(through._base_manager.filter(**{target: OuterRef('pk')})))
+    return queryset
+
+
+def delete_orphan_parts(part_model, part_ids, using):
+    """
+    주어진 Part 중 다른 DynamicContent에서 참조하지 않는 Part만 삭제합니다.
+    """
+    if not part_ids:
+        return 0, {}
+    orphans = get_orphan_parts(part_model._base_manager.using(using).filter(pk__in=part_ids))
+    # 고아 Part는 중간 테이블 행이 없으므로 M2M 관계는 따로 정리할 필요가 없습니다.
+    return delete_queryset(orphans, {through for through, target in get_part_links(part_model)})
+
+
+def delete_dynamic_contents(queryset, batch_size=1000):
+    """
+    DynamicContent 행과 parts 중간 테이블 행, 그리고 더 이상 참조되지 않는 Part를 삭제합니다.
+
+    pk 순서대로 batch_size개씩 처리하며, batch마다 연결된 Part id 조회, 중간 테이블 행 삭제,
+    DynamicContent 삭제, 고아 Part 삭제를 하나의 트랜잭션에서 수행합니다.
+    delete 시그널이나 다른 참조 관계가 없으면 각 단계는 DELETE 문 하나로 처리되고,
+    있으면 Django Collector를 사용합니다. 다른 DynamicContent와 공유되는 Part는 삭제하지 않습니다.
+
+    :return: QuerySet.delete()와 같은 (삭제된 행 수, 모델별 삭제 수) 튜플
+    """
+    model = queryset.model
+    through, source, target = get_parts_through(model)
+    part_model = model._meta.get_field('parts').related_model
+    # 삭제할 행은 읽기 DB가 아닌 쓰기 DB에서 조회합니다.
+    using = get_queryset_write_database(queryset)
+
+    counter = Counter()
+    pks_queryset = queryset.using(using).order_by('pk').values_list('pk', flat=True)
+    last_pk = None
+    while True:
+        chunk = pks_queryset if last_pk is None else pks_queryset.filter(pk__gt=last_pk)
+        pks = list(chunk[:batch_size])
+        if not pks:
+            break
+        last_pk = pks[-1]
+
+        with transaction.atomic(using=using):
+            links = through._base_manager.using(using).filter(**{f'{source}__in': pks})
+            part_ids = list(links.values_list(target, flat=True).distinct())
+
+            deleted, per_model = delete_queryset(links)
+            counter.update(per_model)
+
+            contents = model._base_manager.using(using).filter(pk__in=pks)
+            deleted, per_model = delete_queryset(contents, {through})
+            counter.update(per_model)
+
+            deleted, per_model = delete_orphan_parts(part_model, part_ids, using)
+            counter.update(per_model)
+
+    return sum(counter.values()), dict(counter)
@@ -0,0 +1,299 @@
+# Python
+import re
+import threading
+from functools import lru_cache
+
+# Django
+from django.utils.formats import number_format
+from django.utils.module_loading import import_string
+from django.utils.translation import gettext_lazy as _, ngettext
+
+# App
+from .settings import LIST_JOINERS, TEMPLATE_ENGINE
+
+# Variables
+PLACEHOLDER_PATTERN = re.compile(r'\{\{(\w+)\}\}')
+NAME_PATTERN = re.compile(r'\s*(\w+)\s*')
+KEY_PATTERN = re.compile(r'\s*(=\d+|\w+)\s*\{')
+CLOSE_PATTERN = re.compile(r'\s*\}\}')
+COUNT_TOKEN = ('#',)
+_engine = None
+_engine_lock = threading.Lock()
+
+
+# Plural rules
+def plural_category_default(n):
+    return 'one' if n == 1 else 'other'
+
+
+def plural_category_none(n):
+    return 'other'
+
+
+def plural_category_ru(n):
+    if n % 10 == 1 and n % 100 != 11:
+        return 'one'
+    if 2 <= n % 10 <= 4 and not 12 <= n % 100 <= 14:
+        return 'few'
+    return 'many'
+
+
+def plural_category_ar(n):
+    if n in (0, 1, 2):
+        return ('zero', 'one', 'two')[n]
+    if 3 <= n % 100 <= 10:
+        return 'few'
+    if 11 <= n % 100 <= 99:
+        return 'many'
+    return 'other'
+
+
+# CLDR 정수 plural 규칙 중 지원 언어에 해당하는 부분입니다.
+PLURAL_RULES = {
+    'ko': plural_category_none,
+    'ja': plural_category_none,
+    'zh': plural_category_none,
+    'ru': plural_category_ru,
+    'ar': plural_category_ar,
+}
+
+
+# Engines
+class TemplateEngine:
+    """
+    Format content를 토큰으로 컴파일하고 렌더링 직전의 토큰 목록으로 펼치는 엔진입니다.
+
+    토큰은 리터럴 str과 placeholder (name,) 튜플이며, 같은 content는 한 번만 컴파일됩니다.
+    기본 엔진은 {{name}} 치환만 지원합니다.
+    """
+    cache_size = 4096
+
+    def __init__(self):
+        self.compile = lru_cache(maxsize=self.cache_size)(self.compile_content)
+
+    def compile_content(self, content):
+        if not content:
+            return ()
+
+        tokens = []
+        for index, value in enumerate(PLACEHOLDER_PATTERN.split(content)):
+            if index % 2:
+                tokens.append((value,))
+            elif value:
+                tokens.append(value)
+        return tuple(tokens)
+
+    def is_plain(self, tokens):
+        return all(type(token) is str or len(token) == 1 for token in tokens)
+
+    def get_placeholders(self, content):
+        """
+        content에 사용된 placeholder 이름을 등장 순서대로 반환합니다.
+        """
+        return [token[0] for token in self.compile(content) if type(token) is not str]
+
+    def flatten(self, tokens, resolve, language=None):
+        """
+        렌더러가 사용할 리터럴과 (name,) 토큰 목록을 반환합니다.
+
+        :param resolve: placeholder 이름을 받아 (개수, 첫 번째 값)을 반환하는 함수
+        """
+        return tokens
+
+    def get_list_joiners(self, language=None):
+        """
+        여러 값을 이어 붙일 때 사용할 (구분자, 마지막 구분자)를 반환합니다.
+        DYNAMIC_CONTENTS_LIST_JOINERS 에서 언어, 언어 접두어 순서로 찾고 없으면 ", " 와 " and " 를 사용합니다.
+        """
+        if language:
+            for candidate in (language, language.split('-')[0]):
+                if candidate in LIST_JOINERS:
+                    return tuple(LIST_JOINERS[candidate])
+        return ', ', _(' and ')
+
+    def get_remaining_label(self, count, language=None):
+        """
+        잘린 part 목록 끝에 붙일 "N others" 문구를 반환합니다.
+        """
+        return ngettext('%(count)s other', '%(count)s others', count) % {
+            'count': number_format(count, force_grouping=True),
+        }
+
+    def join(self, contents, language=None):
+        # 마지막 요소 전까지는 구분자로, 마지막 두 요소는 마지막 구분자로 연결
+        if len(contents) > 1:
+            separator, last_separator = self.get_list_joiners(language)
+            return separator.join(contents[:-1]) + last_separator + contents[-1]
+        elif contents:
+            return contents[0]
+        return ''
+
+
+class MessageFormatEngine(TemplateEngine):
+    """
+    ICU MessageFormat 형식의 plural, select 구문을 지원하는 엔진입니다.
+
+        {{count, plural, =0 {no likes} one {# like} other {# likes}}}
+        {{gender, select, female {her} male {his} other {their}}}
+
+    plural은 해당 placeholder의 part가 하나이고 내용이 정수이면 그 값을, 아니면 part 개수를
+    사용하며, 분기 안의 #은 그 값으로 치환됩니다. select는 첫 번째 part의 내용을 사용합니다.
+    분기 안에서도 {{name}}과 중첩된 구문을 사용할 수 있고, 해석할 수 없는 구문은 그대로 출력됩니다.
+    """
+
+    def compile_content(self, content):
+        if not content:
+            return ()
+        if '{{' not in content or ',' not in content:
+            return super().compile_content(content)
+
+        tokens, position = self.parse(content, 0, in_plural=False, in_branch=False)
+        return tokens
+
+    def parse(self, content, position, in_plural, in_branch):
+        tokens = []
+        literal = []
+        length = len(content)
+
+        while position < length:
+            if content.startswith('{{', position):
+                node, end = self.parse_argument(content, position, in_plural)
+                if node is not None:
+                    if literal:
+                        tokens.append(''.join(literal))
+                        literal = []
+                    tokens.append(node)
+                    position = end
+                    continue
+                literal.append('{{')
+                position += 2
+                continue
+
+            char = content[position]
+            if in_branch and char == '}':
+                break
+            if in_plural and char == '#':
+                if literal:
+                    tokens.append(''.join(literal))
+                    literal = []
+                tokens.append(COUNT_TOKEN)
+            else:
+                literal.append(char)
+            position += 1
+
+        if literal:
+            tokens.append(''.join(literal))
+        return tuple(tokens), position
+
+    def parse_argument(self, content, position, in_plural):
+        """
+        position의 {{ 에서 시작하는 구문을 해석하여 (토큰, 끝 위치)를 반환합니다. 실패하면 (None, position).
+        """
+        match = PLACEHOLDER_PATTERN.match(content, position)
+        if match:
+            return (match.group(1),), match.end()
+
+        name = NAME_PATTERN.match(content, position + 2)
+        if not name or not content.startswith(',', name.end()):
+            return None, position
+        kind = NAME_PATTERN.match(content, name.end() + 1)
+        if not kind or kind.group(1) not in ('plural', 'select') or not content.startswith(',', kind.end()):
+            return None, position
+
+        branches = {}
+        cursor = kind.end() + 1
+        while True:
+            close = CLOSE_PATTERN.match(content, cursor)
+            if close and branches:
+                return (name.group(1), kind.group(1), branches), close.end()
+
+            key = KEY_PATTERN.match(content, cursor)
+            if not key:
+                return None, position
+
+            body, end = self.parse(content, key.end(), in_plural=kind.group(1) == 'plural' or in_plural, in_branch=True)
+            if end >= len(content):
+                return None, position
+            branches[key.group(1)] = body
+            cursor = end + 1
+
+    def is_plain(self, tokens):
+        return all(type(token) is str or len(token) == 1 and token is not COUNT_TOKEN for token in tokens)
+
+    def get_placeholders(self, content):
+        names = self.collect_placeholders(self.compile(content))
+        # plural/select의 기준이 되는 이름은 치환 placeholder와 중복되어도 한 번만 추가합니다.
+        for argument in self.collect_arguments(self.compile(content)):
+            if argument not in names:
+                names.append(argument)
+        return names
+
+    def collect_placeholders(self, tokens):
+        names = []
+        for token in tokens:
+            if type(token) is str or token is COUNT_TOKEN:
+                continue
+            if len(token) == 1:
+                names.append(token[0])
+                continue
+            # 분기 중 하나만 렌더링되므로 분기 사이의 중복은 한 번으로 셉니다.
+            branch_names = []
+            for branch in token[2].values():
+                for branch_name in self.collect_placeholders(branch):
+                    if branch_name not in branch_names:
+                        branch_names.append(branch_name)
+            names.extend(branch_names)
+        return names
+
+    def collect_arguments(self, tokens):
+        arguments = []
+        for token in tokens:
+            if type(token) is str or len(token) == 1:
+                continue
+            arguments.append(token[0])
+            for branch in token[2].values():
+                arguments.extend(self.collect_arguments(branch))
+        return arguments
+
+    def get_plural_category(self, count, language=None):
+        rule = PLURAL_RULES.get((language or '').split('-')[0], plural_category_default)
+        return rule(abs(count))
+
+    def choose_branch(self, token, resolve, language):
+        name, kind, branches = token
+        count, value = resolve(name)
+
+        if kind == 'plural':
+            exact = f'={count}'
+            if exact in branches:
+                return branches[exact], count
+            category = self.get_plural_category(count, language)
+            return branches.get(category, branches.get('other', ())), count
+
+        return branches.get(str(value), branches.get('other', ())), None
+
+    def flatten(self, tokens, resolve, language=None, count=None):
+        if count is None and self.is_plain(tokens):
+            return tokens
+
+        output = []
+        for token in tokens:
+            if type(token) is str:
+                output.append(token)
+            elif token is COUNT_TOKEN:
+                output.append(number_format(count, force_grouping=True) if count is not None else '#')
+            elif len(token) == 1:
+                output.append(token)
+            else:
+                branch, branch_count = self.choose_branch(token, resolve, language)
+                output.extend(self.flatten(branch, resolve, language, branch_count if branch_count is not None else count))
+        return output
+
+
+def get_template_engine():
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = import_string(TEMPLATE_ENGINE)()
+    return _engine
@@ -1,6 +1,6 @@
 # Python
 import logging
-import requests
+import threading
 from typing import Any
 from urllib.parse import urljoin
 
@@ -10,6 +10,8 @@ from django.conf import settings
 
 # Variables
 logger = logging.getLogger(__name__)
+_package_sdk = None
+_package_sdk_lock = threading.Lock()
 
 
 # Classes
@@ -21,6 +23,9 @@ class BaseGateway:
         return urljoin(self.base_url, path)
 
     def request(self, method: str, path: str, *args, **kwargs) -> Any:
+        # requests는 실제로 요청을 보낼 때 import 합니다.
+        import requests
+
         try:
             response = requests.request(method, self.get_url(path), *args, **kwargs)
         except requests.RequestException as exc:
@@ -51,4 +56,20 @@ class GatewayV1(BaseGateway):
 
 
 # Instances
-package_sdk = GatewayV1()
+def get_package_sdk() -> GatewayV1:
+    """
+    GatewayV1 인스턴스를 처음 사용할 때 생성하여 반환합니다.
+    """
+    global _package_sdk
+    if _package_sdk is None:
+        with _package_sdk_lock:
+            if _package_sdk is None:
+                _package_sdk = GatewayV1()
+    return _package_sdk
+
+
+def __getattr__(name: str) -> Any:
+    # 기존의 `from dynamic_contents.gateway import package_sdk` 사용을 지원합니다.
+    if name == 'package_sdk':
+        return get_package_sdk()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,42 @@
+# Django
+from django.core.management.base import BaseCommand, CommandError
+
+# App
+from dynamic_contents.archive import archive_dynamic_contents, get_archive_queryset
+from dynamic_contents.management.commands.audit_missing_placeholders import get_models
+
+
+class Command(BaseCommand):
+    help = 'Move dynamic contents older than the retention period into the archive table.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('models', nargs='*', help='app_label.ModelName. Defaults to every dynamic content model.')
+        parser.add_argument('--days', type=int, default=None,
+                            help='Archive rows older than this many days. Defaults to DYNAMIC_CONTENTS_ARCHIVE_AFTER_DAYS.')
+        parser.add_argument('--date-field', default=None,
+                            help='Date field to compare. Defaults to DYNAMIC_CONTENTS_ARCHIVE_DATE_FIELD.')
+        parser.add_argument('--batch-size', type=int, default=500)
+        parser.add_argument('--dry-run', action='store_true', help='Count rows to archive without moving them.')
+
+    def handle(self, *args, **options):
+        for model in get_models(options['models']):
+            queryset = model._default_manager.all()
+            try:
+                if options['dry_run']:
+                    count = get_archive_queryset(queryset, options['days'], options['date_field']).count()
+                else:
+                    count = archive_dynamic_contents(
+                        queryset,
+                        days=options['days'],
+                        date_field=options['date_field'],
+                        batch_size=options['batch_size'],
+                    )
+            except ValueError as e:
+                if options['models']:
+                    raise CommandError(str(e))
+                # 모델을 지정하지 않은 경우 날짜 필드가 없는 모델은 건너뜁니다.
+                self.stderr.write(self.style.WARNING(f'Skipped: {e}'))
+                continue
+
+            prefix = '[dry-run] ' if options['dry_run'] else ''
+            self.stdout.write(self.style.SUCCESS(f'{prefix}{model._meta.label}: archived {count}'))
@@ -0,0 +1,54 @@
+# Django
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+
+# App
+from dynamic_contents.audit import missing_placeholder_report, repair_missing_placeholders
+from dynamic_contents.models import DynamicContentModelMixin, get_dynamic_content_models
+
+
+def get_models(labels):
+    if not labels:
+        return get_dynamic_content_models()
+
+    models = []
+    for label in labels:
+        try:
+            model = apps.get_model(label)
+        except (LookupError, ValueError):
+            raise CommandError(f'Unknown model: {label}')
+        if not issubclass(model, DynamicContentModelMixin):
+            raise CommandError(f'{label} is not a DynamicContentModelMixin model.')
+        models.append(model)
+    return models
+
+
+class Command(BaseCommand):
+    help = 'Report missing placeholders of dynamic contents computed in SQL, and optionally repair stale values.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('models', nargs='*', help='app_label.ModelName. Defaults to every dynamic content model.')
+        parser.add_argument('--repair', action='store_true', help='Rewrite stale missing_placeholders values.')
+        parser.add_argument('--chunk-size', type=int, default=1000)
+        parser.add_argument('--dry-run', action='store_true', help='Count stale rows without writing them.')
+
+    def handle(self, *args, **options):
+        for model in get_models(options['models']):
+            queryset = model._default_manager.all()
+            self.stdout.write(self.style.MIGRATE_HEADING(model._meta.label))
+
+            for row in missing_placeholder_report(queryset):
+                self.stdout.write(
+                    f"  format={row['format']} {row['format__type'] or '-'}/{row['format__subtype'] or '-'}"
+                    f"  total={row['total']} incomplete={row['incomplete']}"
+                    f" missing={row['missing']} count_mismatch={row['count_mismatch']}"
+                )
+
+            if options['repair']:
+                result = repair_missing_placeholders(
+                    queryset, chunk_size=options['chunk_size'], dry_run=options['dry_run']
+                )
+                prefix = '[dry-run] ' if options['dry_run'] else ''
+                self.stdout.write(self.style.SUCCESS(
+                    f"  {prefix}checked: {result['checked']}, repaired: {result['repaired']}"
+                ))
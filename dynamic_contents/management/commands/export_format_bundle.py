@@ -0,0 +1,38 @@
+# Python
+import json
+
+# Django
+from django.core.management.base import BaseCommand, CommandError
+from django.core.serializers.json import DjangoJSONEncoder
+
+# App
+from dynamic_contents.bundles import build_format_bundle
+
+
+class Command(BaseCommand):
+    help = 'Export every Format as a versioned translation bundle for client-side rendering.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--since', default=None,
+                            help='Only export formats changed after this bundle version.')
+        parser.add_argument('--language', action='append', dest='languages',
+                            help='Language code to include. Can be repeated. Defaults to settings.LANGUAGES.')
+        parser.add_argument('--output', '-o', default=None,
+                            help='File to write the bundle to. Defaults to stdout.')
+        parser.add_argument('--indent', type=int, default=None)
+
+    def handle(self, *args, **options):
+        try:
+            bundle = build_format_bundle(since=options['since'], languages=options['languages'])
+        except ValueError as e:
+            raise CommandError(str(e))
+        data = json.dumps(bundle, cls=DjangoJSONEncoder, ensure_ascii=False, indent=options['indent'])
+
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                f.write(data)
+            self.stderr.write(self.style.SUCCESS(
+                f"Exported {len(bundle['formats'])} formats (version {bundle['version']}) to {options['output']}"
+            ))
+        else:
+            self.stdout.write(data)
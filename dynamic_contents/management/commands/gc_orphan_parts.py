@@ -0,0 +1,46 @@
+# Python
+from datetime import timedelta
+
+# Django
+from django.core.management.base import BaseCommand
+from django.db import router
+from django.db.models import Q
+from django.utils import timezone
+
+# App
+from dynamic_contents.deletion import delete_orphan_parts, get_orphan_parts
+from dynamic_contents.models import Part
+
+
+class Command(BaseCommand):
+    help = 'Delete Parts that are not linked to any dynamic content.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--min-age', type=int, default=60,
+                            help='Only delete parts created at least this many minutes ago, '
+                                 'so parts that are about to be linked are kept.')
+        parser.add_argument('--dry-run', action='store_true', help='Count orphan parts without deleting them.')
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(minutes=options['min_age'])
+        using = router.db_for_write(Part)
+        candidates = Part._base_manager.using(using).filter(Q(created_at__lt=cutoff) | Q(created_at__isnull=True)).order_by('pk')
+
+        checked = deleted = 0
+        last_pk = None
+        while True:
+            chunk = candidates if last_pk is None else candidates.filter(pk__gt=last_pk)
+            pks = list(chunk.values_list('pk', flat=True)[:options['batch_size']])
+            if not pks:
+                break
+            last_pk = pks[-1]
+            checked += len(pks)
+
+            if options['dry_run']:
+                deleted += get_orphan_parts(Part._base_manager.using(using).filter(pk__in=pks)).count()
+            else:
+                deleted += delete_orphan_parts(Part, pks, using)[1].get(Part._meta.label, 0)
+
+        prefix = '[dry-run] ' if options['dry_run'] else ''
+        self.stdout.write(self.style.SUCCESS(f'{prefix}checked: {checked}, orphan parts deleted: {deleted}'))
@@ -0,0 +1,94 @@
+# Python
+import json
+import os
+
+# Django
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+
+# App
+from dynamic_contents.models import Format
+
+
+def iter_entries(data):
+    # 파일 최상위는 항목 하나, 항목 목록, 또는 {"formats": [...]} 형태를 허용합니다.
+    if isinstance(data, dict) and 'formats' in data:
+        data = data['formats']
+    if isinstance(data, dict):
+        yield data
+    elif isinstance(data, list):
+        yield from data
+    elif data is not None:
+        raise CommandError(f'Unexpected fixture data: {data!r}')
+
+
+def iter_format_entries(path):
+    """
+    fixture 파일에서 Format 항목을 하나씩 읽어옵니다.
+    .jsonl/.ndjson 은 한 줄씩, YAML은 문서 단위로 읽으므로 파일 전체를 한 번에 파싱하지 않습니다.
+    """
+    extension = os.path.splitext(path)[1].lower()
+
+    with open(path, encoding='utf-8') as f:
+        if extension in ('.jsonl', '.ndjson'):
+            for line in f:
+                if line.strip():
+                    yield from iter_entries(json.loads(line))
+        elif extension == '.json':
+            yield from iter_entries(json.load(f))
+        elif extension in ('.yaml', '.yml'):
+            try:
+                import yaml
+            except ImportError:
+                raise CommandError('PyYAML is required to read YAML fixtures.')
+            for document in yaml.safe_load_all(f):
+                yield from iter_entries(document)
+        else:
+            raise CommandError(f'Unsupported fixture file: {path}')
+
+
+def iter_fixture_paths(paths):
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for name in sorted(files):
+                    if os.path.splitext(name)[1].lower() in ('.json', '.jsonl', '.ndjson', '.yaml', '.yml'):
+                        yield os.path.join(root, name)
+        elif os.path.isfile(path):
+            yield path
+        else:
+            raise CommandError(f'Fixture not found: {path}')
+
+
+class Command(BaseCommand):
+    help = 'Sync Format templates and translations from JSON or YAML fixture files.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('paths', nargs='+', help='Fixture files or directories.')
+        parser.add_argument('--fill-only', action='store_true',
+                            help='Only fill empty fields of existing formats instead of overwriting them.')
+        parser.add_argument('--dry-run', action='store_true', help='Report changes without writing them.')
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        entries = (
+            entry
+            for path in iter_fixture_paths(options['paths'])
+            for entry in iter_format_entries(path)
+        )
+
+        try:
+            result = Format.objects.sync_formats(
+                entries,
+                fill_only=options['fill_only'],
+                dry_run=options['dry_run'],
+                batch_size=options['batch_size'],
+            )
+        except ValidationError as e:
+            raise CommandError('\n'.join(e.messages))
+
+        prefix = '[dry-run] ' if options['dry_run'] else ''
+        self.stdout.write(self.style.SUCCESS(
+            f"{prefix}created: {result['created']}, updated: {result['updated']}, unchanged: {result['unchanged']}"
+        ))
@@ -4,15 +4,31 @@ import json
 from collections import Counter
 
 # Django
-from django.db import models
+from django.apps import apps
+from django.db import models, router, transaction
+from django.utils import timezone, translation
+from django.utils.safestring import mark_safe
 from django.utils.translation import gettext_lazy as _
 from django.utils.translation import get_language
 from django.core.exceptions import ValidationError
 from django.core.serializers.json import DjangoJSONEncoder
 
 # App
+from .audit import annotate_missing_placeholders, missing_placeholder_report, repair_missing_placeholders
+from .deletion import delete_dynamic_contents, delete_orphan_parts
+from .engine import get_template_engine
+from .routers import get_read_database
+from .settings import DEFAULT_LANGUAGE, PART_LIMIT
+from .tasks import Job, submit_jobs
+from .tasks import create_dynamic_content_job, update_dynamic_content_job, rerender_dynamic_content_job
+from .truncation import fetch_limited_parts, prefetch_limited_parts
 from .utils import generate_text, generate_html, generate_i18n
 
+def get_pk(value):
+    # 모델 객체와 pk를 모두 받을 수 있도록 합니다.
+    return value.pk if isinstance(value, models.Model) else value
+
+
 # Class Section
 class BaseModel(models.Model):
 
@@ -40,7 +56,16 @@ class BaseModel(models.Model):
             return self.content
 
 
-class FormatManager(models.Manager):
+class RenderManagerMixin:
+    def for_render(self):
+        """
+        렌더링용 읽기 queryset을 반환합니다. replica가 설정되어 있으면 replica에서 읽고,
+        최근에 쓰기가 있었다면 쓰기 DB에서 읽습니다.
+        """
+        return self.get_queryset().using(get_read_database())
+
+
+class FormatManager(RenderManagerMixin, models.Manager):
     def update_format_if_needed(self, format, defaults):
         updated = False
         for key, value in defaults.items():
@@ -50,6 +75,115 @@ class FormatManager(models.Manager):
         if updated:
             format.save()
 
+    def get_content_field_names(self):
+        return [field.name for field in self.model._meta.concrete_fields if field.name.startswith('content_')]
+
+    def get_entry_values(self, entry):
+        """
+        fixture 항목의 content 값을 모델 필드 값으로 변환합니다.
+        content는 기본 언어 문자열이거나 {언어: 문자열} dict 이며, content_<lang> 키도 허용합니다.
+        """
+        values = {}
+        content = entry.get('content')
+        if isinstance(content, dict):
+            for language, text in content.items():
+                values[f"content_{language.replace('-', '_')}"] = text
+        elif content is not None:
+            values[f"content_{DEFAULT_LANGUAGE.replace('-', '_')}" if DEFAULT_LANGUAGE else 'content'] = content
+
+        for key, value in entry.items():
+            if key.startswith('content_'):
+                values[key] = value
+        return values
+
+    def sync_formats(self, entries, fill_only=False, dry_run=False, batch_size=500):
+        """
+        fixture 항목들을 DB의 Format과 비교하여 bulk_create/bulk_update로 반영합니다.
+
+        Format은 (type, subtype)으로 식별하며 기존 Format은 한 번의 쿼리로 가져옵니다.
+        정규화와 중복 placeholder 검사는 save() 대신 메모리에서 Format.normalize()로 수행하고,
+        하나라도 실패하면 아무것도 저장하지 않고 ValidationError를 발생시킵니다.
+
+        :param entries: type, subtype, content 키를 가진 dict의 iterable
+        :param fill_only: True이면 update_format_if_needed처럼 비어 있는 필드만 채웁니다.
+        :param dry_run: True이면 변경 사항을 계산만 하고 저장하지 않습니다.
+        :return: created, updated, unchanged 개수를 담은 dict
+        """
+        # 원본 content 컬럼과 placeholders가 기본 언어 기준으로 계산되도록 합니다.
+        with translation.override(DEFAULT_LANGUAGE):
+            return self._sync_formats(entries, fill_only, dry_run, batch_size)
+
+    def _sync_formats(self, entries, fill_only, dry_run, batch_size):
+        content_field_names = set(self.get_content_field_names())
+        errors = []
+
+        keyed_values = {}
+        for entry in entries:
+            key = (self.model.process_type_field(entry.get('type')), self.model.process_type_field(entry.get('subtype')))
+            if not all(key):
+                errors.append(f'Format entry without type or subtype: {entry!r}')
+                continue
+
+            values = self.get_entry_values(entry)
+            unknown = set(values) - content_field_names - {'content'}
+            if unknown:
+                errors.append(f'{key[0]}/{key[1]}: unknown content fields {", ".join(sorted(unknown))}')
+                continue
+            keyed_values[key] = values
+
+        # 비교할 기존 값도 replica가 아닌 쓰기 DB에서 읽습니다.
+        using = self._db or router.db_for_write(self.model)
+        existing = {}
+        for format in self.using(using).filter(type__in={key[0] for key in keyed_values}):
+            existing.setdefault((format.type, format.subtype), format)
+
+        now = timezone.now()
+        to_create, to_update = [], []
+        update_fields = {'content', '_placeholders', 'updated_at'}
+        for key, values in keyed_values.items():
+            format = existing.get(key)
+            if format is None:
+                format = self.model(type=key[0], subtype=key[1], **values)
+                to_create.append(format)
+            else:
+                changed_fields = []
+                for name, value in values.items():
+                    current = getattr(format, name)
+                    if current == value or (fill_only and current):
+                        continue
+                    setattr(format, name, value)
+                    changed_fields.append(name)
+                if not changed_fields:
+                    continue
+                update_fields.update(changed_fields)
+                format.updated_at = now
+                to_update.append(format)
+
+            try:
+                format.normalize()
+            except ValidationError as e:
+                errors.append(f'{key[0]}/{key[1]}: {"; ".join(e.messages)}')
+
+        if errors:
+            raise ValidationError(errors)
+
+        if not dry_run:
+            with transaction.atomic(using=using):
+                self.using(using).bulk_create(to_create, batch_size=batch_size)
+                if to_update:
+                    queryset = self.using(using)
+                    # modeltranslation은 'content'를 현재 언어의 content_<lang>으로 바꾸므로,
+                    # save()처럼 원본 content 컬럼에도 기본 언어 값이 저장되도록 rewrite를 끕니다.
+                    if hasattr(queryset, 'rewrite'):
+                        queryset = queryset.rewrite(False)
+                    queryset.bulk_update(to_update, sorted(update_fields), batch_size=batch_size)
+
+        return {
+            'created': len(to_create),
+            'updated': len(to_update),
+            'unchanged': len(keyed_values) - len(to_create) - len(to_update),
+        }
+
 
 # Format
 class Format(BaseModel):
@@ -77,7 +211,11 @@ class Format(BaseModel):
             return self._placeholders.split(',')
         return []
 
-    def save(self, *args, **kwargs):
+    def normalize(self):
+        """
+        save() 전에 필요한 정규화와 검증을 메모리에서 수행합니다.
+        bulk_create/bulk_update 처럼 save()를 거치지 않는 경로에서도 사용합니다.
+        """
         # type과 subtype 필드를 대문자로 변환하고, _ 외의 특수문자 제거
         self.type = self.process_type_field(self.type)
         self.subtype = self.process_type_field(self.subtype)
@@ -89,6 +227,8 @@ class Format(BaseModel):
             if count > 1:
                 raise ValidationError(f'Placeholder "{{{placeholder}}}" used multiple times in content.')
 
+    def save(self, *args, **kwargs):
+        self.normalize()
         return super(Format, self).save(*args, **kwargs)
 
     @staticmethod
@@ -103,13 +243,16 @@ class Format(BaseModel):
     @staticmethod
     def extract_placeholders(content):
         """
-        주어진 content에서 '{{}}' 형식의 텍스트를 추출합니다.
+        주어진 content에서 '{{}}' 형식의 텍스트와 plural, select 구문의 이름을 추출합니다.
         """
         if not content:
             return ''
 
-        placeholders = re.findall(r'\{\{(\w+)\}\}', content)
-        return ','.join(placeholders)
+        return ','.join(get_template_engine().get_placeholders(content))
+
+
+class PartManager(RenderManagerMixin, models.Manager):
+    pass
 
 
 # Part
@@ -119,6 +262,8 @@ class Part(BaseModel):
     link = models.URLField(_('Link'), null=True, blank=True)  # https://runners.im/sun
     instance_id = models.TextField(_('Instance ID'), null=True, blank=True)  # 1
 
+    objects = PartManager()
+
     class Meta:
         verbose_name = 'part'
         verbose_name_plural = 'parts'
@@ -132,22 +277,80 @@ class Part(BaseModel):
 
 
 # Dynamic Content
-class DynamicContentManagerMixin:
+class DynamicContentQuerySetMixin:
+    """
+    DynamicContentModelMixin 모델의 QuerySet에 일괄 처리 기능을 추가합니다.
+    """
+
+    def with_missing_placeholders(self):
+        return annotate_missing_placeholders(self)
+
+    def incomplete(self):
+        # Format의 placeholder 중 연결된 Part가 없는 것이 있는 행만 남깁니다.
+        return annotate_missing_placeholders(self).filter(missing_placeholder_count__gt=0)
+
+    def missing_placeholder_report(self):
+        return missing_placeholder_report(self)
+
+    def repair_missing_placeholders(self, chunk_size=1000, dry_run=False):
+        return repair_missing_placeholders(self, chunk_size=chunk_size, dry_run=dry_run)
+
+    def with_limited_parts(self, limit=None):
+        """
+        조회 시 placeholder별로 최대 limit 개의 Part만 prefetched_parts에 채우고,
+        전체 수는 part_totals에 채웁니다. 렌더링 결과는 "A, B and N others" 형태가 됩니다.
+        """
+        clone = self._chain()
+        clone._part_limit = limit or PART_LIMIT
+        if not clone._part_limit:
+            raise ValueError('with_limited_parts() requires a limit or DYNAMIC_CONTENTS_PART_LIMIT.')
+        return clone
+
+    def _clone(self):
+        clone = super()._clone()
+        clone._part_limit = getattr(self, '_part_limit', None)
+        return clone
+
+    def _fetch_all(self):
+        fetched = self._result_cache is not None
+        super()._fetch_all()
+        if not fetched and getattr(self, '_part_limit', None) and self._iterable_class is models.query.ModelIterable:
+            prefetch_limited_parts(self._result_cache, self._part_limit)
+
+    def delete(self, batch_size=1000):
+        """
+        DynamicContent와 함께 중간 테이블 행과 고아가 된 Part를 batch 단위로 삭제합니다.
+        """
+        if self.query.is_sliced:
+            raise TypeError("Cannot use 'limit' or 'offset' with delete().")
+        return delete_dynamic_contents(self, batch_size=batch_size)
+
+    delete.alters_data = True
+    delete.queryset_only = True
+
+
+class DynamicContentQuerySet(DynamicContentQuerySetMixin, models.QuerySet):
+    pass
+
+
+class DynamicContentManagerMixin(RenderManagerMixin):
 
     def create_dynamic_content(self, format, parts):
         """
         Create a new DynamicContent object with the given format and parts.
 
         :param format: The Format object for the DynamicContent.
-        :param parts: List of Part objects.
+        :param parts: List of Part objects or Part ids.
         :return: The created DynamicContent object.
         """
-        # DynamicContent 객체 생성
-        dynamic_content = self.create(format=format)
+        using = self._db or router.db_for_write(self.model)
+        with transaction.atomic(using=using):
+            # DynamicContent 객체 생성
+            dynamic_content = self.using(using).create(format=format)
 
-        # Part 객체들 연결
-        for part in parts:
-            dynamic_content.parts.add(part)
+            # Part 객체들을 한 번에 연결
+            if parts:
+                dynamic_content.parts.add(*parts)
 
         return dynamic_content
 
@@ -157,24 +360,118 @@ class DynamicContentManagerMixin:
 
         :param dynamic_content: The DynamicContent object to update.
         :param format: The Format object for the DynamicContent.
-        :param parts: List of Part objects.
+        :param parts: List of Part objects or Part ids.
         :return: The updated DynamicContent object.
         """
-        # 기존 Part 객체들 삭제
-        dynamic_content.parts.clear()
+        using = self._db or router.db_for_write(self.model, instance=dynamic_content)
+        with transaction.atomic(using=using):
+            # 기존 Part 객체들 삭제
+            dynamic_content.parts.clear()
+            dynamic_content.clear_render_parts()
 
-        # Part 객체들 연결
-        for part in parts:
-            dynamic_content.parts.add(part)
+            # Part 객체들을 한 번에 연결
+            if parts:
+                dynamic_content.parts.add(*parts)
 
-        # Format 업데이트
-        dynamic_content.format = format
+            # Format 업데이트
+            dynamic_content.format = format
 
-        # DynamicContent 저장
-        dynamic_content.save()
+            # DynamicContent 저장
+            dynamic_content.save(using=using)
 
         return dynamic_content
 
+    def with_missing_placeholders(self):
+        return annotate_missing_placeholders(self.get_queryset())
+
+    def missing_placeholder_report(self):
+        return missing_placeholder_report(self.get_queryset())
+
+    def repair_missing_placeholders(self, chunk_size=1000, dry_run=False):
+        return repair_missing_placeholders(self.get_queryset(), chunk_size=chunk_size, dry_run=dry_run)
+
+    def get_with_archive(self, **kwargs):
+        """
+        DynamicContent를 조회하고, 이미 보관(archive)된 경우 ArchivedDynamicContent를 반환합니다.
+        두 객체 모두 get_text, get_i18n, get_html 을 제공합니다.
+
+        :param kwargs: pk 조회 조건 (예: pk=1)
+        """
+        try:
+            return self.get(**kwargs)
+        except self.model.DoesNotExist:
+            pk = kwargs.get('pk', kwargs.get('id'))
+            if pk is None:
+                raise
+            try:
+                return ArchivedDynamicContent.objects.get(model_label=self.model._meta.label, object_id=str(pk))
+            except ArchivedDynamicContent.DoesNotExist:
+                raise self.model.DoesNotExist(f'{self.model._meta.object_name} matching query does not exist.')
+
+    def in_bulk_with_archive(self, pks):
+        """
+        pk 목록을 조회하여 {pk: DynamicContent 또는 ArchivedDynamicContent} dict를 반환합니다.
+        """
+        result = self.in_bulk(pks)
+        missing = [str(pk) for pk in pks if pk not in result]
+        if missing:
+            archived = ArchivedDynamicContent.objects.filter(model_label=self.model._meta.label, object_id__in=missing)
+            pk_type = {str(pk): pk for pk in pks}
+            for archived_content in archived:
+                result[pk_type[archived_content.object_id]] = archived_content
+        return result
+
+    def create_dynamic_contents_async(self, items):
+        """
+        DynamicContent 생성을 백그라운드 작업으로 제출합니다.
+
+        :param items: (format, parts) 또는 (format, parts, dedupe_key) 튜플의 목록.
+            같은 dedupe_key를 가진 대기 중인 작업은 하나로 합쳐집니다.
+        :return: 생성된 pk를 결과로 가지는 JobBatch
+        """
+        label = self.model._meta.label
+        jobs = []
+        for format, parts, *dedupe_key in items:
+            jobs.append(Job(
+                create_dynamic_content_job,
+                args=(label, get_pk(format), [get_pk(part) for part in parts]),
+                key=(label, 'create', dedupe_key[0]) if dedupe_key else None,
+            ))
+        return submit_jobs(jobs, using=self._db or router.db_for_write(self.model))
+
+    def update_dynamic_contents_async(self, items):
+        """
+        DynamicContent 수정을 백그라운드 작업으로 제출합니다.
+        같은 DynamicContent에 대한 대기 중인 수정은 마지막 요청 하나로 합쳐집니다.
+
+        :param items: (dynamic_content, format, parts) 튜플의 목록.
+        :return: 수정된 pk를 결과로 가지는 JobBatch
+        """
+        label = self.model._meta.label
+        jobs = []
+        for dynamic_content, format, parts in items:
+            pk = get_pk(dynamic_content)
+            jobs.append(Job(
+                update_dynamic_content_job,
+                args=(label, pk, get_pk(format), [get_pk(part) for part in parts]),
+                key=(label, 'update', pk),
+            ))
+        return submit_jobs(jobs, using=self._db or router.db_for_write(self.model))
+
+    def rerender_dynamic_contents_async(self, dynamic_contents):
+        """
+        DynamicContent의 missing_placeholders 재계산과 렌더링 캐시 갱신을 백그라운드 작업으로 제출합니다.
+
+        :param dynamic_contents: DynamicContent 객체 또는 pk의 목록.
+        :return: JobBatch
+        """
+        label = self.model._meta.label
+        jobs = []
+        for dynamic_content in dynamic_contents:
+            pk = get_pk(dynamic_content)
+            jobs.append(Job(rerender_dynamic_content_job, args=(label, pk), key=(label, 'rerender', pk)))
+        return submit_jobs(jobs, using=self._db or router.db_for_write(self.model))
+
 
 class DynamicContentModelMixin(models.Model):
 
@@ -185,31 +482,66 @@ class DynamicContentModelMixin(models.Model):
     class Meta:
         abstract = True
 
-    def get_missing_placeholders(self):
+    def get_missing_placeholders(self, parts=None):
         """
         이 메서드는 Format의 placeholders와 연결된 Parts가 모두 존재하는지 확인합니다.
         누락된 placeholders가 있다면 해당 placeholders를 리스트로 반환합니다.
+        이미 가져온 parts가 있다면 넘겨서 쿼리를 생략할 수 있습니다.
         """
         if not self.format:
             return []  # Format이 설정되지 않은 경우 빈 리스트 반환
 
         placeholders = self.format.get_placeholders()
-        parts_fields = [part.field for part in self.parts.all()]
-        missing_placeholders = list(set(placeholders) - set(parts_fields))
+        parts_fields = {part.field for part in (self.parts.all() if parts is None else parts)}
+        missing_placeholders = [placeholder for placeholder in placeholders if placeholder not in parts_fields]
 
         return missing_placeholders
 
+    def get_render_parts(self):
+        """
+        렌더링에 사용할 (parts, totals)를 반환합니다.
+        with_limited_parts()로 조회했거나 DYNAMIC_CONTENTS_PART_LIMIT가 설정된 경우
+        placeholder별로 잘린 Part 목록과 전체 수를, 아니면 모든 Part와 None을 반환합니다.
+        """
+        if getattr(self, 'part_totals', None) is not None:
+            return self.prefetched_parts, self.part_totals
+        if hasattr(self, 'prefetched_parts'):
+            return self.prefetched_parts, None
+        if PART_LIMIT and self.pk is not None:
+            # get_text, get_i18n, get_html이 각각 다시 조회하지 않도록 처음 조회한 결과를 보관합니다.
+            self.prefetched_parts, self.part_totals = fetch_limited_parts(type(self), [self.pk], PART_LIMIT)[self.pk]
+            return self.prefetched_parts, self.part_totals
+        return self.parts.all(), None
+
+    def clear_render_parts(self):
+        """
+        get_render_parts()가 보관한 Part 목록을 버립니다. Part 연결이 바뀐 뒤에 호출합니다.
+        """
+        self.__dict__.pop('prefetched_parts', None)
+        self.__dict__.pop('part_totals', None)
+
+    def refresh_from_db(self, *args, **kwargs):
+        self.clear_render_parts()
+        super(DynamicContentModelMixin, self).refresh_from_db(*args, **kwargs)
+
     def get_text(self):
         # generate_text 함수를 사용하여 텍스트 생성
-        return generate_text(self.format, self.parts.all())
+        return generate_text(self.format, *self.get_render_parts())
 
     def get_i18n(self):
         # generate_i18n 함수를 사용하여 국제화된 텍스트 생성
-        return generate_i18n(self.format, self.parts.all())
+        return generate_i18n(self.format, *self.get_render_parts())
 
     def get_html(self):
         # generate_html 함수를 사용하여 HTML 콘텐츠 생성
-        return generate_html(self.format, self.parts.all())
+        return generate_html(self.format, *self.get_render_parts())
+
+    def get_push_channels(self):
+        """
+        DYNAMIC_CONTENTS_PUSH가 켜져 있을 때 렌더링 결과를 보낼 채널 목록입니다.
+        수신자별로 보내려면 override 하여 f'user:{self.user_id}' 처럼 반환합니다.
+        """
+        return [self._meta.label]
 
     def save(self, *args, **kwargs):
         if self.id:
@@ -219,44 +551,112 @@ class DynamicContentModelMixin(models.Model):
 
         super(DynamicContentModelMixin, self).save(*args, **kwargs)
 
-    def delete(self, *args, **kwargs):
+    def delete(self, using=None, keep_parents=False):
         """
-        DynamicContent를 삭제하기 전에 관련된 모든 파트를 삭제합니다.
+        DynamicContent를 삭제하고, 다른 콘텐츠에서 참조하지 않는 파트를 함께 삭제합니다.
         """
-        self.parts.all().delete()
-        super(DynamicContentModelMixin, self).delete(*args, **kwargs)
+        using = using or router.db_for_write(self.__class__, instance=self)
+        with transaction.atomic(using=using):
+            part_ids = list(self.parts.using(using).values_list('pk', flat=True))
+            result = super(DynamicContentModelMixin, self).delete(using=using, keep_parents=keep_parents)
+            delete_orphan_parts(Part, part_ids, using)
+        return result
+
+
+class ArchivedDynamicContent(models.Model):
+    """
+    보관 기간이 지난 DynamicContent의 렌더링 결과와 part 데이터를 JSON으로 저장합니다.
+    Part 및 M2M 중간 테이블을 참조하지 않으므로 조인 없이 읽을 수 있습니다.
+    """
+    is_archived = True
+
+    model_label = models.CharField(_('Model'), max_length=200)
+    object_id = models.CharField(_('Object ID'), max_length=64)
+    format_data = models.TextField(_('Format'), blank=True, null=True)
+    parts_data = models.TextField(_('Parts'), blank=True, null=True)
+    rendered = models.TextField(_('Rendered'), blank=True, null=True)
+    missing_placeholders = models.TextField(_('Missing Placeholders'), blank=True, null=True)
+    created_at = models.DateTimeField(_('Created At'), null=True, blank=True)
+    archived_at = models.DateTimeField(_('Archived At'), auto_now_add=True)
+
+    class Meta:
+        verbose_name = 'archived dynamic content'
+        verbose_name_plural = 'archived dynamic contents'
+        unique_together = ('model_label', 'object_id')
+
+    def __str__(self):
+        return '{}({}:{})'.format(self.__class__.__name__, self.model_label, self.object_id)
+
+    def get_format_data(self):
+        return json.loads(self.format_data) if self.format_data else None
+
+    def get_parts_data(self):
+        return json.loads(self.parts_data) if self.parts_data else []
+
+    def get_rendered(self, language=None):
+        """
+        현재 언어의 렌더링 결과를 반환합니다. 없다면 기본 언어, 그 다음 첫 번째 언어를 사용합니다.
+        """
+        rendered = json.loads(self.rendered) if self.rendered else {}
+        language = language or get_language()
+        for candidate in (language, language and language.split('-')[0], DEFAULT_LANGUAGE):
+            if candidate in rendered:
+                return rendered[candidate]
+        return next(iter(rendered.values()), {'text': '', 'i18n': '', 'html': ''})
+
+    def get_missing_placeholders(self):
+        return json.loads(self.missing_placeholders) if self.missing_placeholders else []
+
+    def get_text(self):
+        return self.get_rendered()['text']
+
+    def get_i18n(self):
+        return self.get_rendered()['i18n']
+
+    def get_html(self):
+        # 보관 시점에 HtmlRenderer로 escape된 결과입니다.
+        return mark_safe(self.get_rendered()['html'])
+
+
+def get_dynamic_content_models():
+    """
+    DynamicContentModelMixin을 상속한 모든 concrete 모델을 반환합니다.
+    """
+    return [model for model in apps.get_models() if issubclass(model, DynamicContentModelMixin)]
 
 
 class DynamicContent:
-    def __init__(self, format, parts):
+    def __init__(self, format, parts, part_totals=None):
         """
         Initializes a utility object to work with dynamic content.
 
         :param format_instance: An instance or mock of the Format model.
         :param parts_queryset: A list or mock queryset of Part instances.
+        :param part_totals: Total part count per field when parts were truncated.
         """
         self.format = format
         self.parts = parts
+        self.part_totals = part_totals
 
     def get_missing_placeholders(self):
         if not self.format:
             return []
 
         placeholders = self.format.get_placeholders()
-        parts_fields = [part.field for part in self.parts]
-        missing_placeholders = list(set(placeholders) - set(parts_fields))
+        parts_fields = {part.field for part in self.parts}
+        missing_placeholders = [placeholder for placeholder in placeholders if placeholder not in parts_fields]
 
         return missing_placeholders
 
     def get_text(self):
         # Assuming generate_text is a standalone function that processes the format and parts
-        return generate_text(self.format, self.parts)
+        return generate_text(self.format, self.parts, self.part_totals)
 
     def get_i18n(self):
         # Assuming generate_i18n is a standalone function
-        return generate_i18n(self.format, self.parts)
+        return generate_i18n(self.format, self.parts, self.part_totals)
 
     def get_html(self):
         # Assuming generate_html is a standalone function
-        return generate_html(self.format, self.parts)
+        return generate_html(self.format, self.parts, self.part_totals)
 
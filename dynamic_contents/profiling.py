@@ -0,0 +1,193 @@
+# Python
+import cProfile
+import json
+import logging
+import os
+import random
+import time
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+# Django
+from django.db import connections
+from django.db.models import signals
+
+# App
+from .settings import (
+    PROFILING, PROFILING_SAMPLE_RATE, PROFILING_OUTPUT, PROFILING_DUMP_DIR, PROFILING_DUMP_RATE,
+)
+
+# Variables
+logger = logging.getLogger(__name__)
+_profile = ContextVar('dynamic_contents_profile', default=None)
+
+
+class StageTimer:
+    """
+    요청 하나의 단계별 소요 시간(초)과 횟수를 모읍니다.
+    단계는 서로 겹칠 수 있습니다. 예를 들어 serializer 시간에는 그 안에서 실행된 쿼리 시간도 포함됩니다.
+    """
+
+    def __init__(self):
+        self.stages = {}
+        self.init_starts = []
+        self.started_at = time.perf_counter()
+
+    def add(self, stage, duration):
+        total, count = self.stages.get(stage, (0.0, 0))
+        self.stages[stage] = (total + duration, count + 1)
+
+    def elapsed(self):
+        return time.perf_counter() - self.started_at
+
+    def to_dict(self):
+        return {
+            stage: {'ms': round(total * 1000, 3), 'count': count}
+            for stage, (total, count) in self.stages.items()
+        }
+
+    def to_server_timing(self, total=None):
+        values = [
+            f'{stage};dur={total * 1000:.3f};desc="{count}"'
+            for stage, (total, count) in self.stages.items()
+        ]
+        values.append(f'total;dur={(self.elapsed() if total is None else total) * 1000:.3f}')
+        return ', '.join(values)
+
+
+def get_timer():
+    return _profile.get()
+
+
+@contextmanager
+def profile_block(stage):
+    """
+    프로파일링 중인 요청이라면 with 블록의 소요 시간을 stage에 더합니다.
+    """
+    timer = _profile.get()
+    if timer is None:
+        yield
+        return
+
+    started_at = time.perf_counter()
+    try:
+        yield
+    finally:
+        timer.add(stage, time.perf_counter() - started_at)
+
+
+def profile_stage(stage):
+    """
+    함수 실행 시간을 stage로 기록하는 데코레이터입니다.
+    DYNAMIC_CONTENTS_PROFILING이 꺼져 있으면 원래 함수를 그대로 반환하므로 비용이 없습니다.
+    """
+    def decorator(func):
+        if not PROFILING:
+            return func
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            timer = _profile.get()
+            if timer is None:
+                return func(*args, **kwargs)
+            started_at = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                timer.add(stage, time.perf_counter() - started_at)
+        return wrapper
+    return decorator
+
+
+# Database / model instantiation
+def record_query(execute, sql, params, many, context):
+    timer = _profile.get()
+    if timer is None:
+        return execute(sql, params, many, context)
+
+    started_at = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timer.add('db', time.perf_counter() - started_at)
+
+
+def record_init_start(sender, **kwargs):
+    timer = _profile.get()
+    if timer is not None:
+        timer.init_starts.append(time.perf_counter())
+
+
+def record_init_end(sender, **kwargs):
+    timer = _profile.get()
+    if timer is not None and timer.init_starts:
+        timer.add('model_init', time.perf_counter() - timer.init_starts.pop())
+
+
+if PROFILING:
+    # 모델 생성 시간은 pre_init/post_init 시그널로 측정합니다. 프로파일링을 켠 경우에만 연결합니다.
+    signals.pre_init.connect(record_init_start, dispatch_uid='dynamic_contents_profiling_pre_init')
+    signals.post_init.connect(record_init_end, dispatch_uid='dynamic_contents_profiling_post_init')
+
+
+# Views
+def get_dump_path(request, view):
+    name = f'{type(view).__name__}-{request.method}-{int(time.time() * 1000)}-{os.getpid()}.prof'
+    return os.path.join(PROFILING_DUMP_DIR, name)
+
+
+class ProfilingMixin:
+    """
+    DRF view의 요청별 단계 시간(db, model_init, serializer, generator)을 측정합니다.
+
+    DYNAMIC_CONTENTS_PROFILING이 켜져 있을 때 DYNAMIC_CONTENTS_PROFILING_SAMPLE_RATE 비율의 요청만 측정하고,
+    결과를 Server-Timing 헤더나 JSON 로그 한 줄로 남깁니다. DYNAMIC_CONTENTS_PROFILING_DUMP_DIR이
+    설정되어 있다면 측정한 요청 중 DYNAMIC_CONTENTS_PROFILING_DUMP_RATE 비율의 cProfile 결과를 파일로 저장합니다.
+    """
+
+    def dispatch(self, request, *args, **kwargs):
+        if not PROFILING or _profile.get() is not None or random.random() >= PROFILING_SAMPLE_RATE:
+            return super().dispatch(request, *args, **kwargs)
+
+        timer = StageTimer()
+        profiler = None
+        if PROFILING_DUMP_DIR and random.random() < PROFILING_DUMP_RATE:
+            profiler = cProfile.Profile()
+
+        token = _profile.set(timer)
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(record_query))
+                if profiler is not None:
+                    profiler.enable()
+                    stack.callback(profiler.disable)
+                response = super().dispatch(request, *args, **kwargs)
+        finally:
+            _profile.reset(token)
+
+        self.report_profile(request, response, timer, profiler)
+        return response
+
+    def report_profile(self, request, response, timer, profiler=None):
+        total = timer.elapsed()
+        if 'header' in PROFILING_OUTPUT:
+            response['Server-Timing'] = timer.to_server_timing(total)
+
+        dump_path = None
+        if profiler is not None:
+            os.makedirs(PROFILING_DUMP_DIR, exist_ok=True)
+            dump_path = get_dump_path(request, self)
+            profiler.dump_stats(dump_path)
+
+        if 'log' in PROFILING_OUTPUT:
+            logger.info(json.dumps({
+                'view': type(self).__name__,
+                'method': request.method,
+                'path': request.path,
+                'status': response.status_code,
+                'total_ms': round(total * 1000, 3),
+                'stages': timer.to_dict(),
+                'profile': dump_path,
+            }))
@@ -0,0 +1,242 @@
+# Python
+import asyncio
+import json
+import logging
+import threading
+
+# Django
+from django.db import transaction
+from django.db.models import signals
+from django.utils import translation
+from django.utils.module_loading import import_string
+
+# App
+from .routers import use_primary
+from .settings import LANGUAGES, DEFAULT_LANGUAGE, PUSH_BROKER, PUSH_BROKER_OPTIONS
+
+# Variables
+logger = logging.getLogger(__name__)
+_broker = None
+_broker_lock = threading.Lock()
+
+
+# Brokers
+class Subscription:
+    """
+    한 구독자의 메시지 대기열입니다. async for 로 메시지를 받습니다.
+    """
+
+    def __init__(self, broker, channels, max_size=100):
+        self.broker = broker
+        self.channels = channels
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(maxsize=max_size)
+
+    def put(self, message):
+        # 느린 구독자 때문에 메모리가 늘어나지 않도록 가득 차면 가장 오래된 메시지를 버립니다.
+        if self.queue.full():
+            self.queue.get_nowait()
+        self.queue.put_nowait(message)
+
+    async def get(self):
+        return await self.queue.get()
+
+    def close(self):
+        self.broker.unsubscribe(self)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        return await self.get()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
+
+
+class BaseBroker:
+    """
+    렌더링된 메시지를 채널별 구독자에게 전달하는 broker의 인터페이스입니다.
+
+    publish()는 DB 트랜잭션 commit 이후 동기 코드에서 호출되고, subscribe()는 ASGI 이벤트 루프에서 호출됩니다.
+    여러 프로세스에 배포한다면 Redis pub/sub 등을 사용하는 broker를 구현하여 DYNAMIC_CONTENTS_PUSH_BROKER로 지정합니다.
+    """
+
+    def publish(self, channel, message):
+        raise NotImplementedError
+
+    def subscribe(self, channels):
+        raise NotImplementedError
+
+    def unsubscribe(self, subscription):
+        raise NotImplementedError
+
+
+class InMemoryBroker(BaseBroker):
+    """
+    같은 프로세스의 구독자에게만 전달하는 기본 broker 입니다.
+    """
+
+    def __init__(self, max_queue_size=100):
+        self.max_queue_size = max_queue_size
+        self.subscribers = {}
+        self.lock = threading.Lock()
+
+    def publish(self, channel, message):
+        with self.lock:
+            subscribers = list(self.subscribers.get(channel, ()))
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.put, message)
+            except RuntimeError:
+                # 이벤트 루프가 이미 종료된 구독자입니다.
+                self.unsubscribe(subscription)
+        return len(subscribers)
+
+    def subscribe(self, channels):
+        subscription = Subscription(self, list(channels), max_size=self.max_queue_size)
+        with self.lock:
+            for channel in subscription.channels:
+                self.subscribers.setdefault(channel, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self.lock:
+            for channel in subscription.channels:
+                subscribers = self.subscribers.get(channel)
+                if subscribers is not None:
+                    subscribers.discard(subscription)
+                    if not subscribers:
+                        del self.subscribers[channel]
+
+
+def get_broker():
+    global _broker
+    if _broker is None:
+        with _broker_lock:
+            if _broker is None:
+                _broker = import_string(PUSH_BROKER)(**PUSH_BROKER_OPTIONS)
+    return _broker
+
+
+def get_language_channel(channel, language):
+    return f'{channel}/{language}'
+
+
+def get_push_languages():
+    return [code for code, name in LANGUAGES or []] or [DEFAULT_LANGUAGE or translation.get_language()]
+
+
+# Rendering
+def render_push_messages(instance, event):
+    """
+    DynamicContent를 언어마다 한 번씩 렌더링하여 {언어: JSON 문자열}을 반환합니다.
+    같은 문자열을 해당 언어의 모든 채널과 구독자에게 그대로 보냅니다.
+    """
+    messages = {}
+    for language in get_push_languages():
+        with translation.override(language):
+            messages[language] = json.dumps({
+                'event': event,
+                'model': instance._meta.label,
+                'id': instance.pk,
+                'language': language,
+                'text': instance.get_text(),
+                'i18n': instance.get_i18n(),
+                'html': str(instance.get_html()),
+            }, ensure_ascii=False, default=str)
+    return messages
+
+
+def push_dynamic_content(model, pk, event):
+    # commit 직후 replica에는 아직 반영되지 않았을 수 있으므로 쓰기 DB에서 읽습니다.
+    with use_primary():
+        instance = model._default_manager.select_related('format').filter(pk=pk).first()
+        if instance is None:
+            return
+        # 언어마다 Part를 다시 조회하지 않도록 한 번만 가져옵니다.
+        parts, totals = instance.get_render_parts()
+        instance.prefetched_parts, instance.part_totals = list(parts), totals
+        messages = render_push_messages(instance, event)
+
+    broker = get_broker()
+    for channel in instance.get_push_channels():
+        for language, message in messages.items():
+            broker.publish(get_language_channel(channel, language), message)
+
+
+# Signals
+def get_pending_pushes(using):
+    """
+    현재 트랜잭션에서 commit 후 push 하도록 예약된 (model, pk) 집합을 반환합니다.
+
+    Django는 commit, rollback, savepoint rollback 때 on_commit 목록을 새 list로 교체합니다.
+    목록이 바뀌었다면 남아 있는 push 콜백으로 집합을 다시 만들므로, savepoint rollback 뒤에도
+    바깥 트랜잭션에서 이미 예약한 항목은 다시 예약하지 않습니다.
+    """
+    connection = transaction.get_connection(using)
+    state = getattr(connection, 'dynamic_contents_pushes', None)
+    if state is None or state[0] is not connection.run_on_commit:
+        keys = {getattr(entry[1], 'dynamic_contents_push_key', None) for entry in connection.run_on_commit}
+        keys.discard(None)
+        state = (connection.run_on_commit, keys)
+        connection.dynamic_contents_pushes = state
+    return state[1]
+
+
+def schedule_push(model, pk, event, using):
+    """
+    트랜잭션 commit 후 한 번만 push 하도록 예약합니다. 같은 트랜잭션의 생성, 저장, parts 변경은 하나로 합쳐집니다.
+    """
+    key = (model, pk)
+    pending = get_pending_pushes(using)
+    if key in pending:
+        return
+    pending.add(key)
+
+    def push():
+        pending.discard(key)
+        try:
+            push_dynamic_content(model, pk, event)
+        except Exception:
+            logger.exception(f'Failed to push {model._meta.label}({pk})')
+
+    push.dynamic_contents_push_key = key
+    transaction.on_commit(push, using=using)
+
+
+def dynamic_content_saved(sender, instance, created, raw=False, using=None, **kwargs):
+    if not raw:
+        schedule_push(sender, instance.pk, 'created' if created else 'updated', using)
+
+
+def dynamic_content_parts_changed(sender, instance, action, reverse, model, pk_set, using=None, **kwargs):
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+
+    if not reverse:
+        schedule_push(type(instance), instance.pk, 'updated', using)
+        return
+
+    # part.notification_set.add(...) 처럼 Part 쪽에서 변경한 경우
+    if pk_set:
+        for pk in pk_set:
+            schedule_push(model, pk, 'updated', using)
+
+
+def connect_push_signals():
+    """
+    모든 DynamicContentModelMixin 모델의 저장과 parts 변경에 push를 연결합니다.
+    """
+    from .models import get_dynamic_content_models
+
+    for model in get_dynamic_content_models():
+        signals.post_save.connect(dynamic_content_saved, sender=model, dispatch_uid=f'dynamic_contents_push_{model._meta.label}')
+        signals.m2m_changed.connect(
+            dynamic_content_parts_changed,
+            sender=model._meta.get_field('parts').remote_field.through,
+            dispatch_uid=f'dynamic_contents_push_parts_{model._meta.label}',
+        )
@@ -0,0 +1,148 @@
+# Python
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# Django
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, router
+
+# Variables
+_pinned_until = ContextVar('dynamic_contents_pinned_until', default=0.0)
+_wrote = ContextVar('dynamic_contents_wrote', default=False)
+
+
+# 테스트에서 override_settings를 사용할 수 있도록 설정은 호출할 때마다 읽습니다.
+def get_write_database():
+    return getattr(settings, 'DYNAMIC_CONTENTS_WRITE_DATABASE', DEFAULT_DB_ALIAS)
+
+
+def get_read_databases():
+    return list(getattr(settings, 'DYNAMIC_CONTENTS_READ_DATABASES', []))
+
+
+def get_sticky_seconds():
+    return getattr(settings, 'DYNAMIC_CONTENTS_STICKY_SECONDS', 5)
+
+
+def pin_primary(seconds=None):
+    """
+    지금부터 seconds 동안 현재 context의 읽기를 쓰기 DB로 보냅니다 (read-your-writes).
+    """
+    seconds = get_sticky_seconds() if seconds is None else seconds
+    _pinned_until.set(max(_pinned_until.get(), time.monotonic() + seconds))
+
+
+def is_pinned():
+    return time.monotonic() < _pinned_until.get()
+
+
+def reset_pin():
+    _pinned_until.set(0.0)
+    _wrote.set(False)
+
+
+@contextmanager
+def use_primary():
+    """
+    with 블록 안의 읽기를 항상 쓰기 DB로 보냅니다.
+    """
+    token = _pinned_until.set(float('inf'))
+    try:
+        yield
+    finally:
+        _pinned_until.reset(token)
+
+
+def get_read_database():
+    """
+    렌더링용 읽기에 사용할 DB alias를 반환합니다. 최근에 쓰기가 있었거나 replica가 없으면 쓰기 DB를 사용합니다.
+    """
+    read_databases = get_read_databases()
+    if not read_databases or is_pinned():
+        return get_write_database()
+    return random.choice(read_databases)
+
+
+def get_queryset_write_database(queryset):
+    """
+    queryset으로 쓰기 작업을 할 DB alias를 반환합니다.
+    using()으로 지정하지 않았다면 QuerySet.delete()처럼 읽기 DB가 아닌 router.db_for_write()를 따릅니다.
+    """
+    return queryset._db or router.db_for_write(queryset.model, **queryset._hints)
+
+
+def is_dynamic_contents_model(model):
+    # DynamicContentModelMixin 모델의 parts 중간 테이블도 소유 모델과 같이 취급합니다.
+    owner = model._meta.auto_created or model
+    if owner._meta.app_label == 'dynamic_contents':
+        return True
+
+    from .models import DynamicContentModelMixin
+    return issubclass(owner, DynamicContentModelMixin)
+
+
+class DynamicContentsRouter:
+    """
+    Format, Part, DynamicContentModelMixin 모델의 읽기를 DYNAMIC_CONTENTS_READ_DATABASES로,
+    쓰기를 DYNAMIC_CONTENTS_WRITE_DATABASE로 보내는 DB router 입니다.
+
+    쓰기가 발생하면 DYNAMIC_CONTENTS_STICKY_SECONDS 동안 같은 context의 읽기는 쓰기 DB를 사용합니다.
+    요청 간에도 유지하려면 ReadYourWritesMiddleware를 함께 사용합니다.
+    """
+
+    def db_for_read(self, model, **hints):
+        if not is_dynamic_contents_model(model):
+            return None
+        if is_pinned():
+            return get_write_database()
+
+        # 이미 읽어온 객체의 관계 조회는 같은 DB에서 수행합니다.
+        instance = hints.get('instance')
+        if instance is not None and instance._state.db:
+            return instance._state.db
+        return get_read_database()
+
+    def db_for_write(self, model, **hints):
+        if not is_dynamic_contents_model(model):
+            return None
+        _wrote.set(True)
+        pin_primary()
+        return get_write_database()
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {get_write_database(), *get_read_databases()}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            if is_dynamic_contents_model(type(obj1)) or is_dynamic_contents_model(type(obj2)):
+                return True
+        return None
+
+
+class ReadYourWritesMiddleware:
+    """
+    요청 중에 쓰기가 있었다면 cookie를 남겨, 이후 요청의 읽기도 잠시 쓰기 DB로 보냅니다.
+    """
+    cookie_name = 'dynamic_contents_pin'
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        # thread가 재사용되므로 요청마다 상태를 초기화합니다.
+        pinned_token = _pinned_until.set(0.0)
+        wrote_token = _wrote.set(False)
+        try:
+            if request.COOKIES.get(self.cookie_name):
+                pin_primary()
+
+            response = self.get_response(request)
+
+            if _wrote.get():
+                response.set_cookie(
+                    self.cookie_name, '1', max_age=get_sticky_seconds(), httponly=True, samesite='Lax'
+                )
+            return response
+        finally:
+            _pinned_until.reset(pinned_token)
+            _wrote.reset(wrote_token)
@@ -0,0 +1,66 @@
+# Python
+import copy
+from collections.abc import Mapping
+
+
+class LazySwaggerAutoSchema(Mapping):
+    """
+    drf_yasg의 swagger_auto_schema 인자를 스키마를 생성할 때 처음 만듭니다.
+
+    drf_yasg는 view 메서드의 _swagger_auto_schema 속성을 `in`, 인덱싱, deepcopy 로만
+    읽기 때문에, 그 시점까지 drf_yasg와 openapi 모듈을 import 하지 않아도 됩니다.
+    """
+
+    def __init__(self, factory):
+        self.factory = factory
+        self.data = None
+
+    def resolve(self):
+        if self.data is None:
+            from drf_yasg.utils import swagger_auto_schema
+
+            def probe():
+                pass
+
+            swagger_auto_schema(**self.factory())(probe)
+            self.data = getattr(probe, '_swagger_auto_schema', {})
+        return self.data
+
+    def __getitem__(self, key):
+        return self.resolve()[key]
+
+    def __iter__(self):
+        return iter(self.resolve())
+
+    def __len__(self):
+        return len(self.resolve())
+
+    def __deepcopy__(self, memo):
+        return copy.deepcopy(self.resolve(), memo)
+
+
+def lazy_swagger_auto_schema(factory):
+    """
+    swagger_auto_schema와 같지만 인자를 만드는 factory를 받아 스키마 생성 시점에 호출합니다.
+
+        @lazy_swagger_auto_schema(lambda: {'responses': {200: openapi.Response('...')}})
+    """
+
+    def decorator(view_method):
+        view_method._swagger_auto_schema = LazySwaggerAutoSchema(factory)
+        return view_method
+
+    return decorator
+
+
+def swagger_serializer_method(serializer_or_field):
+    """
+    drf_yasg.utils.swagger_serializer_method와 같은 역할을 drf_yasg import 없이 수행합니다.
+    """
+
+    def decorator(serializer_method):
+        # SerializerMethodFieldInspector가 찾는 속성입니다.
+        serializer_method._swagger_serializer = serializer_or_field
+        return serializer_method
+
+    return decorator
@@ -4,11 +4,10 @@ from django.utils.translation import get_language
 # DRF
 from rest_framework import serializers
 
-# Third Party
-from drf_yasg.utils import swagger_serializer_method
-
 # App
 from .models import Format, Part
+from .profiling import profile_stage
+from .schema import swagger_serializer_method
 from .utils import generate_text, generate_html, generate_i18n
 
 
@@ -35,6 +34,7 @@ class PartSerializer(serializers.ModelSerializer):
         model = Part
         fields = ['id', 'field', 'content', 'link', 'instance_id']
 
+    @profile_stage('part_serializer')
     def to_representation(self, instance):
         # Part 객체를 필드 이름을 키로 사용하는 사전으로 변환
         return {
@@ -46,19 +46,36 @@ class PartSerializer(serializers.ModelSerializer):
         }
 
 
+def get_render_parts(instance):
+    """
+    렌더링에 사용할 (parts, totals)를 반환합니다. totals는 part 목록이 잘린 경우의 field별 전체 수입니다.
+    """
+    if isinstance(instance.parts, list):
+        return instance.parts, getattr(instance, 'part_totals', None)
+    if hasattr(instance, 'get_render_parts'):
+        return instance.get_render_parts()
+    return getattr(instance, "prefetched_parts", instance.parts.all()), None
+
+
 class DynamicContentSerializerMixin(serializers.Serializer):
     format = FormatSerializer(read_only=True)
     parts = serializers.SerializerMethodField()
 
     @swagger_serializer_method(PartSerializer(many=True, read_only=True))
     def get_parts(self, obj):
-        if isinstance(obj.parts, list):
-            parts = obj.parts
-        else:
-            parts = getattr(obj, "prefetched_parts", obj.parts.all())
+        parts, totals = get_render_parts(obj)
         return PartSerializer(parts, many=True).data
 
+    @profile_stage('dynamic_content_serializer')
     def to_representation(self, instance):
+        if getattr(instance, 'is_archived', False):
+            return self.to_archived_representation(instance)
+
+        instance_parts, part_totals = get_render_parts(instance)
+        if part_totals is not None and not isinstance(instance.parts, list):
+            # get_parts()에서 Part를 다시 조회하지 않도록 잘린 목록을 보관합니다.
+            instance.prefetched_parts, instance.part_totals = instance_parts, part_totals
+
         representation = super().to_representation(instance)
 
         parts_dict = {}
@@ -72,15 +89,43 @@ class DynamicContentSerializerMixin(serializers.Serializer):
                     parts_dict[field].append(part_info)  # 이미 존재하는 field라면 배열에 추가
 
         representation["parts"] = parts_dict
+        if part_totals is not None:
+            representation["part_totals"] = part_totals
 
-        if isinstance(instance.parts, list):
-            instance_parts = instance.parts
-        else:
-            instance_parts = getattr(instance, "prefetched_parts", instance.parts.all())
-
-        representation["content_text"] = generate_text(instance.format, instance_parts)
-        representation["content_i18n"] = generate_i18n(instance.format, instance_parts)
-        representation["content_html"] = generate_html(instance.format, instance_parts)
+        representation["content_text"] = generate_text(instance.format, instance_parts, part_totals)
+        representation["content_i18n"] = generate_i18n(instance.format, instance_parts, part_totals)
+        representation["content_html"] = generate_html(instance.format, instance_parts, part_totals)
 
         return representation
 
+    @staticmethod
+    def to_archived_representation(instance):
+        """
+        ArchivedDynamicContent를 보관 전과 같은 형태로 변환합니다.
+        """
+        language = get_language()
+
+        def translate(values):
+            values = values or {}
+            return values.get(language) or next(iter(values.values()), None)
+
+        format_data = instance.get_format_data()
+        if format_data is not None:
+            format_data = dict(format_data, content=translate(format_data['content']))
+
+        parts_dict = {}
+        for part in instance.get_parts_data():
+            parts_dict.setdefault(part['field'], []).append({
+                'content': translate(part['content']),
+                'link': part['link'],
+                'instance_id': part['instance_id'],
+            })
+
+        rendered = instance.get_rendered(language)
+        return {
+            'format': format_data,
+            'parts': parts_dict,
+            'content_text': rendered['text'],
+            'content_i18n': rendered['i18n'],
+            'content_html': rendered['html'],
+        }
@@ -2,4 +2,33 @@
 from django.conf import settings
 
 # Variables
-LANGUAGES = getattr(settings, "LANGUAGES", None)
\ No newline at end of file
+LANGUAGES = getattr(settings, "LANGUAGES", None)
+DEFAULT_LANGUAGE = getattr(settings, "MODELTRANSLATION_DEFAULT_LANGUAGE", None)
+
+# Tasks
+TASK_BACKEND = getattr(settings, "DYNAMIC_CONTENTS_TASK_BACKEND", "dynamic_contents.tasks.ThreadPoolTaskBackend")
+TASK_BACKEND_OPTIONS = getattr(settings, "DYNAMIC_CONTENTS_TASK_BACKEND_OPTIONS", {})
+
+# Archive
+ARCHIVE_AFTER_DAYS = getattr(settings, "DYNAMIC_CONTENTS_ARCHIVE_AFTER_DAYS", 90)
+ARCHIVE_DATE_FIELD = getattr(settings, "DYNAMIC_CONTENTS_ARCHIVE_DATE_FIELD", "created_at")
+
+# Templates
+TEMPLATE_ENGINE = getattr(settings, "DYNAMIC_CONTENTS_TEMPLATE_ENGINE", "dynamic_contents.engine.MessageFormatEngine")
+LIST_JOINERS = getattr(settings, "DYNAMIC_CONTENTS_LIST_JOINERS", {})
+
+# Rendering
+PART_LIMIT = getattr(settings, "DYNAMIC_CONTENTS_PART_LIMIT", None)
+
+# Profiling
+PROFILING = getattr(settings, "DYNAMIC_CONTENTS_PROFILING", False)
+PROFILING_SAMPLE_RATE = getattr(settings, "DYNAMIC_CONTENTS_PROFILING_SAMPLE_RATE", 1.0)
+PROFILING_OUTPUT = getattr(settings, "DYNAMIC_CONTENTS_PROFILING_OUTPUT", ("header", "log"))
+PROFILING_DUMP_DIR = getattr(settings, "DYNAMIC_CONTENTS_PROFILING_DUMP_DIR", None)
+PROFILING_DUMP_RATE = getattr(settings, "DYNAMIC_CONTENTS_PROFILING_DUMP_RATE", 0.0)
+
+# Push
+PUSH = getattr(settings, "DYNAMIC_CONTENTS_PUSH", False)
+PUSH_BROKER = getattr(settings, "DYNAMIC_CONTENTS_PUSH_BROKER", "dynamic_contents.push.InMemoryBroker")
+PUSH_BROKER_OPTIONS = getattr(settings, "DYNAMIC_CONTENTS_PUSH_BROKER_OPTIONS", {})
+PUSH_PATH = getattr(settings, "DYNAMIC_CONTENTS_PUSH_PATH", "/dynamic-contents/stream/")
@@ -0,0 +1,335 @@
+# Python
+import json
+import logging
+import threading
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor, wait
+
+# Django
+from django.apps import apps
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import close_old_connections, connections, transaction
+from django.utils import translation
+from django.utils.module_loading import import_string
+
+# App
+from .routers import use_primary
+from .settings import LANGUAGES, TASK_BACKEND, TASK_BACKEND_OPTIONS
+from .utils import html_renderer
+
+# Variables
+logger = logging.getLogger(__name__)
+_backend = None
+_backend_lock = threading.Lock()
+
+
+# Jobs
+class Job:
+    """
+    백그라운드에서 실행할 작업입니다.
+
+    func는 외부 큐로도 전달할 수 있도록 모듈 수준 함수여야 하고, args/kwargs는
+    JSON으로 직렬화 가능한 값이어야 합니다. 같은 key를 가진 작업이 아직 실행되지
+    않은 채 대기 중이면 나중에 들어온 작업 하나로 합쳐집니다.
+    """
+
+    def __init__(self, func, args=(), kwargs=None, key=None):
+        self.func = func
+        self.args = tuple(args)
+        self.kwargs = kwargs or {}
+        self.key = key
+
+    def __repr__(self):
+        return '{}({}, key={!r})'.format(self.__class__.__name__, self.func.__name__, self.key)
+
+    def run(self):
+        return self.func(*self.args, **self.kwargs)
+
+    def to_message(self):
+        return {
+            'func': f'{self.func.__module__}.{self.func.__qualname__}',
+            'args': list(self.args),
+            'kwargs': self.kwargs,
+            'key': list(self.key) if isinstance(self.key, tuple) else self.key,
+        }
+
+    @classmethod
+    def from_message(cls, message):
+        key = message.get('key')
+        return cls(
+            import_string(message['func']),
+            args=message.get('args', ()),
+            kwargs=message.get('kwargs'),
+            key=tuple(key) if isinstance(key, list) else key,
+        )
+
+
+def run_job_message(message):
+    """
+    외부 큐의 worker에서 Job.to_message()로 전달된 작업을 실행합니다.
+    """
+    return Job.from_message(message).run()
+
+
+class JobBatch:
+    """
+    submit()으로 제출한 작업들의 완료 상태를 확인합니다.
+    """
+
+    def __init__(self, futures):
+        self.futures = futures
+
+    def __len__(self):
+        return len(self.futures)
+
+    def done(self):
+        return all(future.done() for future in self.futures)
+
+    def wait(self, timeout=None):
+        done, not_done = wait(self.futures, timeout=timeout)
+        return not not_done
+
+    def results(self, timeout=None):
+        return [future.result(timeout=timeout) for future in self.futures]
+
+    def add_done_callback(self, callback):
+        """
+        모든 작업이 끝나면 callback(batch)를 한 번 호출합니다.
+        """
+        remaining = [len(set(self.futures))]
+        lock = threading.Lock()
+
+        def on_done(future):
+            with lock:
+                remaining[0] -= 1
+                finished = remaining[0] == 0
+            if finished:
+                callback(self)
+
+        if not self.futures:
+            callback(self)
+        for future in set(self.futures):
+            future.add_done_callback(on_done)
+
+
+# Backends
+class BaseTaskBackend:
+    """
+    작업 실행 방식을 정의하는 backend의 기본 클래스입니다.
+    """
+    # 작업이 제출한 프로세스 안에서 실행되는지 여부. 프로세스 메모리 캐시를 채울지 결정할 때 사용합니다.
+    in_process = False
+
+    def submit(self, jobs):
+        """
+        작업 목록을 제출하고 JobBatch를 반환합니다. 같은 key의 작업은 합쳐지므로
+        합쳐진 작업들은 같은 Future를 공유합니다.
+        """
+        raise NotImplementedError
+
+
+class ThreadPoolTaskBackend(BaseTaskBackend):
+    """
+    프로세스 내부의 thread pool에서 작업을 실행합니다.
+    """
+    in_process = True
+
+    def __init__(self, max_workers=4):
+        self.max_workers = max_workers
+        self.executor = None
+        self.pending = {}
+        self.lock = threading.Lock()
+
+    def get_executor(self):
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='dynamic_contents')
+        return self.executor
+
+    def submit(self, jobs):
+        futures = []
+        with self.lock:
+            executor = self.get_executor()
+            for job in jobs:
+                if job.key is not None and job.key in self.pending:
+                    # 아직 실행되지 않은 같은 key의 작업을 최신 작업으로 교체합니다.
+                    entry = self.pending[job.key]
+                    entry[0] = job
+                    futures.append(entry[1])
+                    continue
+
+                future = Future()
+                entry = [job, future]
+                if job.key is not None:
+                    self.pending[job.key] = entry
+                executor.submit(self.run_entry, entry)
+                futures.append(future)
+        return JobBatch(futures)
+
+    def run_entry(self, entry):
+        with self.lock:
+            job, future = entry
+            if job.key is not None and self.pending.get(job.key) is entry:
+                del self.pending[job.key]
+
+        if not future.set_running_or_notify_cancel():
+            return
+
+        close_old_connections()
+        try:
+            future.set_result(job.run())
+        except BaseException as exc:
+            logger.exception(f"Background job {job!r} failed")
+            future.set_exception(exc)
+        finally:
+            connections.close_all()
+
+    def shutdown(self, wait=True):
+        with self.lock:
+            executor, self.executor = self.executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+class QueueTaskBackend(BaseTaskBackend):
+    """
+    Celery, RQ 같은 외부 큐를 위한 adapter 입니다.
+
+    하위 클래스는 enqueue(message)만 구현하면 되며, worker에서는
+    run_job_message(message)를 호출하면 됩니다. 반환되는 Future에는 enqueue의
+    반환값(예: AsyncResult)이 담깁니다. 같은 batch 안의 중복 작업은 제출 전에 합쳐집니다.
+    """
+
+    def enqueue(self, message):
+        raise NotImplementedError
+
+    def submit(self, jobs):
+        coalesced = coalesce_jobs(jobs)
+
+        futures = {}
+        for job in coalesced:
+            future = Future()
+            future.set_running_or_notify_cancel()
+            try:
+                future.set_result(self.enqueue(job.to_message()))
+            except Exception as exc:
+                future.set_exception(exc)
+            futures[id(job)] = future
+
+        # 합쳐진 작업들은 남은 작업의 Future를 공유합니다.
+        keyed_futures = {job.key: futures[id(job)] for job in coalesced if job.key is not None}
+        return JobBatch([
+            keyed_futures[job.key] if job.key is not None else futures[id(job)]
+            for job in jobs
+        ])
+
+
+def coalesce_jobs(jobs):
+    """
+    같은 key의 작업은 처음 등장한 위치에 마지막 작업 하나만 남깁니다.
+    """
+    coalesced = []
+    positions = {}
+    for job in jobs:
+        if job.key is None:
+            coalesced.append(job)
+        elif job.key in positions:
+            coalesced[positions[job.key]] = job
+        else:
+            positions[job.key] = len(coalesced)
+            coalesced.append(job)
+    return coalesced
+
+
+def get_task_backend():
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            _backend = import_string(TASK_BACKEND)(**TASK_BACKEND_OPTIONS)
+        return _backend
+
+
+def copy_future_state(source, destination):
+    if not destination.set_running_or_notify_cancel():
+        return
+    if source.cancelled():
+        destination.set_exception(CancelledError())
+    elif source.exception() is not None:
+        destination.set_exception(source.exception())
+    else:
+        destination.set_result(source.result())
+
+
+def submit_jobs(jobs, using=None):
+    """
+    작업을 using DB의 트랜잭션이 commit된 뒤에 제출합니다. 트랜잭션 밖이라면 바로 제출합니다.
+
+    작업은 다른 thread나 worker에서 새 연결로 실행되므로, commit 전에 제출하면 아직 보이지 않는
+    행을 조회하게 됩니다. 트랜잭션이 rollback 되면 작업은 제출되지 않고 JobBatch도 완료되지 않습니다.
+    """
+    jobs = list(jobs)
+    if not transaction.get_connection(using).in_atomic_block:
+        return get_task_backend().submit(jobs)
+
+    futures = [Future() for job in jobs]
+
+    def submit():
+        try:
+            batch = get_task_backend().submit(jobs)
+        except Exception as exc:
+            logger.exception("Failed to submit background jobs")
+            for future in futures:
+                future.set_running_or_notify_cancel()
+                future.set_exception(exc)
+            return
+        for source, destination in zip(batch.futures, futures):
+            source.add_done_callback(lambda source, destination=destination: copy_future_state(source, destination))
+
+    transaction.on_commit(submit, using=using)
+    return JobBatch(futures)
+
+
+# Dynamic content jobs
+def get_dynamic_content_model(model_label):
+    return apps.get_model(model_label)
+
+
+def get_format(model, format_id):
+    if format_id is None:
+        return None
+    return model._meta.get_field('format').related_model._default_manager.get(pk=format_id)
+
+
+# 작업은 방금 commit된 행을 다루므로 복제가 늦은 replica 대신 쓰기 DB에서 읽습니다.
+def create_dynamic_content_job(model_label, format_id, part_ids):
+    model = get_dynamic_content_model(model_label)
+    with use_primary():
+        dynamic_content = model._default_manager.create_dynamic_content(get_format(model, format_id), part_ids)
+    return dynamic_content.pk
+
+
+def update_dynamic_content_job(model_label, pk, format_id, part_ids):
+    model = get_dynamic_content_model(model_label)
+    with use_primary():
+        dynamic_content = model._default_manager.get(pk=pk)
+        model._default_manager.update_dynamic_content(dynamic_content, get_format(model, format_id), part_ids)
+    return pk
+
+
+def rerender_dynamic_content_job(model_label, pk):
+    """
+    missing_placeholders를 다시 계산합니다. 작업이 같은 프로세스에서 실행될 때만(ThreadPoolTaskBackend)
+    언어별 HTML 조각 캐시를 미리 채웁니다. 외부 worker의 캐시는 웹 프로세스에서 사용되지 않습니다.
+    """
+    model = get_dynamic_content_model(model_label)
+    with use_primary():
+        dynamic_content = model._default_manager.select_related('format').get(pk=pk)
+        parts = list(dynamic_content.parts.all())
+
+        missing = dynamic_content.get_missing_placeholders(parts)
+        dynamic_content.missing_placeholders = json.dumps(missing, cls=DjangoJSONEncoder)
+        model._default_manager.filter(pk=pk).update(missing_placeholders=dynamic_content.missing_placeholders)
+
+    if get_task_backend().in_process:
+        for language, name in LANGUAGES or []:
+            with translation.override(language):
+                html_renderer.render(dynamic_content.format, parts)
+    return pk
@@ -0,0 +1,7 @@
+from django.apps import AppConfig
+
+
+class DynamicContentTestsAppConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'dynamic_contents.tests'
+    label = 'dynamic_contents_tests'
@@ -0,0 +1,33 @@
+from django.test import TestCase
+from django.utils import translation
+
+from dynamic_contents.models import Format, Part
+from dynamic_contents.tests.models import Notification
+
+
+class DynamicContentTestCase(TestCase):
+    """
+    DB를 사용하는 테스트의 공통 fixture 입니다.
+
+    setUp에서 "{{user}} liked {{post}}." Format(self.format)을 만들며, Format과 Part는
+    기본 언어(en) 컬럼에 저장합니다. DynamicContent 모델로는 Notification을 사용합니다.
+    """
+    model = Notification
+
+    def setUp(self):
+        super().setUp()
+        self.format = self.create_format('LIKE', '{{user}} liked {{post}}.')
+
+    def create_format(self, subtype, content, type='ALARM'):
+        with translation.override('en'):
+            return Format.objects.create(type=type, subtype=subtype, content=content)
+
+    def create_part(self, field, content, **kwargs):
+        with translation.override('en'):
+            return Part.objects.create(field=field, content=content, **kwargs)
+
+    def create_users(self, *names):
+        return [self.create_part('user', name) for name in names]
+
+    def create_content(self, parts=(), format=None):
+        return self.model.objects.create_dynamic_content(format or self.format, list(parts))
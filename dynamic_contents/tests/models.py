@@ -0,0 +1,19 @@
+from django.db import models
+
+from dynamic_contents.models import DynamicContentManagerMixin, DynamicContentModelMixin, DynamicContentQuerySet
+
+
+class NotificationManager(DynamicContentManagerMixin, models.Manager.from_queryset(DynamicContentQuerySet)):
+    pass
+
+
+class Notification(DynamicContentModelMixin):
+    """
+    테스트용 DynamicContent 모델입니다. config.test_settings 에서만 INSTALLED_APPS에 추가됩니다.
+    """
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    objects = NotificationManager()
+
+    class Meta:
+        ordering = ['-created_at']
@@ -0,0 +1,98 @@
+from datetime import timedelta
+
+from django.utils import timezone, translation
+from rest_framework import mixins
+from rest_framework.test import APIRequestFactory
+from rest_framework.viewsets import GenericViewSet
+
+from dynamic_contents.archive import archive_dynamic_contents
+from dynamic_contents.models import ArchivedDynamicContent, Part
+from dynamic_contents.serializers import DynamicContentSerializerMixin
+from dynamic_contents.tests.base import DynamicContentTestCase
+from dynamic_contents.tests.models import Notification
+from dynamic_contents.views import ArchiveFallbackMixin
+
+
+class NotificationViewSet(ArchiveFallbackMixin, mixins.RetrieveModelMixin, GenericViewSet):
+    queryset = Notification.objects.all()
+    serializer_class = DynamicContentSerializerMixin
+
+
+class TestArchive(DynamicContentTestCase):
+    def setUp(self):
+        super().setUp()
+        self.post = self.create_part('post', 'Python', link='https://example.com/posts/1')
+        self.users = self.create_users('Alice', 'Bob', 'Chloe')
+        self.contents = [self.create_content([user, self.post]) for user in self.users]
+
+    def make_old(self, *contents):
+        Notification.objects.filter(pk__in=[content.pk for content in contents]).update(
+            created_at=timezone.now() - timedelta(days=100)
+        )
+
+    def test_archive_in_batches(self):
+        self.make_old(*self.contents)
+
+        self.assertEqual(archive_dynamic_contents(Notification.objects.all(), days=90, batch_size=2, languages=['en']), 3)
+
+        self.assertFalse(Notification.objects.exists())
+        # 보관된 콘텐츠만 참조하던 Part는 함께 삭제됩니다.
+        self.assertFalse(Part.objects.exists())
+        archived = ArchivedDynamicContent.objects.get(object_id=str(self.contents[0].pk))
+        self.assertEqual(archived.model_label, Notification._meta.label)
+        self.assertEqual(archived.get_rendered('en')['text'], 'Alice liked Python.')
+        self.assertEqual([part['field'] for part in archived.get_parts_data()], ['user', 'post'])
+
+    def test_archive_only_old_contents(self):
+        old, new, newer = self.contents
+        self.make_old(old)
+
+        self.assertEqual(archive_dynamic_contents(Notification.objects.all(), days=90, languages=['en']), 1)
+
+        self.assertEqual(set(Notification.objects.values_list('pk', flat=True)), {new.pk, newer.pk})
+        self.assertFalse(Part.objects.filter(pk=self.users[0].pk).exists())
+        self.assertTrue(Part.objects.filter(pk=self.post.pk).exists())
+
+    def test_get_with_archive(self):
+        old, new, newer = self.contents
+        self.make_old(old)
+        archive_dynamic_contents(Notification.objects.all(), days=90, languages=['en'])
+
+        with translation.override('en'):
+            archived = Notification.objects.get_with_archive(pk=old.pk)
+            self.assertTrue(archived.is_archived)
+            self.assertEqual(archived.get_text(), 'Alice liked Python.')
+            self.assertEqual(Notification.objects.get_with_archive(pk=new.pk), new)
+        with self.assertRaises(Notification.DoesNotExist):
+            Notification.objects.get_with_archive(pk=newer.pk + 1)
+
+        result = Notification.objects.in_bulk_with_archive([old.pk, new.pk, newer.pk + 1])
+        self.assertEqual(set(result), {old.pk, new.pk})
+        self.assertIsInstance(result[old.pk], ArchivedDynamicContent)
+        self.assertEqual(result[new.pk], new)
+
+    def test_serializer_archived_representation(self):
+        content = self.contents[0]
+        with translation.override('en'):
+            before = DynamicContentSerializerMixin(Notification.objects.get(pk=content.pk)).data
+
+        self.make_old(content)
+        archive_dynamic_contents(Notification.objects.all(), days=90, languages=['en'])
+
+        with translation.override('en'):
+            after = DynamicContentSerializerMixin(Notification.objects.get_with_archive(pk=content.pk)).data
+        self.assertEqual(after, before)
+
+    def test_api_detail_falls_back_to_archive(self):
+        old, new, newer = self.contents
+        self.make_old(old)
+        archive_dynamic_contents(Notification.objects.all(), days=90, languages=['en'])
+
+        view = NotificationViewSet.as_view({'get': 'retrieve'})
+        factory = APIRequestFactory()
+        with translation.override('en'):
+            response = view(factory.get('/'), pk=old.pk)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.data['content_text'], 'Alice liked Python.')
+            self.assertEqual(view(factory.get('/'), pk=new.pk).data['content_text'], 'Bob liked Python.')
+            self.assertEqual(view(factory.get('/'), pk=newer.pk + 1).status_code, 404)
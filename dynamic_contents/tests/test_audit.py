@@ -0,0 +1,45 @@
+from dynamic_contents.tests.base import DynamicContentTestCase
+from dynamic_contents.tests.models import Notification
+
+
+class TestMissingPlaceholders(DynamicContentTestCase):
+    def setUp(self):
+        super().setUp()
+        notice = self.create_format('NOTICE', 'Maintenance tonight.')
+        user, post = self.create_part('user', 'Alice'), self.create_part('post', 'Python')
+        self.complete = self.create_content([user, post])
+        self.incomplete = self.create_content([user])
+        self.plain = self.create_content(format=notice)
+
+    def test_annotation(self):
+        rows = {
+            row.pk: (row.placeholder_count, row.matched_placeholder_count, row.missing_placeholder_count)
+            for row in Notification.objects.with_missing_placeholders()
+        }
+        self.assertEqual(rows, {self.complete.pk: (2, 2, 0), self.incomplete.pk: (2, 1, 1), self.plain.pk: (0, 0, 0)})
+        self.assertEqual(list(Notification.objects.incomplete().values_list('pk', flat=True)), [self.incomplete.pk])
+
+    def test_report_and_repair(self):
+        # create_dynamic_content()는 missing_placeholders를 저장하지 않으므로 모두 다시 계산해야 합니다.
+        report = {row['format']: row for row in Notification.objects.missing_placeholder_report()}
+        self.assertEqual(
+            [(row['total'], row['incomplete'], row['missing'], row['count_mismatch']) for row in report.values()],
+            [(2, 1, 1, 2), (1, 0, 0, 1)],
+        )
+
+        self.assertEqual(Notification.objects.repair_missing_placeholders(dry_run=True), {'checked': 3, 'repaired': 3})
+        self.assertIsNone(Notification.objects.get(pk=self.incomplete.pk).missing_placeholders)
+
+        self.assertEqual(Notification.objects.repair_missing_placeholders(chunk_size=2), {'checked': 3, 'repaired': 3})
+        self.assertEqual(Notification.objects.get(pk=self.incomplete.pk).missing_placeholders, '["post"]')
+        self.assertEqual(Notification.objects.get(pk=self.complete.pk).missing_placeholders, '[]')
+        self.assertEqual(sum(row['count_mismatch'] for row in Notification.objects.missing_placeholder_report()), 0)
+        self.assertEqual(Notification.objects.repair_missing_placeholders(), {'checked': 3, 'repaired': 0})
+
+    def test_count_mismatch_only_compares_counts(self):
+        Notification.objects.repair_missing_placeholders()
+        Notification.objects.filter(pk=self.incomplete.pk).update(missing_placeholders='["user"]')
+
+        self.assertEqual(sum(row['count_mismatch'] for row in Notification.objects.missing_placeholder_report()), 0)
+        self.assertEqual(Notification.objects.repair_missing_placeholders(), {'checked': 3, 'repaired': 1})
+        self.assertEqual(Notification.objects.get(pk=self.incomplete.pk).missing_placeholders, '["post"]')
@@ -0,0 +1,117 @@
+import json
+import unittest
+from unittest import mock
+from datetime import datetime, timezone
+
+from django.test import TestCase
+from django.utils import translation
+
+from dynamic_contents.bundles import (
+    build_format_bundle, build_format_entry, datetime_to_version, parse_version, version_to_datetime,
+)
+from dynamic_contents.models import Format
+from dynamic_contents.utils import tokenize_content
+
+
+class MockFormat:
+    def __init__(self, id, **contents):
+        self.id = id
+        self.type = 'ALARM'
+        self.subtype = 'LIKE'
+        for language, content in contents.items():
+            setattr(self, f'content_{language}', content)
+
+
+class TestFormatBundle(unittest.TestCase):
+    def test_tokenize_content(self):
+        tokens = tokenize_content("{{user}} liked {{post}}.")
+        self.assertEqual(tokens, (('user',), ' liked ', ('post',), '.'))
+        self.assertEqual(json.dumps(tokens), '[["user"], " liked ", ["post"], "."]')
+
+    def test_build_format_entry(self):
+        format = MockFormat(1, en="{{user}} liked {{post}}.", ko="{{user}}님이 {{post}}를 좋아합니다.", zh_hans=None)
+        entry = build_format_entry(format, ['en', 'ko', 'zh-hans'])
+
+        self.assertEqual(set(entry['languages']), {'en', 'ko'})
+        self.assertEqual(entry['languages']['ko']['placeholders'], ['user', 'post'])
+        self.assertEqual(entry['languages']['en']['tokens'][1], ' liked ')
+        self.assertNotEqual(entry['languages']['en']['hash'], entry['languages']['ko']['hash'])
+
+    def test_version_round_trip(self):
+        value = datetime(2024, 2, 17, 4, 49, 1, 123456, tzinfo=timezone.utc)
+        self.assertEqual(version_to_datetime(datetime_to_version(value)), value)
+
+    def test_parse_version(self):
+        self.assertEqual(parse_version('1708145341123456-0a1b2c3d'), (1708145341123456, '0a1b2c3d'))
+        self.assertEqual(parse_version(1708145341123456), (1708145341123456, ''))
+        with self.assertRaises(ValueError):
+            parse_version('latest')
+
+
+class TestFormatBundleDelta(TestCase):
+    def create_format(self, subtype, content):
+        with translation.override('en'):
+            return Format.objects.create(type='ALARM', subtype=subtype, content=content)
+
+    def test_full_bundle(self):
+        like = self.create_format('LIKE', '{{user}} liked {{post}}.')
+        follow = self.create_format('FOLLOW', '{{user}} followed you.')
+
+        bundle = build_format_bundle(languages=['en'])
+        self.assertEqual([entry['id'] for entry in bundle['formats']], [like.id, follow.id])
+        timestamp, fingerprint = parse_version(bundle['version'])
+        self.assertEqual(timestamp, datetime_to_version(Format.objects.get(pk=follow.pk).updated_at))
+        self.assertTrue(fingerprint)
+        self.assertIsNone(bundle['ids'])
+
+    def test_delta_bundle(self):
+        like = self.create_format('LIKE', '{{user}} liked {{post}}.')
+        follow = self.create_format('FOLLOW', '{{user}} followed you.')
+        since = build_format_bundle(languages=['en'])['version']
+
+        with translation.override('en'):
+            like.content = '{{user}} loved {{post}}.'
+            like.save()
+        follow.delete()
+        comment = self.create_format('COMMENT', '{{user}} commented on {{post}}.')
+
+        bundle = build_format_bundle(since=since, languages=['en'])
+        self.assertEqual(bundle['since'], since)
+        self.assertGreater(parse_version(bundle['version'])[0], parse_version(since)[0])
+        self.assertEqual([entry['id'] for entry in bundle['formats']], [like.id, comment.id])
+        self.assertEqual(bundle['formats'][0]['languages']['en']['content'], '{{user}} loved {{post}}.')
+        # 삭제된 Format은 ids 목록에서 빠집니다.
+        self.assertEqual(bundle['ids'], [like.id, comment.id])
+
+    def test_delta_bundle_without_changes(self):
+        self.create_format('LIKE', '{{user}} liked {{post}}.')
+        since = build_format_bundle(languages=['en'])['version']
+
+        bundle = build_format_bundle(since=since, languages=['en'])
+        self.assertEqual(bundle['formats'], [])
+        self.assertEqual(bundle['version'], since)
+
+    def test_changed_joiners_return_full_bundle(self):
+        like = self.create_format('LIKE', '{{user}} liked {{post}}.')
+        since = build_format_bundle(languages=['en'])['version']
+
+        with mock.patch('dynamic_contents.engine.LIST_JOINERS', {'en': [', ', ' & ']}):
+            bundle = build_format_bundle(since=since, languages=['en'])
+
+        self.assertNotEqual(bundle['version'], since)
+        self.assertIsNone(bundle['since'])
+        self.assertIsNone(bundle['ids'])
+        self.assertEqual([entry['id'] for entry in bundle['formats']], [like.id])
+        self.assertEqual(bundle['joiners']['en'], [', ', ' & '])
+
+    def test_legacy_version_returns_full_bundle(self):
+        like = self.create_format('LIKE', '{{user}} liked {{post}}.')
+        timestamp = parse_version(build_format_bundle(languages=['en'])['version'])[0]
+
+        bundle = build_format_bundle(since=timestamp, languages=['en'])
+        self.assertIsNone(bundle['since'])
+        self.assertEqual([entry['id'] for entry in bundle['formats']], [like.id])
+
+
+if __name__ == '__main__':
+    unittest.main()
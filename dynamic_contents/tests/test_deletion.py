@@ -0,0 +1,69 @@
+from django.db.models import signals
+
+from dynamic_contents.audit import get_parts_through
+from dynamic_contents.deletion import can_raw_delete, get_orphan_parts, get_part_links
+from dynamic_contents.models import Part
+from dynamic_contents.tests.base import DynamicContentTestCase
+from dynamic_contents.tests.models import Notification
+
+
+class TestDeleteDynamicContents(DynamicContentTestCase):
+    def setUp(self):
+        super().setUp()
+        self.through = get_parts_through(Notification)[0]
+        # Part를 참조하는 모든 DynamicContent 모델의 중간 테이블
+        self.part_throughs = {through for through, target in get_part_links(Part)}
+
+    def test_delete_keeps_shared_parts(self):
+        alice, bob, post = self.create_part('user', 'Alice'), self.create_part('user', 'Bob'), self.create_part('post', 'Python')
+        first = self.create_content([alice, post])
+        second = self.create_content([bob, post])
+
+        deleted, per_model = Notification.objects.filter(pk=first.pk).delete()
+
+        self.assertEqual(per_model[Notification._meta.label], 1)
+        self.assertEqual(per_model[Part._meta.label], 1)
+        self.assertFalse(Part.objects.filter(pk=alice.pk).exists())
+        self.assertEqual(set(second.parts.values_list('pk', flat=True)), {bob.pk, post.pk})
+        self.assertFalse(self.through.objects.filter(notification_id=first.pk).exists())
+
+    def test_delete_in_batches(self):
+        contents = [self.create_content([self.create_part('user', f'User {i}')]) for i in range(5)]
+
+        deleted, per_model = Notification.objects.all().delete(batch_size=2)
+
+        self.assertEqual(per_model[Notification._meta.label], len(contents))
+        self.assertEqual(per_model[Part._meta.label], len(contents))
+        self.assertFalse(Notification.objects.exists())
+        self.assertFalse(Part.objects.exists())
+
+    def test_instance_delete(self):
+        alice, post = self.create_part('user', 'Alice'), self.create_part('post', 'Python')
+        content = self.create_content([alice, post])
+        self.create_content([post])
+
+        content.delete()
+
+        self.assertEqual(list(Part.objects.values_list('pk', flat=True)), [post.pk])
+
+    def test_get_orphan_parts(self):
+        linked, orphan = self.create_part('user', 'Alice'), self.create_part('user', 'Bob')
+        self.create_content([linked])
+
+        self.assertEqual(list(get_orphan_parts(Part.objects.all()).values_list('pk', flat=True)), [orphan.pk])
+
+    def test_can_raw_delete(self):
+        self.assertTrue(can_raw_delete(self.through.objects.all()))
+        self.assertTrue(can_raw_delete(Part.objects.all(), self.part_throughs))
+        # 중간 테이블이 참조하므로 handled_models 없이는 Collector를 사용해야 합니다.
+        self.assertFalse(can_raw_delete(Notification.objects.all()))
+        self.assertTrue(can_raw_delete(Notification.objects.all(), {self.through}))
+
+        def receiver(**kwargs):
+            pass
+
+        signals.pre_delete.connect(receiver, sender=Part)
+        try:
+            self.assertFalse(can_raw_delete(Part.objects.all(), self.part_throughs))
+        finally:
+            signals.pre_delete.disconnect(receiver, sender=Part)
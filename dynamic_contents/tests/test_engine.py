@@ -0,0 +1,65 @@
+import unittest
+from unittest import mock
+
+from django.utils import translation
+
+from dynamic_contents import engine
+from dynamic_contents.engine import MessageFormatEngine
+from dynamic_contents.tests.test_utils import MockFormat, MockPart
+from dynamic_contents.utils import generate_text, generate_i18n, generate_html
+
+
+class TestMessageFormatEngine(unittest.TestCase):
+    def setUp(self):
+        self.engine = MessageFormatEngine()
+        self.format = MockFormat("{{user}} and {{count, plural, =0 {nobody} one {# other} other {# others}}} liked it.")
+
+    def test_compile_plain_content(self):
+        self.assertEqual(self.engine.compile("Hi {{user}}!"), ('Hi ', ('user',), '!'))
+
+    def test_compile_malformed_content_as_literal(self):
+        self.assertEqual(self.engine.compile("{{count, plural, one {x}"), ('{{count, plural, one {x}',))
+
+    def test_get_placeholders(self):
+        content = "{{user}} {{gender, select, male {his {{post}}} other {their {{post}}}}}"
+        self.assertEqual(self.engine.get_placeholders(content), ['user', 'post', 'gender'])
+
+    def test_plural(self):
+        parts = [MockPart("user", "Alice"), MockPart("count", "1200")]
+        with translation.override('en'):
+            self.assertEqual(generate_text(self.format, parts), "Alice and 1,200 others liked it.")
+            self.assertEqual(generate_text(self.format, parts[:1] + [MockPart("count", "1")]), "Alice and 1 other liked it.")
+            self.assertEqual(generate_i18n(self.format, parts[:1] + [MockPart("count", "0")]), "<0>Alice</0> and nobody liked it.")
+
+    def test_plural_counts_parts(self):
+        format = MockFormat("{{user}} {{user, plural, one {is} other {are}}} here")
+        parts = [MockPart("user", "Alice"), MockPart("user", "Bob")]
+        with translation.override('en'):
+            self.assertEqual(generate_text(format, parts), "Alice and Bob are here")
+            self.assertEqual(generate_html(format, parts[:1]), '<a href="#">Alice</a> is here')
+
+    def test_plural_rules(self):
+        self.assertEqual(self.engine.get_plural_category(1, 'ko'), 'other')
+        self.assertEqual(self.engine.get_plural_category(22, 'ru'), 'few')
+        self.assertEqual(self.engine.get_plural_category(11, 'ru'), 'many')
+
+    def test_select(self):
+        format = MockFormat("{{user}} updated {{gender, select, female {her} male {his} other {their}}} profile")
+        parts = [MockPart("user", "Alice"), MockPart("gender", "female")]
+        self.assertEqual(generate_text(format, parts), "Alice updated her profile")
+        self.assertEqual(generate_text(format, parts[:1]), "Alice updated their profile")
+
+
+class TestListJoiners(unittest.TestCase):
+    def test_language_joiners(self):
+        format = MockFormat("{{user}}")
+        parts = [MockPart("user", "A"), MockPart("user", "B"), MockPart("user", "C")]
+        with mock.patch.object(engine, 'LIST_JOINERS', {'ko': (', ', ', ')}):
+            with translation.override('ko'):
+                self.assertEqual(generate_text(format, parts), "A, B, C")
+            with translation.override('en'):
+                self.assertEqual(generate_text(format, parts), "A, B and C")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+from unittest import mock
+
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.views import View
+
+from dynamic_contents import profiling
+from dynamic_contents.profiling import ProfilingMixin, StageTimer, profile_block, profile_stage
+
+
+class ProfiledView(ProfilingMixin, View):
+    def get(self, request):
+        with profile_block('generate_text'):
+            pass
+        return HttpResponse('ok')
+
+
+class TestProfiling(unittest.TestCase):
+    def test_profile_stage_is_noop_when_disabled(self):
+        def func():
+            return 1
+
+        with mock.patch.object(profiling, 'PROFILING', False):
+            self.assertIs(profile_stage('stage')(func), func)
+
+    def test_stage_timer(self):
+        timer = StageTimer()
+        timer.add('db', 0.002)
+        timer.add('db', 0.001)
+        self.assertEqual(timer.to_dict(), {'db': {'ms': 3.0, 'count': 2}})
+        self.assertEqual(timer.to_server_timing(0.01), 'db;dur=3.000;desc="2", total;dur=10.000')
+
+    def test_server_timing_header(self):
+        request = RequestFactory().get('/')
+        with mock.patch.object(profiling, 'PROFILING', True), mock.patch.object(profiling, 'PROFILING_OUTPUT', ('header',)):
+            response = ProfiledView.as_view()(request)
+        self.assertIn('generate_text;dur=', response['Server-Timing'])
+
+        with mock.patch.object(profiling, 'PROFILING', True), mock.patch.object(profiling, 'PROFILING_SAMPLE_RATE', 0):
+            response = ProfiledView.as_view()(request)
+        self.assertFalse(response.has_header('Server-Timing'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,161 @@
+import asyncio
+import json
+import unittest
+from unittest import mock
+
+from django.db import transaction
+from django.db.models import signals
+
+from dynamic_contents import asgi, push
+from dynamic_contents.asgi import PushApplication
+from dynamic_contents.models import get_dynamic_content_models
+from dynamic_contents.push import BaseBroker, InMemoryBroker, connect_push_signals
+from dynamic_contents.tests.base import DynamicContentTestCase
+from dynamic_contents.tests.models import Notification
+
+
+class TestPush(unittest.TestCase):
+    def test_broker_fans_out_same_message(self):
+        async def run():
+            broker = InMemoryBroker(max_queue_size=2)
+            first = broker.subscribe(['feed/en'])
+            second = broker.subscribe(['feed/en', 'feed/ko'])
+            self.assertEqual(broker.publish('feed/en', 'a'), 2)
+            broker.publish('feed/ko', 'b')
+            broker.publish('feed/ko', 'c')
+            broker.publish('feed/ko', 'd')
+            await asyncio.sleep(0)
+            self.assertEqual(await first.get(), 'a')
+            # 큐가 가득 차면 가장 오래된 메시지를 버립니다.
+            self.assertEqual([await second.get(), await second.get()], ['c', 'd'])
+            first.close()
+            second.close()
+            self.assertEqual(broker.subscribers, {})
+
+        asyncio.run(run())
+
+    def test_server_sent_events(self):
+        broker = InMemoryBroker()
+        sent = []
+
+        async def run():
+            inbox = asyncio.Queue()
+
+            async def send(message):
+                sent.append(message)
+                if message.get('status') == 200:
+                    broker.publish('feed/en', '{"id": 1}')
+                elif message.get('more_body'):
+                    await inbox.put({'type': 'http.disconnect'})
+
+            application = PushApplication(None, path='/stream/', authorize=lambda scope, channels: True)
+            scope = {'type': 'http', 'method': 'GET', 'path': '/stream/', 'query_string': b'channel=feed&language=en'}
+            await application(scope, inbox.get, send)
+
+        with mock.patch.object(asgi, 'PUSH', True), mock.patch.object(asgi, 'get_broker', return_value=broker):
+            asyncio.run(run())
+
+        self.assertEqual(sent[0]['status'], 200)
+        self.assertEqual(sent[1]['body'], b'data: {"id": 1}\n\n')
+        self.assertEqual(broker.subscribers, {})
+
+    def test_subscriptions_require_authorize(self):
+        sent = []
+
+        async def send(message):
+            sent.append(message)
+
+        async def run(query_string, authorize=None):
+            scope = {'type': 'http', 'method': 'GET', 'path': '/stream/', 'query_string': query_string}
+            await PushApplication(None, path='/stream/', authorize=authorize)(scope, None, send)
+
+        async def deny_others(scope, channels):
+            return channels == ['user:1']
+
+        with mock.patch.object(asgi, 'PUSH', True):
+            # authorize가 없으면 모델 label 채널도 구독할 수 없습니다.
+            asyncio.run(run(b'channel=dynamic_contents_tests.Notification&language=en'))
+            asyncio.run(run(b'channel=user:2&language=en', deny_others))
+        self.assertEqual([message['status'] for message in sent if message['type'] == 'http.response.start'], [403, 403])
+
+
+class RecordingBroker(BaseBroker):
+    def __init__(self):
+        self.messages = []
+
+    def publish(self, channel, message):
+        self.messages.append((channel, json.loads(message)))
+
+
+class TestPushSignals(DynamicContentTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        connect_push_signals()
+
+    @classmethod
+    def tearDownClass(cls):
+        for model in get_dynamic_content_models():
+            signals.post_save.disconnect(sender=model, dispatch_uid=f'dynamic_contents_push_{model._meta.label}')
+            signals.m2m_changed.disconnect(
+                sender=model._meta.get_field('parts').remote_field.through,
+                dispatch_uid=f'dynamic_contents_push_parts_{model._meta.label}',
+            )
+        super().tearDownClass()
+
+    def setUp(self):
+        super().setUp()
+        self.broker = RecordingBroker()
+        for patcher in (
+            mock.patch.object(push, 'get_broker', return_value=self.broker),
+            mock.patch.object(push, 'LANGUAGES', [('en', 'English'), ('ko', 'Korean')]),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.user, self.post = self.create_part('user', 'Alice'), self.create_part('post', 'Python')
+
+    def get_published(self):
+        return [(channel, message['id'], message['event']) for channel, message in self.broker.messages]
+
+    def test_one_push_per_transaction(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            with transaction.atomic():
+                content = self.create_content([self.user])
+                content.parts.add(self.post)
+                content.save()
+
+        self.assertEqual(len(callbacks), 1)
+        channel = Notification._meta.label
+        self.assertEqual(self.get_published(), [
+            (f'{channel}/en', content.pk, 'created'),
+            (f'{channel}/ko', content.pk, 'created'),
+        ])
+        self.assertEqual(self.broker.messages[0][1]['text'], 'Alice liked Python.')
+
+    def test_rollback_publishes_nothing(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            with self.assertRaises(RuntimeError):
+                with transaction.atomic():
+                    self.create_content([self.user, self.post])
+                    raise RuntimeError
+
+        self.assertEqual(callbacks, [])
+        self.assertEqual(self.broker.messages, [])
+
+    def test_savepoint_rollback_keeps_queued_push(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                content = self.create_content([self.user, self.post])
+                with self.assertRaises(RuntimeError):
+                    with transaction.atomic():
+                        content.save()
+                        self.create_content([self.user])
+                        raise RuntimeError
+                # savepoint rollback 후에도 이미 예약된 push를 다시 예약하지 않습니다.
+                content.save()
+
+        self.assertEqual([pk for channel, pk, event in self.get_published()], [content.pk, content.pk])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+import unittest
+
+from django.contrib.auth.models import User
+from django.db import connections
+from django.test import SimpleTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from dynamic_contents.archive import archive_dynamic_contents
+from dynamic_contents.models import ArchivedDynamicContent, Format, Part
+from dynamic_contents.routers import DynamicContentsRouter, reset_pin, use_primary
+from dynamic_contents.tests.base import DynamicContentTestCase
+from dynamic_contents.tests.models import Notification
+
+
+@override_settings(
+    DYNAMIC_CONTENTS_WRITE_DATABASE='default',
+    DYNAMIC_CONTENTS_READ_DATABASES=['replica'],
+    DYNAMIC_CONTENTS_STICKY_SECONDS=60,
+)
+class TestDynamicContentsRouter(SimpleTestCase):
+    def setUp(self):
+        reset_pin()
+        self.router = DynamicContentsRouter()
+
+    def tearDown(self):
+        reset_pin()
+
+    def test_reads_go_to_replica(self):
+        self.assertEqual(self.router.db_for_read(Format), 'replica')
+        self.assertEqual(self.router.db_for_read(Part.objects.model), 'replica')
+        self.assertIsNone(self.router.db_for_read(User))
+
+    def test_reads_after_write_are_pinned(self):
+        self.assertEqual(self.router.db_for_write(Part), 'default')
+        self.assertEqual(self.router.db_for_read(Format), 'default')
+
+        reset_pin()
+        self.assertEqual(self.router.db_for_read(Format), 'replica')
+
+    def test_use_primary(self):
+        with use_primary():
+            self.assertEqual(self.router.db_for_read(Format), 'default')
+        self.assertEqual(self.router.db_for_read(Format), 'replica')
+
+    def test_for_render(self):
+        self.assertEqual(Format.objects.for_render().db, 'replica')
+        with use_primary():
+            self.assertEqual(Part.objects.for_render().db, 'default')
+
+
+@override_settings(
+    DATABASE_ROUTERS=['dynamic_contents.routers.DynamicContentsRouter'],
+    DYNAMIC_CONTENTS_WRITE_DATABASE='default',
+    DYNAMIC_CONTENTS_READ_DATABASES=['replica'],
+)
+class TestWritesWithReplica(DynamicContentTestCase):
+    """
+    default와 replica 두 DB를 사용해 쓰기 경로가 replica로 가지 않는지 확인합니다.
+    replica는 복제되지 않으므로 비어 있고, 각 작업 전에 새 요청처럼 pin을 초기화합니다.
+    """
+    databases = {'default', 'replica'}
+
+    def setUp(self):
+        reset_pin()
+        super().setUp()
+        self.part = self.create_part('user', 'Alice')
+        self.content = self.create_content([self.part])
+        reset_pin()
+
+    def tearDown(self):
+        reset_pin()
+
+    def assertNoReplicaQueries(self, function):
+        with CaptureQueriesContext(connections['replica']) as queries:
+            result = function()
+        self.assertEqual([query['sql'] for query in queries], [])
+        reset_pin()
+        return result
+
+    def test_reads_go_to_empty_replica(self):
+        self.assertFalse(Notification.objects.exists())
+        self.assertTrue(Notification.objects.using('default').exists())
+
+    def test_create_and_update(self):
+        content = self.assertNoReplicaQueries(
+            lambda: Notification.objects.create_dynamic_content(self.format, [self.part])
+        )
+        self.assertEqual(list(content.parts.using('default').all()), [self.part])
+
+        self.assertNoReplicaQueries(lambda: Notification.objects.update_dynamic_content(content, self.format, []))
+        self.assertEqual(Notification.objects.using('default').get(pk=content.pk).missing_placeholders, '["user", "post"]')
+
+    def test_sync_formats(self):
+        result = self.assertNoReplicaQueries(lambda: Format.objects.sync_formats([
+            {'type': 'alarm', 'subtype': 'like', 'content': '{{user}} loved {{post}}.'},
+            {'type': 'alarm', 'subtype': 'follow', 'content': '{{user}} followed you.'},
+        ]))
+        self.assertEqual(result, {'created': 1, 'updated': 1, 'unchanged': 0})
+
+    def test_repair_missing_placeholders(self):
+        result = self.assertNoReplicaQueries(lambda: Notification.objects.repair_missing_placeholders())
+        self.assertEqual(result, {'checked': 1, 'repaired': 1})
+        self.assertEqual(Notification.objects.using('default').get().missing_placeholders, '["post"]')
+
+    def test_delete(self):
+        deleted, per_model = self.assertNoReplicaQueries(lambda: Notification.objects.all().delete())
+        self.assertEqual(per_model[Notification._meta.label], 1)
+        self.assertFalse(Part.objects.using('default').exists())
+
+    def test_instance_delete(self):
+        content = Notification.objects.using('default').get()
+        self.assertNoReplicaQueries(content.delete)
+        self.assertFalse(Notification.objects.using('default').exists())
+
+    def test_archive(self):
+        archived = self.assertNoReplicaQueries(lambda: archive_dynamic_contents(Notification.objects.all(), days=-1))
+        self.assertEqual(archived, 1)
+        self.assertTrue(ArchivedDynamicContent.objects.using('default').exists())
+        self.assertFalse(Notification.objects.using('default').exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
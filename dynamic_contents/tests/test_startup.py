@@ -0,0 +1,59 @@
+import subprocess
+import sys
+from pathlib import Path
+
+from django.contrib import admin
+from django.test import RequestFactory, SimpleTestCase
+from drf_yasg import openapi
+from drf_yasg.generators import OpenAPISchemaGenerator
+
+from dynamic_contents import urls
+from dynamic_contents.admin import FormatAdmin
+from dynamic_contents.models import Format
+
+
+class TestLazyImports(SimpleTestCase):
+    def test_views_import_does_not_load_drf_yasg_utils(self):
+        # 이미 import된 현재 프로세스가 아니라 새 인터프리터에서 확인합니다.
+        code = (
+            "import os, sys, django; "
+            "os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.test_settings'); "
+            "django.setup(); "
+            "import dynamic_contents.views; "
+            "print('drf_yasg.utils' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, '-c', code],
+            cwd=Path(__file__).resolve().parents[2],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        self.assertEqual(result.stdout.strip(), 'False')
+
+
+class TestLazySwaggerSchema(SimpleTestCase):
+    def get_parameter_names(self, schema, path_suffix):
+        for path, item in schema['paths'].items():
+            if path.endswith(path_suffix):
+                return {parameter['name'] for parameter in item['get']['parameters']}
+        self.fail(f'{path_suffix} is not in the schema')
+
+    def test_schema_includes_view_parameters(self):
+        generator = OpenAPISchemaGenerator(
+            openapi.Info(title='Dynamic Contents', default_version='v1'),
+            patterns=urls.urlpatterns,
+        )
+        schema = generator.get_schema(public=True)
+
+        self.assertTrue({'parts', 'limit'} <= self.get_parameter_names(schema, '/dynamic-content/{format_id}/'))
+        self.assertIn('since', self.get_parameter_names(schema, '/format-bundle/'))
+
+
+class TestFormatAdmin(SimpleTestCase):
+    def test_list_display_includes_translated_fields(self):
+        model_admin = FormatAdmin(Format, admin.site)
+        list_display = model_admin.get_list_display(RequestFactory().get('/'))
+
+        self.assertIn('content_en', list_display)
+        self.assertIn('content_ko', list_display)
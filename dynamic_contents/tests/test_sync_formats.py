@@ -0,0 +1,93 @@
+import os
+import tempfile
+import unittest
+
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test import TestCase
+
+from dynamic_contents.management.commands.sync_formats import iter_format_entries
+from dynamic_contents.models import Format
+
+
+class TestSyncFormats(unittest.TestCase):
+    def write_fixture(self, name, data):
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(data)
+        return path
+
+    def test_iter_jsonl_entries(self):
+        path = self.write_fixture('formats.jsonl', '{"type": "alarm", "subtype": "like"}\n\n[{"type": "history", "subtype": "view"}]\n')
+        self.assertEqual([entry['type'] for entry in iter_format_entries(path)], ['alarm', 'history'])
+
+    def test_iter_yaml_entries(self):
+        path = self.write_fixture('formats.yaml', 'formats:\n  - type: alarm\n    subtype: like\n---\ntype: history\nsubtype: view\n')
+        self.assertEqual([entry['subtype'] for entry in iter_format_entries(path)], ['like', 'view'])
+
+    def test_entry_values(self):
+        values = Format.objects.get_entry_values({'content': {'en': 'a', 'zh-hans': 'b'}, 'content_ko': 'c'})
+        self.assertEqual(values, {'content_en': 'a', 'content_zh_hans': 'b', 'content_ko': 'c'})
+
+    def test_normalize_in_memory(self):
+        format = Format(type='alarm-1', subtype='like me', content='{{user}} liked {{post}}')
+        format.normalize()
+        self.assertEqual((format.type, format.subtype, format._placeholders), ('ALARM', 'LIKEME', 'user,post'))
+
+        format = Format(type='alarm', subtype='like', content='{{user}} and {{user}}')
+        with self.assertRaises(ValidationError):
+            format.normalize()
+
+
+class TestSyncFormatsDatabase(TestCase):
+    def get_rows(self):
+        # modeltranslation이 바꾸지 않도록 원본 content 컬럼을 SQL로 직접 읽습니다.
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'SELECT subtype, content, content_en, content_ko, _placeholders FROM {Format._meta.db_table} ORDER BY subtype'
+            )
+            return cursor.fetchall()
+
+    def test_create_and_update(self):
+        result = Format.objects.sync_formats([
+            {'type': 'alarm', 'subtype': 'like', 'content': '{{user}} liked {{post}}'},
+            {'type': 'alarm', 'subtype': 'follow', 'content': {'en': '{{user}} followed you', 'ko': '{{user}}님이 팔로우했습니다'}},
+        ])
+        self.assertEqual(result, {'created': 2, 'updated': 0, 'unchanged': 0})
+
+        result = Format.objects.sync_formats([
+            {'type': 'alarm', 'subtype': 'like', 'content': '{{user}} loved {{post}}'},
+            {'type': 'alarm', 'subtype': 'follow', 'content_ko': '{{user}}님이 회원님을 팔로우했습니다'},
+        ])
+        self.assertEqual(result, {'created': 0, 'updated': 2, 'unchanged': 0})
+        self.assertEqual(self.get_rows(), [
+            ('FOLLOW', '{{user}} followed you', '{{user}} followed you', '{{user}}님이 회원님을 팔로우했습니다', 'user'),
+            ('LIKE', '{{user}} loved {{post}}', '{{user}} loved {{post}}', None, 'user,post'),
+        ])
+
+    def test_fill_only_and_dry_run(self):
+        Format.objects.sync_formats([{'type': 'alarm', 'subtype': 'like', 'content': '{{user}} liked {{post}}'}])
+
+        result = Format.objects.sync_formats(
+            [{'type': 'alarm', 'subtype': 'like', 'content': {'en': '{{user}} loved {{post}}', 'ko': '{{user}}님이 {{post}}를 좋아합니다'}}],
+            fill_only=True,
+        )
+        self.assertEqual(result['updated'], 1)
+        self.assertEqual(self.get_rows()[0][1:4], ('{{user}} liked {{post}}', '{{user}} liked {{post}}', '{{user}}님이 {{post}}를 좋아합니다'))
+
+        result = Format.objects.sync_formats([{'type': 'alarm', 'subtype': 'view', 'content': '{{user}} viewed'}], dry_run=True)
+        self.assertEqual(result['created'], 1)
+        self.assertEqual(Format.objects.count(), 1)
+
+    def test_invalid_entries_save_nothing(self):
+        with self.assertRaises(ValidationError):
+            Format.objects.sync_formats([
+                {'type': 'alarm', 'subtype': 'like', 'content': '{{user}} liked {{post}}'},
+                {'type': 'alarm', 'subtype': 'twice', 'content': '{{user}} and {{user}}'},
+            ])
+        self.assertFalse(Format.objects.exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import threading
+import unittest
+from unittest import mock
+
+from django.db import transaction
+
+from dynamic_contents.tasks import Job, QueueTaskBackend, ThreadPoolTaskBackend, coalesce_jobs, run_job_message
+from dynamic_contents.tests.base import DynamicContentTestCase
+from dynamic_contents.tests.models import Notification
+
+
+def identity(value):
+    return value
+
+
+class ListQueueBackend(QueueTaskBackend):
+    def __init__(self):
+        self.messages = []
+
+    def enqueue(self, message):
+        self.messages.append(message)
+        return len(self.messages)
+
+
+class TestTaskBackends(unittest.TestCase):
+    def test_coalesce_jobs(self):
+        jobs = [Job(identity, (1,), key='a'), Job(identity, (2,)), Job(identity, (3,), key='a')]
+        self.assertEqual([job.args for job in coalesce_jobs(jobs)], [(3,), (2,)])
+
+    def test_thread_pool_coalesces_pending_jobs(self):
+        backend = ThreadPoolTaskBackend(max_workers=1)
+        started, release = threading.Event(), threading.Event()
+
+        def block():
+            started.set()
+            release.wait(5)
+            return 'blocked'
+
+        first = backend.submit([Job(block)])
+        started.wait(5)
+        batch = backend.submit([Job(identity, ('old',), key='content-1'), Job(identity, ('new',), key='content-1')])
+        release.set()
+
+        self.assertTrue(batch.wait(5))
+        self.assertEqual(batch.results(), ['new', 'new'])
+        self.assertEqual(first.results(), ['blocked'])
+
+        finished = []
+        batch.add_done_callback(finished.append)
+        self.assertEqual(finished, [batch])
+        backend.shutdown()
+
+    def test_queue_backend_sends_messages(self):
+        backend = ListQueueBackend()
+        batch = backend.submit([Job(identity, (1,), key=('a', 1)), Job(identity, (2,), key=('a', 1)), Job(identity, (3,))])
+
+        self.assertEqual(batch.results(), [1, 1, 2])
+        self.assertEqual(backend.messages[0]['func'], 'dynamic_contents.tests.test_tasks.identity')
+        self.assertEqual(Job.from_message(backend.messages[0]).run(), 2)
+
+
+class TestSubmitOnCommit(DynamicContentTestCase):
+    def setUp(self):
+        super().setUp()
+        self.backend = ListQueueBackend()
+        patcher = mock.patch('dynamic_contents.tasks._backend', self.backend)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_jobs_are_submitted_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            with transaction.atomic():
+                format = self.create_format('COMMENT', '{{user}} commented on {{post}}.')
+                part = self.create_part('user', 'Alice')
+                batch = Notification.objects.create_dynamic_contents_async([(format, [part])])
+                self.assertEqual(self.backend.messages, [])
+                self.assertFalse(batch.done())
+
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(batch.results(), [1])
+
+        # worker에서 실행되는 것처럼 메시지로 작업을 실행합니다.
+        pk = run_job_message(self.backend.messages[0])
+        content = Notification.objects.get(pk=pk)
+        self.assertEqual(content.format, format)
+        self.assertEqual(list(content.parts.all()), [part])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Notification.objects.rerender_dynamic_contents_async([content])
+        run_job_message(self.backend.messages[-1])
+        self.assertEqual(Notification.objects.get(pk=pk).missing_placeholders, '["post"]')
+
+    def test_rolled_back_jobs_are_not_submitted(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            with self.assertRaises(RuntimeError):
+                with transaction.atomic():
+                    Notification.objects.rerender_dynamic_contents_async([1])
+                    raise RuntimeError
+
+        self.assertEqual(callbacks, [])
+        self.assertEqual(self.backend.messages, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,36 @@
+from unittest import mock
+
+from django.utils import translation
+
+from dynamic_contents.tests.base import DynamicContentTestCase
+from dynamic_contents.tests.models import Notification
+
+
+class TestLimitedParts(DynamicContentTestCase):
+    def setUp(self):
+        super().setUp()
+        self.users = self.create_users('Alice', 'Bob', 'Chloe')
+        self.post = self.create_part('post', 'Python')
+        self.content = self.create_content([*self.users, self.post])
+
+    def test_with_limited_parts(self):
+        content = Notification.objects.select_related('format').with_limited_parts(2).get(pk=self.content.pk)
+        self.assertEqual(content.part_totals, {'user': 3, 'post': 1})
+        # Part는 최신순으로 정렬되므로 마지막에 만든 Part부터 표시됩니다.
+        with translation.override('en'), self.assertNumQueries(0):
+            self.assertEqual(content.get_text(), 'Chloe, Bob and 1 other liked Python.')
+
+    @mock.patch('dynamic_contents.models.PART_LIMIT', 2)
+    def test_part_limit_fetches_once(self):
+        content = Notification.objects.select_related('format').get(pk=self.content.pk)
+        with translation.override('en'):
+            text = content.get_text()
+            with self.assertNumQueries(0):
+                content.get_i18n()
+                content.get_html()
+        self.assertEqual(text, 'Chloe, Bob and 1 other liked Python.')
+
+        # Part 연결이 바뀌면 보관한 목록을 버리고 다시 조회합니다.
+        Notification.objects.update_dynamic_content(content, self.format, [self.users[2], self.post])
+        with translation.override('en'):
+            self.assertEqual(content.get_text(), 'Chloe liked Python.')
@@ -1,6 +1,9 @@
 import unittest
 
-from dynamic_contents.utils import generate_text, generate_i18n, generate_html
+from django.utils import translation
+
+from dynamic_contents.truncation import truncate_parts
+from dynamic_contents.utils import generate_text, generate_i18n, generate_i18n_batch, generate_html, HtmlRenderer
 
 
 class MockFormat:
@@ -11,10 +14,12 @@ class MockFormat:
         return self.content
 
 class MockPart:
-    def __init__(self, field, content, link=None):
+    def __init__(self, field, content, link=None, id=None, updated_at=None):
         self.field = field
         self.content = content
         self.link = link
+        self.id = id
+        self.updated_at = updated_at
 
     def get_content(self):
         return self.content
@@ -39,10 +44,66 @@ class TestDynamicContentUtils(unittest.TestCase):
         print(generate_i18n(self.format, self.parts))
         self.assertEqual(generate_i18n(self.format, self.parts), expected_i18n)
 
+    def test_generate_i18n_keeps_backslashes(self):
+        format = MockFormat("{{user}} wrote {{post}}")
+        parts = [MockPart("user", "C:\\Users\\1"), MockPart("post", "\\1 and \\g<0>")]
+        self.assertEqual(generate_i18n(format, parts), "<0>C:\\Users\\1</0> wrote <1>\\1 and \\g<0></1>")
+
+    def test_generate_i18n_batch(self):
+        other_format = MockFormat("{{post}} by {{user}}")
+        results = generate_i18n_batch([(self.format, self.parts), (other_format, self.parts[:2]), (None, [])])
+        self.assertEqual(results[0], generate_i18n(self.format, self.parts))
+        self.assertEqual(results[1], "<0>How to learn Python</0> by <1>Alice</1>")
+        self.assertEqual(results[2], '')
+
+    def test_generate_i18n_keeps_unmatched_placeholders(self):
+        format = MockFormat("{{user}} liked {{post}}")
+        self.assertEqual(generate_i18n(format, [MockPart("post", "{{user}}")]), "{{user}} liked <0>{{user}}</0>")
+
     def test_generate_html(self):
         expected_html = 'Hello, <a href="#">Alice</a>! Your post <a href="#">How to learn Python</a> was liked by <a href="http://example.com">Leo</a> for <a href="http://example.com">Rosie</a>.'
         print(generate_html(self.format, self.parts))
         self.assertEqual(generate_html(self.format, self.parts), expected_html)
 
+    def test_generate_html_escapes_content_and_links(self):
+        format = MockFormat("<b>{{user}}</b> commented {{comment}}")
+        parts = [
+            MockPart("user", "<script>alert(1)</script>", link='http://example.com/?a=1&b="2"'),
+            MockPart("comment", "Hi", link="javascript:alert(1)"),
+        ]
+        expected_html = (
+            '&lt;b&gt;<a href="http://example.com/?a=1&amp;b=&quot;2&quot;">&lt;script&gt;alert(1)&lt;/script&gt;</a>'
+            '&lt;/b&gt; commented <a href="#">Hi</a>'
+        )
+        self.assertEqual(generate_html(format, parts), expected_html)
+
+    def test_html_renderer_caches_fragments(self):
+        renderer = HtmlRenderer()
+        format = MockFormat("{{user}}")
+        part = MockPart("user", "Alice", id=1, updated_at=1)
+        self.assertEqual(renderer.render(format, [part]), '<a href="#">Alice</a>')
+
+        part.content = "Bob"
+        self.assertEqual(renderer.render(format, [part]), '<a href="#">Alice</a>')
+
+        part.updated_at = 2
+        self.assertEqual(renderer.render(format, [part]), '<a href="#">Bob</a>')
+
+    def test_truncated_parts(self):
+        format = MockFormat("{{user}} liked {{post}}")
+        parts, totals = truncate_parts(
+            iter([MockPart("user", f"U{i}") for i in range(1000)] + [MockPart("post", "Hi")]), 2
+        )
+        self.assertEqual(len(parts), 3)
+        self.assertEqual(totals, {"user": 1000, "post": 1})
+        with translation.override('en'):
+            self.assertEqual(generate_text(format, parts, totals), "U0, U1 and 998 others liked Hi")
+            self.assertEqual(generate_i18n(format, parts, totals), "<0>U0</0>, <1>U1</1> and 998 others liked <2>Hi</2>")
+            self.assertEqual(
+                generate_html(format, parts, totals),
+                '<a href="#">U0</a>, <a href="#">U1</a> and 998 others liked <a href="#">Hi</a>'
+            )
+
+
 if __name__ == '__main__':
     unittest.main()
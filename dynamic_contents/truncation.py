@@ -0,0 +1,127 @@
+# Python
+from collections import defaultdict
+
+# Django
+import django
+from django.db.models import Count, F, Window
+from django.db.models.functions import RowNumber
+
+# App
+from .audit import get_parts_through
+
+# Variables
+# Window 함수 결과로 filter 하는 기능은 Django 4.2부터 지원됩니다.
+SUPPORTS_WINDOW_FILTER = django.VERSION >= (4, 2)
+
+
+def get_part_ordering(part_model, prefix=''):
+    """
+    렌더링에 사용할 Part 순서(Part.Meta.ordering, 같은 값이면 최신 pk 우선)를 표현식으로 반환합니다.
+    """
+    ordering = []
+    for name in list(part_model._meta.ordering) + ['-pk']:
+        descending = name.startswith('-')
+        expression = F(prefix + name.lstrip('-'))
+        ordering.append(expression.desc() if descending else expression.asc())
+    return ordering
+
+
+def count_parts(through, source, target, pks):
+    """
+    {(콘텐츠 pk, field): 전체 Part 수} 를 GROUP BY 쿼리 하나로 계산합니다.
+    """
+    rows = (
+        through.objects
+        .filter(**{f'{source}__in': pks})
+        .values_list(f'{source}_id', f'{target}__field')
+        .annotate(total=Count('pk'))
+        .order_by()
+    )
+    return {(pk, field): total for pk, field, total in rows}
+
+
+def fetch_windowed_parts(through, source, target, pks, limit):
+    # (콘텐츠, field) 별로 순번을 매기고 limit 이하만 가져옵니다.
+    links = (
+        through.objects
+        .filter(**{f'{source}__in': pks})
+        .annotate(part_row=Window(
+            expression=RowNumber(),
+            partition_by=[F(f'{source}_id'), F(f'{target}__field')],
+            order_by=get_part_ordering(through._meta.get_field(target).related_model, prefix=f'{target}__'),
+        ))
+        .filter(part_row__lte=limit)
+        .select_related(target)
+        .order_by(f'{source}_id', 'part_row')
+    )
+    for link in links:
+        yield getattr(link, f'{source}_id'), getattr(link, target)
+
+
+def fetch_sliced_parts(through, source, target, counts, limit):
+    # Window filter를 지원하지 않는 Django에서는 (콘텐츠, field) 별로 LIMIT 쿼리를 실행합니다.
+    ordering = get_part_ordering(through._meta.get_field(target).related_model, prefix=f'{target}__')
+    for pk, field in counts:
+        links = (
+            through.objects
+            .filter(**{source: pk, f'{target}__field': field})
+            .select_related(target)
+            .order_by(*ordering)[:limit]
+        )
+        for link in links:
+            yield pk, getattr(link, target)
+
+
+def fetch_limited_parts(model, pks, limit):
+    """
+    여러 콘텐츠의 Part를 placeholder(field)별로 최대 limit 개씩 가져옵니다.
+    전체 목록은 메모리에 올리지 않으며, 잘린 개수는 COUNT 쿼리로 계산합니다.
+
+    :return: {콘텐츠 pk: ([Part, ...], {field: 전체 Part 수})}
+    """
+    through, source, target = get_parts_through(model)
+    pks = list(pks)
+    counts = count_parts(through, source, target, pks)
+
+    parts = defaultdict(list)
+    if SUPPORTS_WINDOW_FILTER:
+        rows = fetch_windowed_parts(through, source, target, pks, limit)
+    else:
+        rows = fetch_sliced_parts(through, source, target, counts, limit)
+    for pk, part in rows:
+        parts[pk].append(part)
+
+    totals = defaultdict(dict)
+    for (pk, field), total in counts.items():
+        totals[pk][field] = total
+    return {pk: (parts[pk], totals[pk]) for pk in pks}
+
+
+def prefetch_limited_parts(instances, limit):
+    """
+    DynamicContent 객체마다 prefetched_parts(잘린 Part 목록)와 part_totals(field별 전체 수)를 채웁니다.
+    """
+    instances = [instance for instance in instances if instance.pk is not None]
+    if not instances:
+        return instances
+
+    fetched = fetch_limited_parts(type(instances[0]), [instance.pk for instance in instances], limit)
+    for instance in instances:
+        instance.prefetched_parts, instance.part_totals = fetched[instance.pk]
+    return instances
+
+
+def truncate_parts(parts, limit):
+    """
+    이미 조회한 Part 목록을 field별로 최대 limit 개만 남기고, field별 전체 수를 함께 반환합니다.
+    iterator()로 넘기면 넘친 Part는 개수만 세고 보관하지 않습니다.
+
+    :return: ([Part, ...], {field: 전체 Part 수})
+    """
+    kept = []
+    totals = defaultdict(int)
+    for part in parts:
+        totals[part.field] += 1
+        if totals[part.field] <= limit:
+            kept.append(part)
+    return kept, dict(totals)
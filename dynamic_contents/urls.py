@@ -2,7 +2,7 @@ from django.urls import path
 from rest_framework.routers import DefaultRouter
 
 # App
-from dynamic_contents.views import FormatViewSet, PartViewSet, DynamicContentView
+from dynamic_contents.views import FormatViewSet, PartViewSet, DynamicContentView, FormatBundleView
 
 # Variables
 router = DefaultRouter()
@@ -12,4 +12,5 @@ urlpatterns = router.urls
 
 urlpatterns += [
     path('dynamic-content/<int:format_id>/', DynamicContentView.as_view(), name='dynamic-content'),
+    path('format-bundle/', FormatBundleView.as_view(), name='format-bundle'),
 ]
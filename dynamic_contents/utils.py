@@ -1,9 +1,68 @@
 # Python
-import re
-from collections import defaultdict
+import threading
+from collections import defaultdict, OrderedDict
+from urllib.parse import urlsplit
 
 # Django
-from django.utils.translation import gettext_lazy as _
+from django.utils.html import escape, format_html
+from django.utils.safestring import mark_safe
+from django.utils.translation import get_language
+
+# App
+from .engine import get_template_engine
+from .profiling import profile_stage
+
+
+def tokenize_content(content):
+    """
+    Format content를 리터럴 문자열과 placeholder 토큰으로 분리합니다.
+
+    리터럴은 str, placeholder는 (name,) 튜플로 표현되며 JSON으로 직렬화하면
+    ["Hello, ", ["user"], "!"] 형태가 됩니다. plural, select 구문은
+    (name, kind, {key: tokens}) 튜플이 됩니다. 같은 content는 템플릿 엔진에서 한 번만 분석합니다.
+    """
+    return get_template_engine().compile(content)
+
+
+def to_count(contents):
+    # part가 하나이고 내용이 정수이면 그 값을, 아니면 part 개수를 사용합니다.
+    if len(contents) == 1:
+        try:
+            return int(str(contents[0]).replace(',', '').strip())
+        except ValueError:
+            pass
+    return len(contents)
+
+
+def get_remaining(totals, field, shown):
+    # part 목록이 잘린 경우 표시되지 않은 part 수를 반환합니다.
+    if not totals:
+        return 0
+    return max(totals.get(field, shown) - shown, 0)
+
+
+def make_resolver(grouped_contents, totals=None):
+    """
+    plural, select 구문이 사용할 (개수, 첫 번째 값) 조회 함수를 만듭니다.
+    part 목록이 잘린 경우 개수는 totals의 전체 part 수를 사용합니다.
+    """
+    def resolve(name):
+        contents = grouped_contents.get(name) or []
+        if get_remaining(totals, name, len(contents)):
+            return totals[name], contents[0]
+        return to_count(contents), contents[0] if contents else ''
+    return resolve
+
+
+def flatten_content(content, grouped_contents, language=None, totals=None):
+    """
+    content를 토큰화한 뒤 plural, select 분기를 골라 리터럴과 (name,) 토큰 목록으로 펼칩니다.
+    """
+    engine = get_template_engine()
+    tokens = engine.compile(content)
+    if engine.is_plain(tokens):
+        return tokens
+    return engine.flatten(tokens, make_resolver(grouped_contents, totals), language)
 
 
 def group_parts_by_field(parts):
@@ -13,80 +72,196 @@ def group_parts_by_field(parts):
     return grouped_parts
 
 
-def join_contents(contents):
-    # 마지막 요소 전까지는 쉼표로, 마지막 두 요소는 "and"로 연결
-    if len(contents) > 1:
-        return ', '.join(contents[:-1]) + _(' and ') + contents[-1]
-    elif contents:
-        return contents[0]
-    return ''
+def join_contents(contents, language=None, remaining=0):
+    # 마지막 요소 전까지는 쉼표로, 마지막 두 요소는 "and"로 연결 (언어별 구분자는 템플릿 엔진 참고)
+    # 잘린 part가 있다면 마지막에 "N others" 를 붙입니다.
+    engine = get_template_engine()
+    language = language or get_language()
+    if remaining:
+        contents = list(contents) + [engine.get_remaining_label(remaining, language)]
+    return engine.join(contents, language)
 
 
-def generate_text(format, parts):
+@profile_stage('generate_text')
+def generate_text(format, parts, totals=None):
     """
     Generates text from a format and parts, joining multiple contents for the same field.
+    If totals ({field: total part count}) is given, truncated fields end with "and N others".
     """
     if not format:
         return ''
 
-    format_string = format.get_content()
-
+    language = get_language()
     grouped_parts = group_parts_by_field(parts)
-    for field, contents in grouped_parts.items():
-        joined_contents = join_contents(contents)
-        if joined_contents:
-            format_string = format_string.replace(f"{{{{{field}}}}}", joined_contents)
-    return format_string
 
+    output = []
+    for token in flatten_content(format.get_content(), grouped_parts, language, totals):
+        if type(token) is str:
+            output.append(token)
+        elif grouped_parts.get(token[0]):
+            contents = grouped_parts[token[0]]
+            output.append(join_contents(contents, language, get_remaining(totals, token[0], len(contents))))
+        else:
+            output.append(f'{{{{{token[0]}}}}}')
+    return ''.join(output)
 
-def generate_i18n(format, parts):
-    if not format:
-        return ''
 
-    format_string = format.get_content()
-
-    # grouped_parts에 각 part.field 별로 part.content를 그룹화합니다.
+def group_part_objects(parts):
     grouped_parts = defaultdict(list)
     for part in parts if type(parts) == list else parts.all():
         grouped_parts[part.field].append(part)
+    return grouped_parts
 
-    # placeholders를 찾아서 각 placeholder에 대한 초기 인덱스 값을 매핑합니다.
-    placeholders = re.findall(r'\{\{(\w+)\}\}', format_string)
-    placeholder_indices = 0
 
-    for placeholder in placeholders:
-        if placeholder in grouped_parts:
-            # 해당 placeholder에 대한 parts 리스트를 가져옵니다.
-            parts_for_placeholder = grouped_parts[placeholder]
+def group_part_contents(grouped_parts):
+    return {field: [part.get_content() for part in parts] for field, parts in grouped_parts.items()}
 
-            contents = []
-            for i, part in enumerate(parts_for_placeholder):
-                # 현재 인덱스 값을 사용합니다.
-                contents.append(f'<{placeholder_indices}>{part.get_content()}</{placeholder_indices}>')
-                # 다음 placeholder에 대한 인덱스를 업데이트합니다.
-                placeholder_indices += 1
 
-            joined_contents = join_contents(contents)
-            format_string = re.sub(f"{{{{{placeholder}}}}}", joined_contents, format_string, count=1)
+def render_i18n(tokens, grouped_parts, language=None, totals=None):
+    """
+    토큰 목록을 한 번 순회하면서 placeholder를 <n>content</n> 형식으로 치환합니다.
+    인덱스는 템플릿에 등장하는 순서대로 0부터 매겨지며, "N others" 요약에는 인덱스를 붙이지 않습니다.
+    """
+    engine = get_template_engine()
+    if not engine.is_plain(tokens):
+        tokens = engine.flatten(tokens, make_resolver(group_part_contents(grouped_parts), totals), language)
 
-    return format_string
+    output = []
+    index = 0
+    for token in tokens:
+        if type(token) is str:
+            output.append(token)
+            continue
 
+        placeholder = token[0]
+        parts_for_placeholder = grouped_parts.get(placeholder)
+        if not parts_for_placeholder:
+            # 연결된 part가 없는 placeholder는 그대로 남겨둡니다.
+            output.append(f'{{{{{placeholder}}}}}')
+            continue
 
-def generate_html(format, parts):
-    if not format:
-        return ''
+        contents = []
+        for part in parts_for_placeholder:
+            contents.append(f'<{index}>{part.get_content()}</{index}>')
+            index += 1
+        output.append(join_contents(contents, language, get_remaining(totals, placeholder, len(contents))))
 
-    format_string = format.get_content()
+    return ''.join(output)
 
-    grouped_parts = defaultdict(list)
 
-    for part in parts if type(parts) == list else parts.all():
-        link = part.link if hasattr(part, 'link') and part.link else '#'
-        html_link = f'<a href="{link}">{part.get_content()}</a>'
-        grouped_parts[part.field].append(html_link)
+@profile_stage('generate_i18n')
+def generate_i18n_batch(items):
+    """
+    (format, parts) 또는 (format, parts, totals) 의 목록을 받아 각 쌍의 i18n 문자열 목록을 반환합니다.
+    같은 템플릿은 한 번만 토큰화하며, part 내용은 정규식을 거치지 않으므로
+    백슬래시나 \\1 같은 문자열도 그대로 출력됩니다.
+    """
+    language = get_language()
+    results = []
+    for format, parts, *totals in items:
+        if not format:
+            results.append('')
+            continue
+
+        tokens = tokenize_content(format.get_content())
+        results.append(render_i18n(tokens, group_part_objects(parts), language, totals[0] if totals else None))
+    return results
+
+
+def generate_i18n(format, parts, totals=None):
+    return generate_i18n_batch([(format, parts, totals)])[0]
+
+
+class HtmlRenderer:
+    """
+    Format과 Part로 HTML을 생성합니다.
+
+    템플릿 문자열, part 내용, 링크는 모두 escape 되며, part별 <a> 조각은
+    (part id, 언어, updated_at) 키로 캐시되어 part가 수정되면 자동으로 새로 만들어집니다.
+    """
+    safe_link_schemes = ('http', 'https', 'mailto')
+    max_fragments = 10000
+
+    def __init__(self, max_fragments=None):
+        if max_fragments is not None:
+            self.max_fragments = max_fragments
+        self.fragments = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get_link(self, part):
+        link = getattr(part, 'link', None)
+        if not link:
+            return '#'
+        # javascript: 등 허용되지 않은 scheme의 링크는 사용하지 않습니다.
+        scheme = urlsplit(link).scheme
+        if scheme and scheme.lower() not in self.safe_link_schemes:
+            return '#'
+        return link
+
+    def build_fragment(self, part):
+        return format_html('<a href="{}">{}</a>', self.get_link(part), part.get_content())
+
+    def get_fragment(self, part, language):
+        part_id = getattr(part, 'id', None)
+        updated_at = getattr(part, 'updated_at', None)
+        if part_id is None or updated_at is None:
+            # 저장되지 않은 part는 캐시하지 않습니다.
+            return self.build_fragment(part)
+
+        key = (part_id, language, updated_at)
+        with self.lock:
+            fragment = self.fragments.get(key)
+            if fragment is not None:
+                self.fragments.move_to_end(key)
+                return fragment
+
+        fragment = self.build_fragment(part)
+        with self.lock:
+            self.fragments[key] = fragment
+            if len(self.fragments) > self.max_fragments:
+                self.fragments.popitem(last=False)
+        return fragment
+
+    def clear(self):
+        with self.lock:
+            self.fragments.clear()
+
+    @staticmethod
+    def join_fragments(fragments, language=None, remaining=0):
+        if remaining:
+            fragments = list(fragments) + [escape(get_template_engine().get_remaining_label(remaining, language))]
+        if len(fragments) > 1:
+            separator, last_separator = get_template_engine().get_list_joiners(language)
+            return escape(separator).join(fragments[:-1]) + escape(last_separator) + fragments[-1]
+        return fragments[0]
+
+    @profile_stage('generate_html')
+    def render(self, format, parts, totals=None):
+        if not format:
+            return ''
+
+        language = get_language()
+        grouped_fragments = defaultdict(list)
+        grouped_contents = defaultdict(list)
+        for part in parts if type(parts) == list else parts.all():
+            grouped_fragments[part.field].append(self.get_fragment(part, language))
+            grouped_contents[part.field].append(part.get_content())
+
+        output = []
+        for token in flatten_content(format.get_content(), grouped_contents, language, totals):
+            if type(token) is str:
+                output.append(escape(token))
+            elif token[0] in grouped_fragments:
+                fragments = grouped_fragments[token[0]]
+                output.append(self.join_fragments(fragments, language, get_remaining(totals, token[0], len(fragments))))
+            else:
+                output.append(escape(f'{{{{{token[0]}}}}}'))
+
+        return mark_safe(''.join(output))
+
+
+html_renderer = HtmlRenderer()
 
-    for field, html_links in grouped_parts.items():
-        joined_html_links = join_contents(html_links)
-        format_string = format_string.replace(f"{{{{{field}}}}}", joined_html_links)
 
-    return format_string
+def generate_html(format, parts, totals=None):
+    return html_renderer.render(format, parts, totals)
@@ -1,3 +1,6 @@
+# Django
+from django.http import Http404
+
 # DRF
 from rest_framework import mixins, filters
 from rest_framework.viewsets import GenericViewSet
@@ -7,17 +10,56 @@ from rest_framework import status
 
 # Third Party
 from django_filters.rest_framework import DjangoFilterBackend
-from drf_yasg.utils import swagger_auto_schema
-from drf_yasg import openapi
 
 # App
 from dynamic_contents import pagination
+from .bundles import build_format_bundle
+from .profiling import ProfilingMixin
+from .schema import lazy_swagger_auto_schema
 from .serializers import FormatSerializer, PartSerializer
-from .models import Format, Part, DynamicContent
+from .models import ArchivedDynamicContent, Format, Part, DynamicContent
 from .serializers import DynamicContentSerializerMixin
+from .settings import PART_LIMIT
+from .truncation import truncate_parts
+
+# Schemas
+def get_dynamic_content_schema():
+    from drf_yasg import openapi
+
+    return {
+        'manual_parameters': [
+            openapi.Parameter(
+                'parts', openapi.IN_QUERY,
+                description="Comma-separated list of part IDs",
+                type=openapi.TYPE_STRING
+            ),
+            openapi.Parameter(
+                'limit', openapi.IN_QUERY,
+                description="Maximum number of parts rendered per placeholder. The rest are summarized as \"and N others\".",
+                type=openapi.TYPE_INTEGER
+            )
+        ],
+        'responses': {200: openapi.Response('Dynamic content response')},
+    }
+
+
+def get_format_bundle_schema():
+    from drf_yasg import openapi
+
+    return {
+        'manual_parameters': [
+            openapi.Parameter(
+                'since', openapi.IN_QUERY,
+                description="Bundle version from a previous download. Only formats changed after it are returned.",
+                type=openapi.TYPE_STRING
+            )
+        ],
+        'responses': {200: openapi.Response('Format bundle response')},
+    }
+
 
 # Classes
-class BaseGenericViewSet(GenericViewSet):
+class BaseGenericViewSet(ProfilingMixin, GenericViewSet):
     filter_backends = [filters.OrderingFilter, filters.SearchFilter, DjangoFilterBackend]
     pagination_class = pagination.DefaultPagination
 
@@ -45,29 +87,53 @@ class PartViewSet(
     filterset_fields = ['instance_id']
 
 
-class DynamicContentView(APIView):
-    @swagger_auto_schema(
-        manual_parameters=[
-            openapi.Parameter(
-                'parts', openapi.IN_QUERY,
-                description="Comma-separated list of part IDs",
-                type=openapi.TYPE_STRING
-            )
-        ],
-        responses={200: openapi.Response('Dynamic content response')}
-    )
+class ArchiveFallbackMixin:
+    """
+    DynamicContentModelMixin 모델의 ViewSet에서 상세 조회한 행이 보관(archive)되어 있으면
+    ArchivedDynamicContent를 반환합니다. DynamicContentSerializerMixin이 보관 전과 같은 형태로 직렬화합니다.
+
+    보관된 행에는 원본의 다른 컬럼(예: 수신자)이 남지 않으므로, 행별 접근 권한이 필요하면
+    get_archive_queryset()이나 object permission에서 확인해야 합니다.
+    """
+
+    def get_archive_queryset(self):
+        return ArchivedDynamicContent.objects.filter(model_label=self.get_queryset().model._meta.label)
+
+    def get_object(self):
+        try:
+            return super().get_object()
+        except Http404:
+            if self.lookup_field not in ('pk', 'id'):
+                raise
+            lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+            archived = self.get_archive_queryset().filter(object_id=str(self.kwargs[lookup_url_kwarg])).first()
+            if archived is None:
+                raise
+            self.check_object_permissions(self.request, archived)
+            return archived
+
+
+class DynamicContentView(ProfilingMixin, APIView):
+    @lazy_swagger_auto_schema(get_dynamic_content_schema)
     def get(self, request, format_id):
         try:
-            format_instance = Format.objects.get(pk=format_id)
+            format_instance = Format.objects.for_render().get(pk=format_id)
             parts_ids = request.query_params.get('parts', '')
 
             # 쉼표로 분리하여 parts_ids를 리스트로 변환
             parts_ids_list = [int(pid) for pid in parts_ids.split(',') if pid.isdigit()]
 
-            parts_instances = Part.objects.filter(id__in=parts_ids_list)
+            parts_instances = Part.objects.for_render().filter(id__in=parts_ids_list)
+
+            # placeholder별 최대 part 수를 넘는 part는 개수만 셉니다.
+            limit = request.query_params.get('limit', '')
+            limit = int(limit) if limit.isdigit() and int(limit) > 0 else PART_LIMIT
+            part_totals = None
+            if limit:
+                parts_instances, part_totals = truncate_parts(parts_instances.iterator(), limit)
 
             # DynamicContent 인스턴스 생성
-            dynamic_content = DynamicContent(format_instance, parts_instances)
+            dynamic_content = DynamicContent(format_instance, parts_instances, part_totals)
 
             # DynamicContent 객체를 사용하여 최종 콘텐츠 생성
             response_data = DynamicContentSerializerMixin(dynamic_content).data
@@ -76,3 +142,14 @@ class DynamicContentView(APIView):
             return Response({"error": "Format not found"}, status=status.HTTP_404_NOT_FOUND)
         except ValueError as e:
             return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+
+class FormatBundleView(APIView):
+    @lazy_swagger_auto_schema(get_format_bundle_schema)
+    def get(self, request):
+        since = request.query_params.get('since') or None
+        try:
+            bundle = build_format_bundle(since=since)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(bundle)
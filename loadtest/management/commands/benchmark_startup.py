@@ -0,0 +1,92 @@
+# Python
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+# Django
+from django.core.management.base import BaseCommand, CommandError
+
+# Variables
+DEFAULT_MODULES = [
+    'dynamic_contents.models',
+    'dynamic_contents.serializers',
+    'dynamic_contents.views',
+    'dynamic_contents.urls',
+    'dynamic_contents.admin',
+    'dynamic_contents.gateway',
+]
+
+SCRIPT = """
+import json, sys, time
+started = time.perf_counter()
+import django
+django.setup()
+setup_done = time.perf_counter()
+timings = {}
+for name in sys.argv[1:]:
+    before = time.perf_counter()
+    __import__(name)
+    timings[name] = time.perf_counter() - before
+print(json.dumps({'setup': setup_done - started, 'modules': timings, 'total': time.perf_counter() - started}))
+"""
+
+
+def parse_importtime(stderr):
+    # "import time: self [us] | cumulative | imported package" 형식의 줄을 읽습니다.
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        rows.append((int(self_us), int(cumulative_us), name.strip()))
+    return rows
+
+
+class Command(BaseCommand):
+    help = 'Measure the import time of dynamic_contents modules in fresh Python processes.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('modules', nargs='*', help=f'Modules to import. Defaults to {", ".join(DEFAULT_MODULES)}.')
+        parser.add_argument('--runs', type=int, default=10)
+        parser.add_argument('--top', type=int, default=10, help='Show the N slowest modules by self time.')
+        parser.add_argument('--json', action='store_true', help='Print the raw results as JSON.')
+
+    def run_once(self, modules, importtime=False):
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.pathsep.join([path for path in sys.path if path] + [os.getcwd()])
+        command = [sys.executable] + (['-X', 'importtime'] if importtime else []) + ['-c', SCRIPT] + modules
+        result = subprocess.run(command, env=env, capture_output=True, text=True)
+        if result.returncode:
+            raise CommandError(result.stderr.strip().splitlines()[-1] if result.stderr else 'Benchmark process failed.')
+        return json.loads(result.stdout.strip().splitlines()[-1]), result.stderr
+
+    def handle(self, *args, **options):
+        modules = options['modules'] or DEFAULT_MODULES
+        runs = [self.run_once(modules)[0] for i in range(options['runs'])]
+
+        summary = {
+            'runs': len(runs),
+            'setup_ms': [run['setup'] * 1000 for run in runs],
+            'total_ms': [run['total'] * 1000 for run in runs],
+            'modules_ms': {name: [run['modules'][name] * 1000 for run in runs] for name in modules},
+        }
+
+        if options['json']:
+            self.stdout.write(json.dumps(summary))
+            return
+
+        def describe(values):
+            return f'median {statistics.median(values):8.1f} ms   min {min(values):8.1f} ms'
+
+        self.stdout.write(f"django.setup()                 {describe(summary['setup_ms'])}")
+        for name, values in summary['modules_ms'].items():
+            self.stdout.write(f'{name:30} {describe(values)}')
+        self.stdout.write(f"{'total':30} {describe(summary['total_ms'])}")
+
+        if options['top']:
+            rows = parse_importtime(self.run_once(modules, importtime=True)[1])
+            self.stdout.write(self.style.MIGRATE_HEADING(f"\nSlowest {options['top']} modules by self time (-X importtime)"))
+            for self_us, cumulative_us, name in sorted(rows, reverse=True)[:options['top']]:
+                self.stdout.write(f'{self_us / 1000:8.1f} ms  {cumulative_us / 1000:8.1f} ms cumulative  {name}')
@@ -0,0 +1,197 @@
+# Python
+import random
+import time
+
+# Django
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, router, transaction
+from django.utils import translation
+
+# App
+from dynamic_contents.audit import get_parts_through
+from dynamic_contents.models import Format, Part
+from dynamic_contents.settings import LANGUAGES, DEFAULT_LANGUAGE
+from loadtest.models import LoadTestContent
+
+# Variables
+FORMAT_TYPE = 'LOADTEST'
+
+# 언어별 템플릿. 같은 위치의 템플릿은 같은 placeholder를 사용하며, 없는 언어는 영어 문장을 사용합니다.
+TEMPLATES = {
+    'en': [
+        '{{actor}} liked your post {{object}}.',
+        '{{actor}} commented on {{object}}: {{comment}}',
+        '{{actor}} started following you.',
+        '{{actor}} mentioned you in {{object}}.',
+        '{{actor}} {{actor, plural, one {has} other {have}}} reacted to {{object}}.',
+        '{{actor}} invited you to {{target}} to see {{object}}.',
+    ],
+    'ko': [
+        '{{actor}}님이 회원님의 게시물 {{object}}을(를) 좋아합니다.',
+        '{{actor}}님이 {{object}}에 댓글을 남겼습니다: {{comment}}',
+        '{{actor}}님이 회원님을 팔로우하기 시작했습니다.',
+        '{{actor}}님이 {{object}}에서 회원님을 언급했습니다.',
+        '{{actor}}님이 {{object}}에 반응했습니다.',
+        '{{actor}}님이 {{object}}을(를) 보도록 회원님을 {{target}}에 초대했습니다.',
+    ],
+    'ja': [
+        '{{actor}}さんがあなたの投稿{{object}}にいいねしました。',
+        '{{actor}}さんが{{object}}にコメントしました: {{comment}}',
+        '{{actor}}さんがあなたをフォローしました。',
+        '{{actor}}さんが{{object}}であなたをメンションしました。',
+        '{{actor}}さんが{{object}}にリアクションしました。',
+        '{{actor}}さんが{{object}}を見るためにあなたを{{target}}に招待しました。',
+    ],
+    'es': [
+        'A {{actor}} le gustó tu publicación {{object}}.',
+        '{{actor}} comentó en {{object}}: {{comment}}',
+        '{{actor}} empezó a seguirte.',
+        '{{actor}} te mencionó en {{object}}.',
+        '{{actor}} {{actor, plural, one {reaccionó} other {reaccionaron}}} a {{object}}.',
+        '{{actor}} te invitó a {{target}} para ver {{object}}.',
+    ],
+}
+PLACEHOLDER_FIELDS = [
+    ['actor', 'object'],
+    ['actor', 'object', 'comment'],
+    ['actor'],
+    ['actor', 'object'],
+    ['actor', 'object'],
+    ['actor', 'target', 'object'],
+]
+FIRST_NAMES = ['Alice', 'Bob', 'Chloe', 'Daniel', 'Emma', 'Felix', 'Grace', 'Henry', 'Iris', 'Jack', '민준', '서연', '陽翔', 'Lucía']
+WORDS = ['python', 'release', 'weekend', 'trip', 'recipe', 'launch', 'update', 'photo', 'meetup', 'design', 'review', 'notes']
+
+
+def to_letters(number):
+    # Format.subtype 은 대문자와 _ 만 허용하므로 번호를 A, B, ..., Z, BA, BB ... 로 바꿉니다.
+    letters = ''
+    while True:
+        number, remainder = divmod(number, 26)
+        letters = chr(ord('A') + remainder) + letters
+        if not number:
+            return letters
+
+
+def get_language_codes():
+    return [code for code, name in LANGUAGES or []] or [DEFAULT_LANGUAGE or 'en']
+
+
+def get_content_field(language):
+    return f"content_{language.replace('-', '_')}"
+
+
+class Command(BaseCommand):
+    help = (
+        'Generate synthetic Formats, Parts and LoadTestContents for load testing. '
+        'Part counts per placeholder follow a Pareto distribution, so a few contents aggregate thousands of parts.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--formats', type=int, default=2000)
+        parser.add_argument('--contents', type=int, default=200000)
+        parser.add_argument('--recipients', type=int, default=10000)
+        parser.add_argument('--alpha', type=float, default=1.2, help='Pareto shape of the actor part count. Lower means a longer tail.')
+        parser.add_argument('--max-parts', type=int, default=5000, help='Maximum number of parts per placeholder.')
+        parser.add_argument('--batch-size', type=int, default=1000, help='Number of contents written per transaction.')
+        parser.add_argument('--seed', type=int, default=None)
+        parser.add_argument('--clear', action='store_true', help='Delete previously generated data first.')
+
+    def handle(self, *args, **options):
+        database = router.db_for_write(LoadTestContent)
+        if not connections[database].features.can_return_rows_from_bulk_insert:
+            raise CommandError(f'Database "{database}" cannot return ids from bulk inserts.')
+
+        self.random = random.Random(options['seed'])
+        self.alpha = options['alpha']
+        self.max_parts = options['max_parts']
+        self.languages = get_language_codes()
+
+        if options['clear']:
+            self.clear()
+
+        started_at = time.perf_counter()
+        formats = self.create_formats(options['formats'])
+        self.stdout.write(f'Created {len(formats)} formats in {len(self.languages)} languages.')
+
+        through, source, target = get_parts_through(LoadTestContent)
+        total_contents = total_parts = 0
+        while total_contents < options['contents']:
+            size = min(options['batch_size'], options['contents'] - total_contents)
+            with transaction.atomic(using=database):
+                total_parts += self.create_batch(formats, size, options['recipients'], through, source, target)
+            total_contents += size
+            self.stdout.write(f'{total_contents} contents, {total_parts} parts', ending='\r')
+            self.stdout.flush()
+
+        self.stdout.write(self.style.SUCCESS(
+            f'\nCreated {total_contents} contents and {total_parts} parts in {time.perf_counter() - started_at:.1f}s.'
+        ))
+
+    def clear(self):
+        # DynamicContentQuerySet.delete()가 고아가 된 Part도 함께 삭제합니다.
+        deleted = LoadTestContent.objects.all().delete()
+        Format.objects.filter(type=FORMAT_TYPE).delete()
+        self.stdout.write(f'Deleted previously generated data: {deleted}')
+
+    def create_formats(self, count):
+        formats = []
+        with translation.override(DEFAULT_LANGUAGE or self.languages[0]):
+            for index in range(count):
+                template = index % len(PLACEHOLDER_FIELDS)
+                format = Format(type=FORMAT_TYPE, subtype=to_letters(index))
+                # 템플릿 캐시가 실제보다 잘 맞지 않도록 Format마다 다른 꼬리말을 붙입니다.
+                suffix = f' · {to_letters(index).title()}'
+                for language in self.languages:
+                    templates = TEMPLATES.get(language) or TEMPLATES.get(language.split('-')[0])
+                    content = templates[template] if templates else f'[{language}] {TEMPLATES["en"][template]}'
+                    setattr(format, get_content_field(language), content + suffix)
+                format.normalize()
+                formats.append(format)
+            Format.objects.bulk_create(formats, batch_size=500)
+        return [(format, PLACEHOLDER_FIELDS[index % len(PLACEHOLDER_FIELDS)]) for index, format in enumerate(formats)]
+
+    def get_part_count(self, field):
+        # 대부분의 알림은 actor가 1~3명이고, 일부는 수천 명이 묶인 집계 알림입니다.
+        if field != 'actor':
+            return 1
+        return min(int(self.random.paretovariate(self.alpha)), self.max_parts)
+
+    def build_part(self, field, number):
+        if field == 'actor':
+            content = f'{self.random.choice(FIRST_NAMES)} {to_letters(number).title()}'
+            link = f'https://example.com/users/{number}'
+        elif field == 'comment':
+            content = ' '.join(self.random.choices(WORDS, k=self.random.randint(3, 12)))
+            link = None
+        else:
+            content = ' '.join(self.random.choices(WORDS, k=self.random.randint(1, 4))).title()
+            link = f'https://example.com/{field}s/{number}'
+        language = DEFAULT_LANGUAGE or self.languages[0]
+        return Part(field=field, link=link, instance_id=str(number), **{get_content_field(language): content})
+
+    def create_batch(self, formats, size, recipients, through, source, target):
+        contents = []
+        for i in range(size):
+            format, fields = self.random.choice(formats)
+            contents.append((LoadTestContent(
+                format=format,
+                recipient_id=self.random.randint(1, recipients),
+                missing_placeholders='[]',
+            ), fields))
+        LoadTestContent.objects.bulk_create([content for content, fields in contents])
+
+        parts = []
+        owners = []
+        for content, fields in contents:
+            for field in fields:
+                for i in range(self.get_part_count(field)):
+                    parts.append(self.build_part(field, self.random.randint(1, 10 ** 7)))
+                    owners.append(content.pk)
+        Part.objects.bulk_create(parts, batch_size=5000)
+
+        through.objects.bulk_create(
+            [through(**{f'{source}_id': owner, f'{target}_id': part.pk}) for owner, part in zip(owners, parts)],
+            batch_size=5000,
+        )
+        return len(parts)
@@ -0,0 +1,211 @@
+# Python
+import itertools
+import json
+import random
+import statistics
+import threading
+import time
+from collections import defaultdict
+from urllib.error import HTTPError
+from urllib.parse import urlencode
+from urllib.request import Request, urlopen
+
+# Django
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.models import Max, Min
+from django.test import Client
+from django.urls import NoReverseMatch, reverse
+
+# App
+from dynamic_contents import urls as dynamic_contents_urls
+from dynamic_contents.models import Format, Part
+from dynamic_contents.pagination import DefaultPagination
+from loadtest.models import LoadTestContent
+
+# Variables
+SAMPLE_SIZE = 1000
+# 응답을 받지 못한 요청에 기록할 상태 코드입니다.
+CONNECTION_ERROR_STATUS = 599
+
+
+def percentile(values, percent):
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method='inclusive')[percent - 1]
+
+
+def sample_pks(queryset, size):
+    """
+    전체를 정렬하지 않고 pk 범위에서 무작위 위치의 행을 골라 최대 size개의 pk를 반환합니다.
+    """
+    bounds = queryset.aggregate(low=Min('pk'), high=Max('pk'))
+    if bounds['low'] is None:
+        return []
+
+    pks = set()
+    for i in range(size * 2):
+        pk = queryset.filter(pk__gte=random.randint(bounds['low'], bounds['high'])).order_by('pk').values_list('pk', flat=True).first()
+        if pk is not None:
+            pks.add(pk)
+        if len(pks) >= size:
+            break
+    return list(pks)
+
+
+def get_url_names():
+    # dynamic_contents/urls.py 에 등록된 URL 중 이름이 있는 것만 사용합니다. (format suffix 패턴은 같은 이름을 가집니다.)
+    names = [pattern.name for pattern in dynamic_contents_urls.urlpatterns if getattr(pattern, 'name', None)]
+    return list(dict.fromkeys(names))
+
+
+class Command(BaseCommand):
+    help = (
+        'Send requests to the dynamic_contents URLs at a fixed concurrency and report p50/p95/p99 latency and throughput. '
+        'Without --base-url requests run in-process through the Django test client.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('url_names', nargs='*', help=f'URL names to request. Defaults to all of {", ".join(get_url_names())}.')
+        parser.add_argument('--requests', type=int, default=1000, help='Total number of requests.')
+        parser.add_argument('--concurrency', type=int, default=10)
+        parser.add_argument('--base-url', default=None, help='Send HTTP requests to a running server, e.g. http://localhost:8000')
+        parser.add_argument('--host', default='localhost', help='Host header for in-process requests.')
+        parser.add_argument('--language', default=None, help='Accept-Language header.')
+        parser.add_argument('--max-url-parts', type=int, default=500, help='Maximum part ids in a dynamic-content URL.')
+        parser.add_argument('--json', action='store_true', help='Print the raw results as JSON.')
+
+    def handle(self, *args, **options):
+        url_names = options['url_names'] or get_url_names()
+        self.max_url_parts = options['max_url_parts']
+        self.samples = {
+            'format': sample_pks(Format.objects.all(), SAMPLE_SIZE),
+            'part': sample_pks(Part.objects.all(), SAMPLE_SIZE),
+            'content': sample_pks(LoadTestContent.objects.all(), SAMPLE_SIZE),
+        }
+        self.pages = {
+            'format-list': self.count_pages(Format.objects.count()),
+            'part-list': self.count_pages(Part.objects.count()),
+        }
+        if not self.samples['format'] or not self.samples['content']:
+            raise CommandError('No data to test. Run "python manage.py generate_synthetic_data" first.')
+
+        # 요청 경로는 측정 전에 미리 만들어 두어 DB 조회가 측정에 섞이지 않게 합니다.
+        targets = [(name, self.build_path(name)) for name in itertools.islice(itertools.cycle(url_names), options['requests'])]
+        random.shuffle(targets)
+        headers = {'Accept-Language': options['language']} if options['language'] else {}
+
+        results = defaultdict(list)
+        errors = defaultdict(int)
+        lock = threading.Lock()
+        queue = iter(targets)
+
+        def worker():
+            # view 예외는 다시 발생시키지 않고 500 응답으로 받습니다.
+            client = None if options['base_url'] else Client(raise_request_exception=False, SERVER_NAME=options['host'])
+            try:
+                while True:
+                    with lock:
+                        target = next(queue, None)
+                    if target is None:
+                        return
+                    name, path = target
+                    started_at = time.perf_counter()
+                    try:
+                        status = self.send(client, options['base_url'], path, headers)
+                    except Exception:
+                        # 연결 실패나 timeout도 오류로 집계하고, thread는 다음 요청을 계속 보냅니다.
+                        status = CONNECTION_ERROR_STATUS
+                    elapsed = time.perf_counter() - started_at
+                    with lock:
+                        results[name].append(elapsed)
+                        if status >= 400:
+                            errors[name] += 1
+            finally:
+                connection.close()
+
+        started_at = time.perf_counter()
+        threads = [threading.Thread(target=worker) for i in range(options['concurrency'])]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        wall_time = time.perf_counter() - started_at
+
+        summary = self.summarize(results, errors, wall_time, options['concurrency'])
+        if options['json']:
+            self.stdout.write(json.dumps(summary))
+        else:
+            self.print_summary(summary)
+
+    @staticmethod
+    def count_pages(count):
+        # 앞쪽 페이지를 주로 조회하는 실제 트래픽처럼 최대 10페이지까지만 사용합니다.
+        return max(min(-(-count // DefaultPagination.page_size), 10), 1)
+
+    def build_path(self, name):
+        query = {}
+        if name == 'format-detail':
+            kwargs = {'pk': random.choice(self.samples['format'])}
+        elif name == 'part-detail':
+            kwargs = {'pk': random.choice(self.samples['part'])}
+        elif name == 'dynamic-content':
+            content = LoadTestContent.objects.get(pk=random.choice(self.samples['content']))
+            part_ids = content.parts.values_list('pk', flat=True)[:self.max_url_parts]
+            kwargs = {'format_id': content.format_id}
+            query['parts'] = ','.join(str(pk) for pk in part_ids)
+        elif name in self.pages:
+            kwargs = {}
+            query['page'] = random.randint(1, self.pages[name])
+        else:
+            kwargs = {}
+
+        try:
+            path = reverse(name, kwargs=kwargs)
+        except NoReverseMatch:
+            raise CommandError(f'Unknown URL name: {name}')
+        return f'{path}?{urlencode(query)}' if query else path
+
+    def send(self, client, base_url, path, headers):
+        if client is not None:
+            return client.get(path, **{f"HTTP_{key.upper().replace('-', '_')}": value for key, value in headers.items()}).status_code
+
+        try:
+            with urlopen(Request(base_url.rstrip('/') + path, headers=headers), timeout=60) as response:
+                response.read()
+                return response.status
+        except HTTPError as e:
+            return e.code
+
+    def summarize(self, results, errors, wall_time, concurrency):
+        def describe(values, error_count):
+            return {
+                'requests': len(values),
+                'errors': error_count,
+                'p50_ms': percentile(values, 50) * 1000,
+                'p95_ms': percentile(values, 95) * 1000,
+                'p99_ms': percentile(values, 99) * 1000,
+                'max_ms': max(values) * 1000,
+            }
+
+        all_values = [value for values in results.values() for value in values]
+        return {
+            'concurrency': concurrency,
+            'wall_time_s': wall_time,
+            'throughput_rps': len(all_values) / wall_time if wall_time else 0,
+            'total': describe(all_values, sum(errors.values())),
+            'urls': {name: describe(values, errors[name]) for name, values in sorted(results.items())},
+        }
+
+    def print_summary(self, summary):
+        self.stdout.write(f"{'url':20} {'requests':>8} {'errors':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+        rows = list(summary['urls'].items()) + [('total', summary['total'])]
+        for name, row in rows:
+            self.stdout.write(
+                f"{name:20} {row['requests']:8} {row['errors']:6} "
+                f"{row['p50_ms']:9.1f} {row['p95_ms']:9.1f} {row['p99_ms']:9.1f} {row['max_ms']:9.1f}"
+            )
+        self.stdout.write(self.style.SUCCESS(
+            f"\n{summary['total']['requests']} requests in {summary['wall_time_s']:.2f}s "
+            f"({summary['throughput_rps']:.1f} req/s, concurrency {summary['concurrency']})"
+        ))
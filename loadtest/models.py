@@ -0,0 +1,26 @@
+# Django
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+# App
+from dynamic_contents.models import DynamicContentManagerMixin, DynamicContentModelMixin, DynamicContentQuerySet
+
+
+class LoadTestContentManager(DynamicContentManagerMixin, models.Manager.from_queryset(DynamicContentQuerySet)):
+    pass
+
+
+class LoadTestContent(DynamicContentModelMixin):
+    """
+    부하 테스트용 알림 모델입니다. generate_synthetic_data 명령으로 채웁니다.
+    """
+    # create_dynamic_content()는 format만 넘겨 생성하므로 수신자가 없으면 0을 사용합니다.
+    recipient_id = models.PositiveIntegerField(_('Recipient ID'), default=0, db_index=True)
+    created_at = models.DateTimeField(_('Created At'), auto_now_add=True, db_index=True)
+
+    objects = LoadTestContentManager()
+
+    class Meta:
+        verbose_name = 'load test content'
+        verbose_name_plural = 'load test contents'
+        ordering = ['-created_at']